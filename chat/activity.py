@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.db.models import BigIntegerField, Case, DateTimeField, F, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+from common.writebehind import WriteBehindBuffer
+from .models import ChatRoom
+
+
+class RoomActivity(WriteBehindBuffer):
+    """
+    채팅방 updated_at(최근 활동 시각)/last_message write-behind 버퍼
+    메시지마다 방을 갱신하지 않고 방별 최신 시각과 마지막 메시지만 모아 두었다가 CHAT_ACTIVITY_FLUSH_INTERVAL 초마다
+    UPDATE 한 번으로 반영한다 (간격, 재시도, 종료 시 반영은 common.writebehind).
+    """
+    name = 'room activity'
+
+    @property
+    def interval(self):
+        return getattr(settings, 'CHAT_ACTIVITY_FLUSH_INTERVAL', 1.0)
+
+    def touch(self, room_id, when, message_id):
+        """
+        room_id 방에 when 시각의 메시지(message_id)가 있었음을 기록
+        """
+        with self._lock:
+            self.merge(self._pending, {int(room_id): (when, message_id)})
+        self.recorded()
+
+    def merge(self, pending, batch):
+        # 방마다 가장 최근 시각과 가장 큰 메시지 id 만 남긴다
+        for room_id, (when, message_id) in batch.items():
+            current = pending.get(room_id)
+            if current is not None:
+                when, message_id = max(when, current[0]), max(message_id, current[1])
+            pending[room_id] = (when, message_id)
+
+    def write(self, batch):
+        """
+        모인 활동 시각을 반영 (다른 프로세스가 더 늦은 시각을 써 두었으면 유지)
+        """
+        latest = Case(
+            *[When(id=room_id, then=Value(when)) for room_id, (when, _) in batch.items()],
+            output_field=DateTimeField(),
+        )
+        last_message = Case(
+            *[When(id=room_id, then=Value(message_id)) for room_id, (_, message_id) in batch.items()],
+            output_field=BigIntegerField(),
+        )
+        ChatRoom.objects.filter(id__in=batch).update(
+            updated_at=Greatest(F('updated_at'), latest),
+            # SQLite 의 MAX(NULL, x) 는 NULL 이므로 아직 메시지가 없던 방은 0 과 비교
+            last_message_id=Greatest(Coalesce(F('last_message_id'), 0), last_message),
+        )
+
+
+room_activity = RoomActivity()
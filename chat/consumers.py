@@ -1,61 +1,330 @@
+import asyncio
 import json
+import uuid
+from urllib.parse import parse_qs
 from channels.generic.websocket import AsyncWebsocketConsumer
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db.models import Q
+from django.utils import timezone
 from asgiref.sync import sync_to_async
+from common.metrics import Counter, WEBSOCKET_ACTIVE, WEBSOCKET_CONNECTIONS, WEBSOCKET_MESSAGES
+from .history import recent_delta, recent_history, serialize_message
 from .models import ChatRoom, Message
+from .persistence import message_queue
+from .throttle import TokenBucket, user_buckets
+
+CHAT_RESYNC = Counter(
+    'chat_resync_total', 'Chat connects by history sent: full (no cursor), delta, or full_reload.', ('outcome',))
+CHAT_THROTTLED = Counter(
+    'chat_throttled_frames_total', 'Chat frames rejected by the per-connection or per-user rate limit.', ('scope',))
+CHAT_DROPPED = Counter(
+    'chat_dropped_frames_total', 'Chat frames dropped: too_large or invalid input, slow_consumer output.', ('reason',))
+
+
+def user_group(user_id):
+    # 사용자별 알림 그룹 (NotificationConsumer)
+    return f"user_{user_id}"
+
 
 class ChatConsumer(AsyncWebsocketConsumer):
+    """
+    채팅방 연결 (ws/chat/<room id>/)
+    받는 프레임은 크기(CHAT_MAX_FRAME_SIZE)와 연결별/사용자별 토큰 버킷으로 제한하고,
+    보내는 프레임은 연결별 큐를 거친다. daphne 처럼 ASGI send 가 기다리지 않고 전송 버퍼에 쌓는 서버에서도
+    느린 클라이언트를 알 수 있도록, 클라이언트가 {"command": "ack", "received": <받은 프레임 수>} 로 알린 수와
+    보낸 프레임 수의 차이(아직 읽지 않은 프레임)가 CHAT_SEND_WINDOW 를 넘으면 끊는다
+    (재접속하면 last_id 이후 밀린 메시지를 받는다).
+    """
+    connected = False  # accept() 이후 True (활성 연결 게이지용)
+    throttled = False  # 제한에 걸려 버린 프레임이 이어지는 동안 True (오류 알림은 한 번만)
+    _send_queue = None
+    _writer = None
+    _sent = 0  # accept() 이후 보낸(큐에 넣은) 프레임 수
+    _acked = 0  # 클라이언트가 받았다고 알린 프레임 수
+
     async def connect(self):
         self.room_id = self.scope["url_route"]["kwargs"]["room_id"]
         self.room_group_name = f"chat_{self.room_id}"
 
         user = self.scope["user"]
         if user is None or isinstance(user, AnonymousUser):
+            WEBSOCKET_CONNECTIONS.inc(consumer='chat', outcome='rejected')
             await self.close()
             return
+        # 방 참여자만 접속 가능
+        self.partner_id = await self._get_partner_id()
+        if self.partner_id is None:
+            WEBSOCKET_CONNECTIONS.inc(consumer='chat', outcome='rejected')
+            await self.close(code=4403)
+            return
 
         await self.channel_layer.group_add(self.room_group_name, self.channel_name)
         await self.accept()
-        history = await self._get_history(limit=30)  # 오래된 순
+        self.connected = True
+        WEBSOCKET_CONNECTIONS.inc(consumer='chat', outcome='accepted')
+        WEBSOCKET_ACTIVE.inc(consumer='chat')
+        self.bucket = TokenBucket(settings.CHAT_CONNECTION_RATE, settings.CHAT_CONNECTION_BURST)
+        self._send_queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._write_frames(self._send_queue))
+        # 재접속: 클라이언트가 가진 마지막 메시지(?last_id=) 이후만 보낸다
+        last_id = self._last_seen_id()
+        if last_id is not None:
+            delta = await self._get_delta(last_id)
+            if delta is not None:
+                CHAT_RESYNC.inc(outcome='delta')
+                await self.send(text_data=json.dumps({
+                    "type": "chat_delta",
+                    "last_id": last_id,
+                    "messages": delta,
+                }))
+                return
+
+        CHAT_RESYNC.inc(outcome='full' if last_id is None else 'full_reload')
+        history, has_more = await self._get_history(limit=settings.CHAT_HISTORY_PAGE_SIZE)  # 오래된 순
         await self.send(text_data=json.dumps({
             "type": "chat_history",
             "messages": history,
+            "has_more": has_more,
+            "full_reload": last_id is not None,  # 클라이언트 캐시를 버리고 새로 그린다
         }))
 
+    def _last_seen_id(self):
+        query = parse_qs(self.scope.get("query_string", b"").decode())
+        try:
+            return int(query["last_id"][0])
+        except (KeyError, ValueError):
+            return None
+
     async def disconnect(self, code):
+        if not self.connected:
+            return
+        WEBSOCKET_ACTIVE.dec(consumer='chat')
+        self._stop_writer()
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
 
-    async def receive(self, text_data):
-        data = json.loads(text_data)
-        msg = await self._save_message(data["message"])
+    async def send(self, text_data=None, bytes_data=None, close=False):
+        """
+        accept() 이후에는 연결별 큐에 넣고 _write_frames 가 순서대로 보낸다
+        """
+        if self._send_queue is None:
+            if self._writer is None:  # accept() 이전
+                await super().send(text_data, bytes_data, close)
+            return  # 느린 클라이언트로 끊는 중
+        if self._sent - self._acked >= settings.CHAT_SEND_WINDOW:
+            CHAT_DROPPED.inc(self._send_queue.qsize() + 1, reason='slow_consumer')
+            self._stop_writer()
+            await self.close(code=1013)  # Try Again Later
+            return
+        self._sent += 1
+        self._send_queue.put_nowait((text_data, bytes_data, close))
+
+    def _ack(self, data):
+        try:
+            received = int(data["received"])
+        except (KeyError, TypeError, ValueError):
+            return
+        self._acked = max(self._acked, min(received, self._sent))
+
+    async def _write_frames(self, queue):
+        while True:
+            text_data, bytes_data, close = await queue.get()
+            await super().send(text_data, bytes_data, close)
+
+    def _stop_writer(self):
+        self._send_queue = None
+        if self._writer is not None:
+            self._writer.cancel()
+
+    def _allow(self):
+        """
+        연결별, 사용자별 토큰 버킷에서 하나씩 쓴다 (걸린 쪽을 반환, 통과하면 None)
+        """
+        if not self.bucket.take():
+            return 'connection'
+        if not user_buckets.take(self.scope["user"].id, settings.CHAT_USER_RATE, settings.CHAT_USER_BURST):
+            return 'user'
+        return None
+
+    async def _reject(self, reason, error):
+        CHAT_DROPPED.inc(reason=reason)
+        await self.send(text_data=json.dumps({"type": "error", "error": error}))
+
+    async def receive(self, text_data=None, bytes_data=None):
+        WEBSOCKET_MESSAGES.inc(consumer='chat', direction='received')
+        if text_data is None:
+            await self._reject('invalid', 'text frames only')
+            return
+        if len(text_data) > settings.CHAT_MAX_FRAME_SIZE:
+            # 파싱하지 않고 끊는다 (1009: Message Too Big)
+            CHAT_DROPPED.inc(reason='too_large')
+            self._stop_writer()
+            await self.close(code=1009)
+            return
+
+        try:
+            data = json.loads(text_data)
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and data.get("command") == "ack":
+            # 받은 프레임 수 알림은 보낸 프레임 수에 비례하므로 토큰을 쓰지 않는다
+            self._ack(data)
+            return
+
+        scope = self._allow()
+        if scope is not None:
+            CHAT_THROTTLED.inc(scope=scope)
+            if not self.throttled:
+                self.throttled = True
+                await self.send(text_data=json.dumps({"type": "error", "error": "rate limited"}))
+            return
+        self.throttled = False
+
+        if not isinstance(data, dict):
+            await self._reject('invalid', 'invalid frame')
+            return
+        if data.get("command") == "load_history":
+            await self._load_history(data)
+            return
+        if data.get("command") == "mark_read":
+            # {"command": "mark_read", "last_id": <화면에 표시한 마지막 메시지 id>}
+            try:
+                last_id = int(data["last_id"])
+            except (KeyError, TypeError, ValueError):
+                await self.send(text_data=json.dumps({"type": "error", "error": "invalid mark_read request"}))
+                return
+            unread_total = await self._mark_read(last_id)
+            # 내 다른 탭/알림 배지 갱신
+            await self.channel_layer.group_send(
+                user_group(self.scope["user"].id), {"type": "unread_count", "total": unread_total})
+            return
+        text = data.get("message")
+        if not isinstance(text, str) or not text.strip():
+            await self._reject('invalid', 'invalid message')
+            return
+        if len(text) > settings.CHAT_MAX_MESSAGE_LENGTH:
+            await self._reject('too_large', 'message too long')
+            return
+        msg = Message(
+            room_id=int(self.room_id),
+            sender=self.scope["user"],
+            text=text,
+            client_id=self._client_id(data),
+            sent_at=timezone.now(),
+        )
+        # 저장을 기다리지 않고 먼저 브로드캐스트 (id 는 저장 후 chat_persisted 로, 상대 알림은 저장 후 큐에서 보낸다)
         await self.channel_layer.group_send(
             self.room_group_name,
-            {"type": "chat_message", "id": msg.id, "sender": msg.sender.username, "text": msg.text, "sent_at": msg.sent_at.isoformat()},
+            {"type": "chat_message", **serialize_message(msg)},
         )
+        await message_queue.put(msg)
+
+    @staticmethod
+    def _client_id(data):
+        try:
+            return uuid.UUID(str(data["client_id"]))
+        except (KeyError, ValueError):
+            return uuid.uuid4()
+
+    async def _load_history(self, data):
+        """
+        {"command": "load_history", "before_id": <가장 오래된 메시지 id>, "limit": <개수>}
+        before_id 이전 페이지를 chat_history_page 로 보낸다.
+        """
+        try:
+            before_id = int(data["before_id"])
+            limit = int(data.get("limit") or settings.CHAT_HISTORY_PAGE_SIZE)
+        except (KeyError, TypeError, ValueError):
+            await self.send(text_data=json.dumps({"type": "error", "error": "invalid load_history request"}))
+            return
+        limit = max(1, min(limit, settings.CHAT_HISTORY_MAX_PAGE_SIZE))
+        messages, has_more = await self._get_history(before_id=before_id, limit=limit)
+        await self.send(text_data=json.dumps({
+            "type": "chat_history_page",
+            "before_id": before_id,
+            "messages": messages,
+            "has_more": has_more,
+        }))
 
     async def chat_message(self, event):
+        WEBSOCKET_MESSAGES.inc(consumer='chat', direction='sent')
+        await self.send(text_data=json.dumps(event))
+
+    async def chat_persisted(self, event):
+        # {"ids": {client_id: message id}}: 클라이언트가 임시 메시지에 실제 id 를 채운다
         await self.send(text_data=json.dumps(event))
 
     @sync_to_async
-    def _save_message(self, text):
-        from .models import ChatRoom
-        msg = Message.objects.create(
-            room_id=self.room_id,
-            sender=self.scope["user"],
-            text=text,
-        )
-        # updated_at 갱신
-        ChatRoom.objects.filter(id=self.room_id).update(updated_at=msg.sent_at)
-        return msg
+    def _get_partner_id(self):
+        user = self.scope["user"]
+        room = (ChatRoom.objects
+                .filter(Q(user1=user) | Q(user2=user), id=self.room_id)
+                .values("user1_id", "user2_id")
+                .first())
+        if room is None:
+            return None
+        return room["user2_id"] if room["user1_id"] == user.id else room["user1_id"]
 
     @sync_to_async
-    def _get_history(self, limit=30):
-        qs = (Message.objects
-              .filter(room_id=self.room_id)
-              .select_related("sender")
-              .order_by("-sent_at")[:limit][::-1])  # 오래된 것부터
-        return [
-            {"id": m.id, "sender": m.sender.username, "text": m.text,
-             "sent_at": m.sent_at.isoformat()}
-            for m in qs
-        ]
\ No newline at end of file
+    def _mark_read(self, last_id):
+        ChatRoom.mark_read(self.room_id, self.scope["user"], last_id)
+        return ChatRoom.unread_total(self.scope["user"])
+
+    @sync_to_async
+    def _get_delta(self, last_id):
+        return recent_delta(self.room_id, last_id, limit=settings.CHAT_RESYNC_MAX_DELTA)
+
+    @sync_to_async
+    def _get_history(self, before_id=None, limit=30):
+        if before_id is None:
+            # 최근 메시지는 링 버퍼(chat.history)에서, 콜드일 때만 DB
+            return recent_history(self.room_id, limit)
+        qs, has_more = Message.history_page(self.room_id, before_id=before_id, limit=limit)  # 오래된 것부터
+        return [serialize_message(m) for m in qs], has_more
+
+
+class NotificationConsumer(AsyncWebsocketConsumer):
+    """
+    사용자별 알림 채널 (ws/notifications/)
+    접속 시 최근 대화방과 안 읽은 메시지 수를 보내고, 이후 다른 방의 새 메시지(chat_notification)와
+    안 읽은 수 변경(unread_count)을 전달한다. 위젯은 /chat/latest/ 를 조회하는 대신 이 연결 하나를 유지한다.
+    """
+    connected = False
+
+    async def connect(self):
+        user = self.scope["user"]
+        if user is None or isinstance(user, AnonymousUser):
+            WEBSOCKET_CONNECTIONS.inc(consumer='notifications', outcome='rejected')
+            await self.close()
+            return
+
+        self.group_name = user_group(user.id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+        self.connected = True
+        WEBSOCKET_CONNECTIONS.inc(consumer='notifications', outcome='accepted')
+        WEBSOCKET_ACTIVE.inc(consumer='notifications')
+        await self.send(text_data=json.dumps({"type": "inbox_state", **await self._get_state()}))
+
+    async def disconnect(self, code):
+        if not self.connected:
+            return
+        WEBSOCKET_ACTIVE.dec(consumer='notifications')
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def chat_notification(self, event):
+        WEBSOCKET_MESSAGES.inc(consumer='notifications', direction='sent')
+        await self.send(text_data=json.dumps(event))
+
+    async def unread_count(self, event):
+        WEBSOCKET_MESSAGES.inc(consumer='notifications', direction='sent')
+        await self.send(text_data=json.dumps(event))
+
+    @sync_to_async
+    def _get_state(self):
+        user = self.scope["user"]
+        room = ChatRoom.inbox(user).first()
+        latest = None
+        if room is not None:
+            latest = {"room_id": room.id, "partner": room.partner_of(user).username}
+        return {"latest": latest, "unread_total": ChatRoom.unread_total(user)}
@@ -0,0 +1,243 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .models import Message
+
+logger = logging.getLogger(__name__)
+
+
+def serialize_message(m):
+    return {"id": m.id, "client_id": str(m.client_id) if m.client_id else None,
+            "sender": m.sender.username, "text": m.text, "sent_at": m.sent_at.isoformat()}
+
+
+class RedisRecentMessages:
+    """
+    방별 최근 메시지 링 버퍼 (Redis 리스트 chat:recent:<room id>, 대체로 오래된 순)
+    리스트가 있으면 방의 최근 CHAT_RECENT_MESSAGES 개(그보다 적으면 전부)를 담고 있다.
+    없으면(콜드) 접속 시 DB 에서 한 번 채우고, 새 메시지는 리스트가 있을 때만 덧붙인다.
+    여러 프로세스가 덧붙이므로 리스트 순서는 id 순서와 다를 수 있다 (읽을 때 id 로 정렬).
+    덧붙이기/무효화는 리스트가 없어도 세대(chat:recent:<room id>:gen)를 올리고, 채우기는 DB 를 읽기 전의 세대와
+    같을 때만 쓴다 → DB 를 읽는 사이 저장된 메시지가 빠진 목록으로 채우지 않는다.
+    """
+
+    def __init__(self, url):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.errors = (redis.RedisError,)
+
+    @staticmethod
+    def key(room_id):
+        return f"chat:recent:{room_id}"
+
+    @staticmethod
+    def generation_key(room_id):
+        return f"chat:recent:{room_id}:gen"
+
+    def generation(self, room_id):
+        return int(self.client.get(self.generation_key(room_id)) or 0)
+
+    def get(self, room_id):
+        key = self.key(room_id)
+        with self.client.pipeline() as pipe:
+            pipe.exists(key)
+            pipe.lrange(key, 0, -1)
+            exists, items = pipe.execute()
+        if not exists:
+            return None
+        return [json.loads(item) for item in items]
+
+    def fill(self, room_id, messages, generation):
+        # generation 이후 덧붙인 메시지가 있거나 그 사이 다른 프로세스가 채웠으면 건드리지 않는다
+        import redis
+
+        key = self.key(room_id)
+        generation_key = self.generation_key(room_id)
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(key, generation_key)
+                if pipe.exists(key) or int(pipe.get(generation_key) or 0) != generation:
+                    return
+                pipe.multi()
+                if messages:
+                    pipe.rpush(key, *[json.dumps(m) for m in messages])
+                else:
+                    # 빈 방도 "채워짐" 으로 표시 (빈 리스트는 Redis 에 저장되지 않으므로 표식 하나)
+                    pipe.rpush(key, json.dumps(None))
+                pipe.ltrim(key, -settings.CHAT_RECENT_MESSAGES, -1)
+                pipe.expire(key, settings.CHAT_RECENT_MESSAGES_TTL)
+                pipe.execute()
+            except redis.WatchError:
+                pass
+
+    def append(self, room_id, messages):
+        key = self.key(room_id)
+        with self.client.pipeline() as pipe:
+            self._bump(pipe, room_id)
+            for m in messages:
+                pipe.rpushx(key, json.dumps(m))
+            pipe.ltrim(key, -settings.CHAT_RECENT_MESSAGES, -1)
+            pipe.expire(key, settings.CHAT_RECENT_MESSAGES_TTL)
+            pipe.execute()
+
+    def invalidate(self, room_id):
+        with self.client.pipeline() as pipe:
+            self._bump(pipe, room_id)
+            pipe.delete(self.key(room_id))
+            pipe.execute()
+
+    def _bump(self, pipe, room_id):
+        generation_key = self.generation_key(room_id)
+        pipe.incr(generation_key)
+        pipe.expire(generation_key, settings.CHAT_RECENT_MESSAGES_TTL)
+
+
+class LocalRecentMessages:
+    """
+    프로세스 메모리 링 버퍼 (테스트/Redis 없는 개발 환경용, RedisRecentMessages 와 같은 동작)
+    """
+    errors = ()
+
+    def __init__(self):
+        self._rooms = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, room_id):
+        with self._lock:
+            items = self._rooms.get(int(room_id))
+            return None if items is None else list(items)
+
+    def generation(self, room_id):
+        with self._lock:
+            return self._generations.get(int(room_id), 0)
+
+    def fill(self, room_id, messages, generation):
+        with self._lock:
+            if self._generations.get(int(room_id), 0) != generation:
+                return
+            self._rooms.setdefault(int(room_id), list(messages)[-settings.CHAT_RECENT_MESSAGES:])
+
+    def append(self, room_id, messages):
+        with self._lock:
+            self._bump(room_id)
+            items = self._rooms.get(int(room_id))
+            if items is not None:
+                items.extend(messages)
+                del items[:-settings.CHAT_RECENT_MESSAGES]
+
+    def invalidate(self, room_id):
+        with self._lock:
+            self._bump(room_id)
+            self._rooms.pop(int(room_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._rooms.clear()
+            self._generations.clear()
+
+    def _bump(self, room_id):
+        self._generations[int(room_id)] = self._generations.get(int(room_id), 0) + 1
+
+
+_backends = {}
+
+
+def recent_messages():
+    """
+    CHAT_RECENT_MESSAGES_BACKEND ('redis' | 'local') 에 해당하는 링 버퍼
+    """
+    name = settings.CHAT_RECENT_MESSAGES_BACKEND
+    if name not in _backends:
+        if name == 'redis':
+            _backends[name] = RedisRecentMessages(settings.CHAT_RECENT_MESSAGES_URL)
+        else:
+            _backends[name] = LocalRecentMessages()
+    return _backends[name]
+
+
+def _cached(room_id):
+    backend = recent_messages()
+    try:
+        items = backend.get(room_id)
+    except backend.errors as e:
+        logger.warning('recent messages unavailable for room %s: %s', room_id, e)
+        return None
+    if items is None:
+        return None
+    # 빈 방 표식과 재전송으로 두 번 들어간 메시지 제거, 여러 프로세스가 덧붙인 순서가 아니라 id 순으로
+    seen = set()
+    messages = []
+    for m in items:
+        if m is not None and m["id"] not in seen:
+            seen.add(m["id"])
+            messages.append(m)
+    messages.sort(key=lambda m: m["id"])
+    return messages
+
+
+def _generation(room_id):
+    backend = recent_messages()
+    try:
+        return backend.generation(room_id)
+    except backend.errors as e:
+        logger.warning('recent messages unavailable for room %s: %s', room_id, e)
+        return None
+
+
+def recent_history(room_id, limit):
+    """
+    최근 메시지 limit 개 (오래된 순 목록, 더 이전 메시지 존재 여부)
+    링 버퍼가 있으면 SQL 없이, 콜드이면 DB 에서 읽고 링 버퍼를 채운다.
+    """
+    messages = _cached(room_id)
+    if messages is not None and limit <= settings.CHAT_RECENT_MESSAGES:
+        has_more = len(messages) > limit or len(messages) >= settings.CHAT_RECENT_MESSAGES
+        return messages[-limit:], has_more
+
+    # 세대는 DB 를 읽기 전에 (읽는 사이 저장된 메시지가 있으면 채우지 않는다)
+    generation = _generation(room_id) if messages is None else None
+    rows, has_more = Message.history_page(room_id, limit=max(limit, settings.CHAT_RECENT_MESSAGES))
+    serialized = [serialize_message(m) for m in rows]
+    if generation is not None:
+        backend = recent_messages()
+        try:
+            backend.fill(room_id, serialized, generation)
+        except backend.errors as e:
+            logger.warning('recent messages fill failed for room %s: %s', room_id, e)
+    return serialized[-limit:], has_more or len(serialized) > limit
+
+
+def recent_delta(room_id, last_id, limit):
+    """
+    last_id 이후 메시지 (Message.delta_since 와 같은 의미)
+    last_id 가 링 버퍼 안에 있으면 SQL 없이 그보다 큰 id 만 골라 반환한다.
+    """
+    messages = _cached(room_id)
+    if messages:
+        ids = [m["id"] for m in messages]
+        if last_id in ids:
+            delta = [m for m in messages if m["id"] > last_id]
+            return delta if len(delta) <= limit else None
+        if last_id > ids[-1]:
+            return None  # 이 방의 메시지가 아닌 커서
+        # 링 버퍼보다 오래된 커서는 DB 에서 확인
+
+    delta = Message.delta_since(room_id, last_id, limit=limit)
+    return None if delta is None else [serialize_message(m) for m in delta]
+
+
+def remember_messages(room_id, messages):
+    """
+    새로 저장된 메시지(직렬화된 dict 목록)를 링 버퍼에 덧붙임 (콜드인 방은 무시)
+    """
+    backend = recent_messages()
+    try:
+        backend.append(room_id, messages)
+    except backend.errors as e:
+        logger.warning('recent messages append failed for room %s: %s', room_id, e)
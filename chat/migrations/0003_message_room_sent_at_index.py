@@ -0,0 +1,17 @@
+# Generated by Django 4.2.21 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0002_chatroom_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['room', 'sent_at', 'id'], name='chat_msg_room_sent_id_idx'),
+        ),
+    ]
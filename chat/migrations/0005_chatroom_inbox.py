@@ -0,0 +1,56 @@
+# Generated by Django 4.2.21 on 2026-10-18 10:50
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def fill_last_message(apps, schema_editor):
+    """
+    기존 방의 마지막 메시지 채우기
+    기존 대화는 모두 읽은 것으로 보고 두 참여자의 읽은 위치를 마지막 메시지로 맞춘다.
+    """
+    ChatRoom = apps.get_model('chat', 'ChatRoom')
+    Message = apps.get_model('chat', 'Message')
+    ChatRoom.objects.update(last_message_id=Subquery(
+        Message.objects.filter(room=OuterRef('pk')).order_by('-id').values('id')[:1]
+    ))
+    ChatRoom.objects.update(
+        user1_last_read_id=Coalesce(F('last_message_id'), 0),
+        user2_last_read_id=Coalesce(F('last_message_id'), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0004_message_client_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatroom',
+            name='last_message',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='chat.message'),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='user1_last_read_id',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='user2_last_read_id',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='chatroom',
+            index=models.Index(fields=['user1', '-updated_at', '-id'], name='chat_room_user1_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='chatroom',
+            index=models.Index(fields=['user2', '-updated_at', '-id'], name='chat_room_user2_recent_idx'),
+        ),
+        migrations.RunPython(fill_last_message, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,27 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.db.models import Case, F, Q, Subquery, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
 
 class ChatRoom(models.Model):
     user1 = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="chats_as_user1")
     user2 = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="chats_as_user2")
     updated_at = models.DateTimeField(auto_now=True)
+    # 받은편지함용 비정규화 컬럼: 마지막 메시지(chat.activity 가 갱신), 참여자별 마지막으로 읽은 메시지 id
+    last_message = models.ForeignKey("Message", null=True, blank=True, on_delete=models.SET_NULL, related_name="+")
+    user1_last_read_id = models.PositiveBigIntegerField(default=0)
+    user2_last_read_id = models.PositiveBigIntegerField(default=0)
 
     class Meta:
         unique_together = ("user1", "user2")  # 같은 조합 방 하나만
+        indexes = [
+            # 받은편지함: (user1 = 나 OR user2 = 나) 최근 활동순
+            models.Index(fields=["user1", "-updated_at", "-id"], name="chat_room_user1_recent_idx"),
+            models.Index(fields=["user2", "-updated_at", "-id"], name="chat_room_user2_recent_idx"),
+        ]
 
     @staticmethod
     def get_room(u1, u2):
@@ -16,13 +30,114 @@ class ChatRoom(models.Model):
         room, _ = ChatRoom.objects.get_or_create(user1=u1, user2=u2)
         return room
 
+    def partner_of(self, user):
+        return self.user2 if self.user1_id == user.id else self.user1
+
+    @staticmethod
+    def inbox(user):
+        """
+        user 의 모든 방 (최근 활동순, 상대/마지막 메시지/안 읽음 여부 포함)
+        안 읽음 여부는 비정규화 컬럼(last_message, userN_last_read_id)만 비교하므로 메시지 테이블을 세지 않는다.
+        """
+        my_last_read_id = Case(When(user1=user, then=F("user1_last_read_id")), default=F("user2_last_read_id"))
+        return (ChatRoom.objects
+                .filter(Q(user1=user) | Q(user2=user))
+                .select_related("user1", "user2", "last_message", "last_message__sender")
+                .annotate(
+                    unread=Case(When(Q(last_message_id__gt=my_last_read_id) & ~Q(last_message__sender=user),
+                                     then=Value(True)),
+                                default=Value(False), output_field=models.BooleanField()),
+                )
+                .order_by("-updated_at", "-id"))
+
+    @staticmethod
+    def unread_total(user):
+        """
+        user 가 참여한 모든 방의 안 읽은 메시지 수 (상대가 보낸 것만)
+        """
+        return (Message.objects
+                .filter(Q(room__user1=user, id__gt=F("room__user1_last_read_id"))
+                        | Q(room__user2=user, id__gt=F("room__user2_last_read_id")))
+                .exclude(sender=user)
+                .count())
+
+    @staticmethod
+    def mark_read(room_id, user, message_id):
+        """
+        user 가 room_id 방의 message_id 까지 읽었음을 기록 (뒤로 돌아가지 않음, 참여자가 아니면 무시)
+        """
+        return ChatRoom.objects.filter(Q(user1=user) | Q(user2=user), id=room_id).update(
+            user1_last_read_id=Case(When(user1=user, then=Greatest(F("user1_last_read_id"), Value(message_id))),
+                                    default=F("user1_last_read_id")),
+            user2_last_read_id=Case(When(user2=user, then=Greatest(F("user2_last_read_id"), Value(message_id))),
+                                    default=F("user2_last_read_id")),
+        )
+
 class Message(models.Model):
     room   = models.ForeignKey(ChatRoom, on_delete=models.CASCADE, related_name="messages")
     sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     text   = models.TextField()
-    sent_at = models.DateTimeField(auto_now_add=True)
+    # 비동기 저장 큐(chat.persistence)가 받은 시각을 그대로 저장하도록 auto_now_add 대신 기본값 사용
+    sent_at = models.DateTimeField(default=timezone.now)
+    # 클라이언트가 만든 메시지 id (재전송 중복 제거, 저장 전 브로드캐스트와 저장 후 id 를 잇는 데 사용)
+    client_id = models.UUIDField(null=True, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # 방별 최신순 조회와 (sent_at, id) 커서 페이지네이션용
+            models.Index(fields=["room", "sent_at", "id"], name="chat_msg_room_sent_id_idx"),
+        ]
+        constraints = [
+            # client_id 는 클라이언트가 정하고 방에 공개되므로 중복 제거는 같은 방, 같은 보낸 사람 안에서만
+            models.UniqueConstraint(fields=["room", "sender", "client_id"], name="chat_msg_room_sender_client_uniq"),
+        ]
 
     def save(self, *args, **kwargs):
+        created = self._state.adding
         super().save(*args, **kwargs)
-        # 메시지 저장될 때 방의 updated_at 갱신
-        self.room.save(update_fields=["updated_at"])
\ No newline at end of file
+        if created:
+            # 방의 updated_at/last_message 는 chat.activity 에서 모아서 갱신 (방을 읽지 않고, 메시지마다 쓰지 않는다)
+            from .activity import room_activity
+            from .history import remember_messages, serialize_message
+            room_activity.touch(self.room_id, self.sent_at, self.id)
+            remember_messages(self.room_id, [serialize_message(self)])
+
+    @staticmethod
+    def history_page(room_id, before_id=None, limit=30):
+        """
+        before_id 메시지보다 이전 메시지 limit 개를 (오래된 순 목록, 더 이전 메시지 존재 여부) 로 반환
+        커서 메시지의 sent_at 은 서브쿼리로 읽으므로 (room, sent_at, id) 인덱스를 타는 쿼리 한 번이다.
+        """
+        qs = Message.objects.filter(room_id=room_id)
+        if before_id is not None:
+            cursor = Subquery(
+                Message.objects.filter(pk=before_id, room_id=room_id).values("sent_at")[:1]
+            )
+            qs = qs.filter(Q(sent_at__lt=cursor) | Q(sent_at=cursor, id__lt=before_id))
+        rows = list(qs.select_related("sender").order_by("-sent_at", "-id")[:limit + 1])
+        return rows[:limit][::-1], len(rows) > limit
+
+    @staticmethod
+    def delta_since(room_id, last_id, limit=100):
+        """
+        재접속한 클라이언트가 마지막으로 본 메시지(last_id) 이후 메시지 목록 (오래된 순)
+        last_id 가 이 방의 메시지가 아니거나 밀린 메시지가 limit 개를 넘으면 None (전체 다시 받기)
+        last_id 행까지 함께 읽어 커서 확인과 밀린 메시지 조회를 쿼리 한 번으로 처리한다.
+        """
+        rows = list(Message.objects
+                    .filter(room_id=room_id, id__gte=last_id)
+                    .select_related("sender")
+                    .order_by("id")[:limit + 2])
+        if not rows or rows[0].id != last_id or len(rows) > limit + 1:
+            return None
+        return rows[1:]
+
+
+@receiver(post_delete, sender=Message)
+def forget_recent_messages(sender, instance, **kwargs):
+    # 삭제된 메시지가 링 버퍼(chat.history)에 남지 않도록 그 방은 다음 접속 때 DB 에서 다시 채운다
+    from .history import recent_messages
+    try:
+        recent_messages().invalidate(instance.room_id)
+    except recent_messages().errors:
+        pass
@@ -0,0 +1,255 @@
+import asyncio
+import atexit
+import logging
+import uuid
+
+from asgiref.sync import sync_to_async
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils.text import Truncator
+
+from common.metrics import Counter, Gauge
+from common.writebehind import MAX_RETRY_DELAY
+from .activity import room_activity
+from .history import remember_messages, serialize_message
+from .models import ChatRoom, Message
+
+logger = logging.getLogger(__name__)
+
+CHAT_PERSIST_QUEUE_DEPTH = Gauge(
+    'chat_persist_queue_depth', 'Chat messages broadcast but not yet written to the database.')
+CHAT_PERSISTED = Counter(
+    'chat_persisted_messages_total', 'Chat messages handled by the persistence queue by outcome.', ('outcome',))
+
+
+class MessageQueue:
+    """
+    채팅 메시지 비동기 write-behind 큐 (프로세스별)
+    컨슈머는 메시지를 먼저 브로드캐스트하고 여기에 넣는다. 큐는 CHAT_PERSIST_FLUSH_INTERVAL 초마다
+    최대 CHAT_PERSIST_BATCH_SIZE 개씩 bulk_create 로 저장하고, 저장된 id 를 방 그룹에 chat_persisted 로 알린다.
+    받는 사람의 알림 채널에는 저장된 뒤에 새 메시지(chat_notification)와 안 읽은 수(unread_count)를 보낸다.
+    큐는 CHAT_PERSIST_QUEUE_SIZE 개로 제한되며 가득 차면 넣는 쪽이 자리가 날 때까지 기다린다.
+    간격이 0 이면 큐 없이 바로 저장한다.
+    """
+
+    def __init__(self):
+        self._queue = None
+        self._loop = None
+        self._ready = None
+        self._task = None
+
+    @property
+    def interval(self):
+        return getattr(settings, 'CHAT_PERSIST_FLUSH_INTERVAL', 0.2)
+
+    def depth(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def put(self, message):
+        if self.interval <= 0:
+            await self._flush_batch([message])
+            return
+        self._ensure_worker()
+        await self._queue.put(message)
+        CHAT_PERSIST_QUEUE_DEPTH.set(self.depth())
+        self._ready.set()
+
+    async def flush(self):
+        """
+        큐에 남은 메시지를 모두 저장
+        """
+        while self.depth():
+            await self._flush_batch(self._drain(settings.CHAT_PERSIST_BATCH_SIZE))
+
+    def flush_sync(self):
+        """
+        이벤트 루프가 끝난 뒤(프로세스 종료 시) 남은 메시지 저장
+        """
+        while self.depth():
+            batch = self._drain(settings.CHAT_PERSIST_BATCH_SIZE)
+            try:
+                self._write(batch)  # 알림은 보내지 않는다 (이벤트 루프가 끝났으므로)
+            except Exception:
+                logger.exception('chat persist failed at exit (%d messages), writing one by one', len(batch))
+                self._write_each(batch)
+            else:
+                CHAT_PERSISTED.inc(len(batch), outcome='written')
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # 처음 사용하거나 이벤트 루프가 바뀐 경우(개발 서버 재시작, 테스트) 큐와 작업을 새로 만든다
+        leftovers = self._drain()
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=settings.CHAT_PERSIST_QUEUE_SIZE)
+        self._ready = asyncio.Event()
+        for message in leftovers[:settings.CHAT_PERSIST_QUEUE_SIZE]:
+            self._queue.put_nowait(message)
+        self._task = loop.create_task(self._run())
+
+    def _drain(self, limit=None):
+        batch = []
+        while self._queue is not None and not self._queue.empty() and (limit is None or len(batch) < limit):
+            batch.append(self._queue.get_nowait())
+        CHAT_PERSIST_QUEUE_DEPTH.set(self.depth())
+        return batch
+
+    async def _run(self):
+        while True:
+            await self._ready.wait()
+            await asyncio.sleep(self.interval)  # 이 사이에 들어온 메시지를 한 배치로 모은다
+            self._ready.clear()
+            await self.flush()
+
+    async def _flush_batch(self, batch):
+        persisted, created = await self._write_with_retry(batch)
+        channel_layer = get_channel_layer()
+        for room_id, ids in persisted.items():
+            await channel_layer.group_send(f"chat_{room_id}", {"type": "chat_persisted", "ids": ids})
+        if not created:
+            return
+        from .consumers import user_group
+
+        # 상대가 이 방에 접속해 있지 않아도 알 수 있도록 사용자 알림 채널로도 보낸다 (저장된 메시지만, 재전송 제외)
+        notifications, unread = await sync_to_async(self._notifications)(created)
+        for recipient_id, event in notifications:
+            await channel_layer.group_send(user_group(recipient_id), event)
+        for recipient_id, total in unread.items():
+            await channel_layer.group_send(user_group(recipient_id), {"type": "unread_count", "total": total})
+
+    @staticmethod
+    def _notifications(created):
+        """
+        새로 저장된 메시지별 (받는 사람 id, chat_notification) 목록과 받는 사람별 안 읽은 메시지 수
+        """
+        rooms = {
+            room_id: (user1_id, user2_id)
+            for room_id, user1_id, user2_id in ChatRoom.objects.filter(
+                id__in={m.room_id for m in created}).values_list('id', 'user1_id', 'user2_id')
+        }
+        notifications = []
+        for message in created:
+            if message.room_id not in rooms:
+                continue
+            user1_id, user2_id = rooms[message.room_id]
+            recipient_id = user2_id if message.sender_id == user1_id else user1_id
+            notifications.append((recipient_id, {
+                "type": "chat_notification",
+                "room_id": message.room_id,
+                "sender": message.sender.username,
+                "text": Truncator(message.text).chars(60),
+                "sent_at": message.sent_at.isoformat(),
+            }))
+        recipients = {recipient_id for recipient_id, event in notifications}
+        users = get_user_model().objects.filter(id__in=recipients)
+        return notifications, {user.id: ChatRoom.unread_total(user) for user in users}
+
+    async def _write_with_retry(self, batch):
+        """
+        batch 를 저장하고 _write 결과 (persisted, created) 반환 (메시지는 이미 브로드캐스트되었으므로 쉽게 버리지 않는다)
+        실패하면 CHAT_PERSIST_RETRIES 번까지 점점 긴 간격(최대 MAX_RETRY_DELAY 초)으로 다시 시도하고
+        (그동안 큐가 차면 메시지 수신이 기다린다), 그래도 실패하면 메시지 하나 때문에(예: 삭제된 방)
+        배치 전체를 잃지 않도록 메시지별로 저장한다.
+        """
+        retries = settings.CHAT_PERSIST_RETRIES
+        for attempt in range(retries + 1):
+            try:
+                persisted = await sync_to_async(self._write)(batch)
+            except Exception:
+                if attempt == retries:
+                    logger.exception('chat persist failed (%d messages), writing one by one', len(batch))
+                    break
+                delay = min(max(self.interval, 0.1) * 2 ** attempt, MAX_RETRY_DELAY)
+                logger.exception('chat persist failed (%d messages, attempt %d), retrying in %.1fs',
+                                 len(batch), attempt + 1, delay)
+                await asyncio.sleep(delay)
+            else:
+                CHAT_PERSISTED.inc(len(batch), outcome='written')
+                return persisted
+        return await sync_to_async(self._write_each)(batch)
+
+    def _write_each(self, batch):
+        persisted = {}
+        created = []
+        for message in batch:
+            try:
+                written, new = self._write([message])
+            except Exception:
+                CHAT_PERSISTED.inc(outcome='failed')
+                logger.exception('chat persist failed for message %s in room %s', message.client_id, message.room_id)
+                continue
+            CHAT_PERSISTED.inc(outcome='written')
+            for room_id, ids in written.items():
+                persisted.setdefault(room_id, {}).update(ids)
+            created.extend(new)
+        return persisted, created
+
+    @staticmethod
+    def _write(batch):
+        """
+        batch 를 저장하고 ({room id: {client_id: message id}}, 새로 만든 메시지 목록) 반환
+        같은 방에서 같은 사람이 같은 client_id 로 같은 내용을 다시 보내면(재전송) 새로 만들지 않고 기존 id 를 돌려준다.
+        내용이 다르면 재전송이 아니므로(client_id 재사용) 이미 브로드캐스트된 메시지를 버리지 않도록 새 client_id 로 저장한다.
+        """
+        for message in batch:
+            message.id = None  # 실패한 시도에서 채운 id 가 남지 않도록
+            if message.client_id is None:
+                message.client_id = uuid.uuid4()
+        with transaction.atomic():
+            Message.objects.bulk_create(batch, ignore_conflicts=True)
+            saved = {
+                (room_id, sender_id, client_id): (message_id, text, sent_at)
+                for room_id, sender_id, client_id, message_id, text, sent_at in Message.objects.filter(
+                    room_id__in={m.room_id for m in batch}, client_id__in=[m.client_id for m in batch],
+                ).values_list('room_id', 'sender_id', 'client_id', 'id', 'text', 'sent_at')
+            }
+            persisted = {}
+            created = []
+            conflicts = []
+            for message in batch:
+                message_id, text, sent_at = saved.get(
+                    (message.room_id, message.sender_id, message.client_id), (None, None, None))
+                if message_id is None or text != message.text:
+                    conflicts.append(message)
+                    continue
+                message.id = message_id
+                persisted.setdefault(message.room_id, {})[str(message.client_id)] = message.id
+                if sent_at == message.sent_at:
+                    created.append(message)  # 재전송이면 기존 행의 sent_at 이 다르다
+            if conflicts:
+                logger.warning('chat client_id conflict (%d messages), storing with new client ids', len(conflicts))
+                for message in conflicts:
+                    message.client_id = uuid.uuid4()
+                Message.objects.bulk_create(conflicts)
+                ids = dict(Message.objects.filter(client_id__in=[m.client_id for m in conflicts])
+                           .values_list('client_id', 'id'))
+                for message in conflicts:
+                    message.id = ids[message.client_id]
+                # 클라이언트는 브로드캐스트된 client_id 로 임시 메시지를 찾으므로 persisted 로는 알리지 않는다
+                created.extend(conflicts)
+
+        # bulk_create 는 Message.save 를 거치지 않으므로 방 활동 시각과 최근 메시지 링 버퍼를 직접 갱신
+        latest = {}
+        recent = {}
+        seen = set()
+        new = []
+        for message in created:
+            if message.id in seen:
+                continue  # 같은 배치 안의 재전송
+            seen.add(message.id)
+            new.append(message)
+            room_latest = latest.get(message.room_id)
+            if room_latest is None or (message.sent_at, message.id) > room_latest:
+                latest[message.room_id] = (message.sent_at, message.id)
+            recent.setdefault(message.room_id, []).append(serialize_message(message))
+        for room_id, (sent_at, message_id) in latest.items():
+            room_activity.touch(room_id, sent_at, message_id)
+            remember_messages(room_id, recent[room_id])
+        return persisted, new
+
+
+message_queue = MessageQueue()
+atexit.register(message_queue.flush_sync)
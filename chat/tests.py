@@ -1,3 +1,608 @@
-from django.test import TestCase
+import json
+import uuid
+from datetime import timedelta
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from common.testing import QueryBudgetTestMixin
+from .activity import room_activity
+from .consumers import CHAT_DROPPED, CHAT_THROTTLED, ChatConsumer, NotificationConsumer
+from .history import recent_delta, recent_history, recent_messages, remember_messages, serialize_message
+from .persistence import message_queue
+from .throttle import user_buckets
+from .models import ChatRoom, Message
+
+
+@override_settings(CHAT_RECENT_MESSAGES_BACKEND='local')
+class ChatTestCase(TestCase):
+    """
+    최근 메시지 링 버퍼는 프로세스 메모리(local)를 쓰고 테스트마다 비운다 (롤백된 방 id 가 재사용되므로)
+    """
+
+    def setUp(self):
+        super().setUp()
+        recent_messages().clear()
+
+
+@override_settings(CHAT_ACTIVITY_FLUSH_INTERVAL=0)
+class QueryBudgetTest(QueryBudgetTestMixin, ChatTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('me', password='password')
+        for i in range(5):
+            other = User.objects.create_user(f'other{i}', password='password')
+            room = ChatRoom.get_room(cls.user, other)
+            Message.objects.create(room=room, sender=other, text='안녕하세요')
+
+    def test_latest_room(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('chat:latest'))
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinQueryBudget(response)
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+                   CHAT_ACTIVITY_FLUSH_INTERVAL=0)
+class HistoryPageTest(ChatTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('me', password='password')
+        other = User.objects.create_user('other', password='password')
+        cls.room = ChatRoom.get_room(cls.user, other)
+        for i in range(7):
+            Message.objects.create(room=cls.room, sender=other, text=f'message {i}')
+        # 같은 시각에 저장된 메시지도 id 로 순서가 정해진다
+        Message.objects.filter(room=cls.room).update(sent_at=timezone.now())
+        cls.ids = list(Message.objects.filter(room=cls.room).order_by('id').values_list('id', flat=True))
+
+    def test_pages_walk_back_without_gaps(self):
+        seen = []
+        before_id, has_more = None, True
+        while has_more:
+            with self.assertNumQueries(1):
+                page, has_more = Message.history_page(self.room.id, before_id=before_id, limit=3)
+            seen = [m.id for m in page] + seen
+            before_id = page[0].id
+        self.assertEqual(seen, self.ids)
+
+    def test_cursor_from_other_room_returns_nothing(self):
+        stranger = User.objects.create_user('stranger', password='password')
+        room = ChatRoom.get_room(self.user, stranger)
+        foreign = Message.objects.create(room=room, sender=stranger, text='hi')
+        self.assertEqual(Message.history_page(self.room.id, before_id=foreign.id), ([], False))
+
+    def _communicate(self, *commands, query=''):
+        async def run():
+            communicator = WebsocketCommunicator(ChatConsumer.as_asgi(), f'/ws/chat/{self.room.id}/{query}')
+            communicator.scope['user'] = self.user
+            communicator.scope['url_route'] = {'kwargs': {'room_id': str(self.room.id)}}
+            connected, _ = await communicator.connect()
+            self.assertTrue(connected)
+            responses = [await communicator.receive_json_from()]
+            for command in commands:
+                await communicator.send_json_to(command)
+                responses.append(await communicator.receive_json_from())
+            await communicator.disconnect()
+            return responses
+        return async_to_sync(run)()
+
+    @override_settings(CHAT_HISTORY_PAGE_SIZE=4)
+    def test_load_history_command(self):
+        history, page, invalid = self._communicate(
+            {'command': 'load_history', 'before_id': self.ids[3], 'limit': 10},
+            {'command': 'load_history', 'before_id': 'x'},
+        )
+        self.assertEqual(history['type'], 'chat_history')
+        self.assertEqual([m['id'] for m in history['messages']], self.ids[3:])
+        self.assertTrue(history['has_more'])
+        self.assertEqual(page['type'], 'chat_history_page')
+        self.assertEqual([m['id'] for m in page['messages']], self.ids[:3])
+        self.assertFalse(page['has_more'])
+        self.assertEqual(invalid['type'], 'error')
+
+    def test_reconnect_sends_only_delta(self):
+        with self.assertNumQueries(1):
+            self.assertEqual([m.id for m in Message.delta_since(self.room.id, self.ids[4])], self.ids[5:])
+        (delta,) = self._communicate(query=f'?last_id={self.ids[4]}')
+        self.assertEqual(delta['type'], 'chat_delta')
+        self.assertEqual([m['id'] for m in delta['messages']], self.ids[5:])
+
+        (delta,) = self._communicate(query=f'?last_id={self.ids[-1]}')
+        self.assertEqual(delta['messages'], [])
+
+    @override_settings(CHAT_RESYNC_MAX_DELTA=3)
+    def test_reconnect_too_far_behind_reloads(self):
+        (history,) = self._communicate(query=f'?last_id={self.ids[0]}')
+        self.assertEqual(history['type'], 'chat_history')
+        self.assertTrue(history['full_reload'])
+        self.assertEqual(history['messages'][-1]['id'], self.ids[-1])
+
+    def test_reconnect_with_unknown_cursor_reloads(self):
+        self.assertIsNone(Message.delta_since(self.room.id, self.ids[-1] + 100))
+        (history,) = self._communicate(query='?last_id=abc')
+        self.assertEqual(history['type'], 'chat_history')
+        self.assertFalse(history['full_reload'])
+
+
+class RoomActivityTest(ChatTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('me', password='password')
+        cls.rooms = [ChatRoom.get_room(cls.user, User.objects.create_user(f'other{i}', password='password'))
+                     for i in range(2)]
+
+    @override_settings(CHAT_ACTIVITY_FLUSH_INTERVAL=0)
+    def test_message_save_touches_room_in_one_write(self):
+        room = self.rooms[0]
+        with self.assertNumQueries(2):  # INSERT message + UPDATE room
+            message = Message.objects.create(room_id=room.id, sender=self.user, text='hi')
+        room.refresh_from_db()
+        self.assertEqual(room.updated_at, message.sent_at)
+
+    @override_settings(CHAT_ACTIVITY_FLUSH_INTERVAL=60)
+    def test_burst_is_coalesced(self):
+        with self.assertNumQueries(6):  # INSERT 만, 방 갱신은 flush 로 미룸
+            for room in self.rooms * 3:
+                Message.objects.create(room=room, sender=self.user, text='hi')
+        with self.assertNumQueries(1):
+            room_activity.flush()
+        for room in self.rooms:
+            room.refresh_from_db()
+            latest = Message.objects.filter(room=room).order_by('-sent_at').first()
+            self.assertEqual(room.updated_at, latest.sent_at)
+
+    @override_settings(CHAT_ACTIVITY_FLUSH_INTERVAL=0)
+    def test_older_activity_does_not_move_back(self):
+        room = self.rooms[0]
+        first = Message.objects.create(room=room, sender=self.user, text='first')
+        latest = Message.objects.create(room=room, sender=self.user, text='latest')
+        room_activity.touch(room.id, first.sent_at - timedelta(minutes=5), first.id)
+        room.refresh_from_db()
+        self.assertEqual(room.updated_at, latest.sent_at)
+        self.assertEqual(room.last_message_id, latest.id)
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+                   CHAT_ACTIVITY_FLUSH_INTERVAL=0)
+class MessagePersistenceTest(ChatTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('me', password='password')
+        cls.room = ChatRoom.get_room(cls.user, User.objects.create_user('other', password='password'))
+
+    def _run(self, scenario):
+        async def run():
+            communicator = WebsocketCommunicator(ChatConsumer.as_asgi(), f'/ws/chat/{self.room.id}/')
+            communicator.scope['user'] = self.user
+            communicator.scope['url_route'] = {'kwargs': {'room_id': str(self.room.id)}}
+            await communicator.connect()
+            await communicator.receive_json_from()  # chat_history
+            try:
+                return await scenario(communicator)
+            finally:
+                await communicator.disconnect()
+        return async_to_sync(run)()
+
+    @override_settings(CHAT_PERSIST_FLUSH_INTERVAL=0)
+    def test_broadcast_then_persisted_id(self):
+        client_id = str(uuid.uuid4())
+
+        async def scenario(communicator):
+            await communicator.send_json_to({'message': 'hello', 'client_id': client_id})
+            broadcast = await communicator.receive_json_from()
+            persisted = await communicator.receive_json_from()
+            # 같은 client_id 재전송은 새 행을 만들지 않는다
+            await communicator.send_json_to({'message': 'hello', 'client_id': client_id})
+            await communicator.receive_json_from()
+            again = await communicator.receive_json_from()
+            return broadcast, persisted, again
+
+        broadcast, persisted, again = self._run(scenario)
+        self.assertEqual(broadcast['type'], 'chat_message')
+        self.assertIsNone(broadcast['id'])
+        self.assertEqual(broadcast['client_id'], client_id)
+        message = Message.objects.get(client_id=client_id)
+        self.assertEqual(persisted, {'type': 'chat_persisted', 'ids': {client_id: message.id}})
+        self.assertEqual(again['ids'], {client_id: message.id})
+        self.assertEqual(Message.objects.filter(room=self.room).count(), 1)
+        self.room.refresh_from_db()
+        self.assertGreaterEqual(self.room.updated_at, message.sent_at)
+
+    @override_settings(CHAT_PERSIST_FLUSH_INTERVAL=60)
+    def test_messages_are_batched(self):
+        async def scenario(communicator):
+            for i in range(3):
+                await communicator.send_json_to({'message': f'message {i}'})
+                await communicator.receive_json_from()  # 저장 전에 바로 브로드캐스트
+            depth = message_queue.depth()
+            await message_queue.flush()
+            persisted = await communicator.receive_json_from()
+            return depth, persisted
+
+        # 접속 시 참여자 확인, 이전 메시지 조회 + 배치 저장(SAVEPOINT, bulk INSERT, id 조회, RELEASE) + 방 UPDATE
+        # + 받는 사람 알림(방 참여자, 받는 사람, 안 읽은 수)
+        with self.assertNumQueries(10):
+            depth, persisted = self._run(scenario)
+        self.assertEqual(depth, 3)
+        self.assertEqual(message_queue.depth(), 0)
+        self.assertEqual(len(persisted['ids']), 3)
+        self.assertEqual(sorted(persisted['ids'].values()),
+                         list(Message.objects.filter(room=self.room).order_by('id').values_list('id', flat=True)))
+
+
+    def message(self, text, client_id, room=None, sender=None):
+        return Message(room=room or self.room, sender=sender or self.user, text=text,
+                       client_id=client_id, sent_at=timezone.now())
+
+    def test_client_id_is_scoped_to_room_and_sender(self):
+        client_id = uuid.uuid4()
+        partner = self.room.partner_of(self.user)
+        other_room = ChatRoom.get_room(partner, User.objects.create_user('third', password='password'))
+        async_to_sync(message_queue._flush_batch)([self.message('first', client_id)])
+
+        # 다른 방, 같은 방의 다른 사람, 같은 사람의 다른 내용 모두 저장된다
+        persisted, created = message_queue._write([
+            self.message('elsewhere', client_id, room=other_room, sender=partner),
+            self.message('reply', client_id, sender=partner),
+            self.message('second', client_id),
+            self.message('first', client_id),  # 재전송
+        ])
+
+        texts = Message.objects.order_by('id').values_list('text', flat=True)
+        self.assertEqual(list(texts), ['first', 'elsewhere', 'reply', 'second'])
+        self.assertEqual(set(persisted), {self.room.id, other_room.id})
+        self.assertEqual([m.text for m in created], ['elsewhere', 'reply', 'second'])
+        self.assertEqual(persisted[self.room.id][str(client_id)], Message.objects.get(text='first').id)
+
+    @override_settings(CHAT_PERSIST_FLUSH_INTERVAL=0, CHAT_PERSIST_RETRIES=2)
+    def test_failed_batches_are_retried_then_written_one_by_one(self):
+        write = message_queue._write
+        failures = []
+
+        def flaky(batch):
+            if not failures:
+                failures.append(len(batch))
+                raise RuntimeError('database is locked')
+            return write(batch)
+
+        message_queue._write = flaky
+        self.addCleanup(vars(message_queue).pop, '_write', None)
+        async_to_sync(message_queue._flush_batch)([self.message('retried', uuid.uuid4())])
+        self.assertEqual(failures, [1])
+        self.assertTrue(Message.objects.filter(text='retried').exists())
+
+        # 계속 실패하는 메시지 하나가 배치의 나머지를 잃게 하지 않는다
+        del message_queue._write
+        async_to_sync(message_queue._flush_batch)([
+            self.message('kept', uuid.uuid4()),
+            self.message(None, uuid.uuid4()),  # NOT NULL 위반
+            self.message('also kept', uuid.uuid4()),
+        ])
+        self.assertEqual(set(Message.objects.values_list('text', flat=True)), {'retried', 'kept', 'also kept'})
+
+
+@override_settings(CHAT_ACTIVITY_FLUSH_INTERVAL=0, CHAT_INBOX_PAGE_SIZE=2)
+class InboxTest(QueryBudgetTestMixin, ChatTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('me', password='password')
+        cls.others = [User.objects.create_user(f'other{i}', password='password') for i in range(3)]
+        cls.rooms = []
+        for i, other in enumerate(cls.others):
+            room = ChatRoom.get_room(cls.user, other)
+            Message.objects.create(room=room, sender=cls.user, text='hello')
+            for j in range(i + 1):
+                Message.objects.create(room=room, sender=other, text=f'{other.username} {j}')
+            cls.rooms.append(room)
+        # 첫 번째 방은 모두 읽음
+        ChatRoom.mark_read(cls.rooms[0].id, cls.user, cls.rooms[0].messages.latest('id').id)
+
+    def test_inbox_pages(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('chat:inbox'))
+        self.assertWithinQueryBudget(response)
+        data = response.json()
+        # 최근 활동순: other2, other1 / 다음 페이지 other0
+        self.assertEqual([room['partner'] for room in data['rooms']], ['other2', 'other1'])
+        self.assertEqual([room['unread'] for room in data['rooms']], [True, True])
+        self.assertEqual(data['rooms'][0]['last_message']['text'], 'other2 2')
+
+        # 첫 페이지를 읽은 뒤 활동한 방은 다음 페이지에 다시 나오지 않는다
+        Message.objects.create(room=self.rooms[1], sender=self.user, text='reply')
+        response = self.client.get(reverse('chat:inbox'), {'cursor': data['next'], 'snapshot': data['snapshot']})
+        data = response.json()
+        self.assertEqual([(room['partner'], room['unread']) for room in data['rooms']], [('other0', False)])
+        self.assertIsNone(data['next'])
+
+        # 새 스냅샷에서는 맨 위, 내가 보낸 메시지가 마지막이면 안 읽음이 아니다
+        data = self.client.get(reverse('chat:inbox')).json()
+        self.assertEqual([(room['partner'], room['unread']) for room in data['rooms']],
+                         [('other1', False), ('other2', True)])
+
+    def test_mark_read_only_moves_forward_for_participants(self):
+        room = self.rooms[2]
+        latest = room.messages.latest('id').id
+        self.assertEqual(ChatRoom.mark_read(room.id, self.user, latest), 1)
+        self.assertEqual(ChatRoom.mark_read(room.id, self.user, latest - 3), 1)
+        self.assertEqual(ChatRoom.mark_read(room.id, self.others[0], latest), 0)
+        room.refresh_from_db()
+        self.assertEqual((room.user1_last_read_id, room.user2_last_read_id), (latest, 0))
+        self.assertFalse(ChatRoom.inbox(self.user).get(pk=room.pk).unread)
+        Message.objects.create(room=room, sender=self.user, text='reply')
+        self.assertTrue(ChatRoom.inbox(self.others[2]).get(pk=room.pk).unread)
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+                   CHAT_ACTIVITY_FLUSH_INTERVAL=0, CHAT_PERSIST_FLUSH_INTERVAL=0)
+class NotificationTest(ChatTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.me = User.objects.create_user('me', password='password')
+        cls.other = User.objects.create_user('other', password='password')
+        cls.room = ChatRoom.get_room(cls.me, cls.other)
+        cls.message = Message.objects.create(room=cls.room, sender=cls.other, text='hello')
+
+    @staticmethod
+    def _communicator(consumer, path, user, **kwargs):
+        communicator = WebsocketCommunicator(consumer.as_asgi(), path)
+        communicator.scope['user'] = user
+        communicator.scope['url_route'] = {'kwargs': kwargs}
+        return communicator
+
+    def test_state_then_push_and_unread_updates(self):
+        async def run():
+            notifications = self._communicator(NotificationConsumer, '/ws/notifications/', self.me)
+            await notifications.connect()
+            state = await notifications.receive_json_from()
+
+            # 상대가 다른 연결에서 보낸 메시지가 내 알림 채널로 온다
+            chat = self._communicator(ChatConsumer, f'/ws/chat/{self.room.id}/', self.other,
+                                      room_id=str(self.room.id))
+            await chat.connect()
+            await chat.receive_json_from()
+            await chat.send_json_to({'message': 'are you there?'})
+            notification = await notifications.receive_json_from()
+            # 저장된 뒤 서버가 센 안 읽은 수
+            persisted_unread = await notifications.receive_json_from()
+            await chat.disconnect()
+
+            # 내가 방에서 읽음 처리하면 안 읽은 수가 갱신된다
+            mine = self._communicator(ChatConsumer, f'/ws/chat/{self.room.id}/', self.me,
+                                      room_id=str(self.room.id))
+            await mine.connect()
+            history = await mine.receive_json_from()
+            await mine.send_json_to({'command': 'mark_read', 'last_id': history['messages'][-1]['id']})
+            unread = await notifications.receive_json_from()
+            await mine.disconnect()
+            await notifications.disconnect()
+            return state, notification, persisted_unread, unread
+
+        state, notification, persisted_unread, unread = async_to_sync(run)()
+        self.assertEqual(state, {'type': 'inbox_state', 'unread_total': 1,
+                                 'latest': {'room_id': self.room.id, 'partner': 'other'}})
+        self.assertEqual(notification['type'], 'chat_notification')
+        self.assertEqual((notification['room_id'], notification['sender'], notification['text']),
+                         (self.room.id, 'other', 'are you there?'))
+        self.assertTrue(Message.objects.filter(text='are you there?').exists())
+        self.assertEqual(persisted_unread, {'type': 'unread_count', 'total': 2})
+        self.assertEqual(unread, {'type': 'unread_count', 'total': 0})
+
+    def test_non_participant_cannot_join_room(self):
+        stranger = User.objects.create_user('stranger', password='password')
+
+        async def run():
+            communicator = self._communicator(ChatConsumer, f'/ws/chat/{self.room.id}/', stranger,
+                                              room_id=str(self.room.id))
+            connected, code = await communicator.connect()
+            return connected, code
+
+        self.assertEqual(async_to_sync(run)(), (False, 4403))
+
+
+@override_settings(CHAT_ACTIVITY_FLUSH_INTERVAL=0, CHAT_RECENT_MESSAGES=5)
+class RecentMessagesTest(ChatTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('me', password='password')
+        cls.room = ChatRoom.get_room(cls.user, User.objects.create_user('other', password='password'))
+        for i in range(7):
+            Message.objects.create(room=cls.room, sender=cls.user, text=f'message {i}')
+
+    def ids(self, messages):
+        return [m['id'] for m in messages]
+
+    def test_history_served_from_ring_after_cold_load(self):
+        all_ids = list(Message.objects.filter(room=self.room).order_by('id').values_list('id', flat=True))
+        with self.assertNumQueries(1):
+            messages, has_more = recent_history(self.room.id, 3)
+        self.assertEqual((self.ids(messages), has_more), (all_ids[-3:], True))
+
+        with self.assertNumQueries(0):
+            messages, has_more = recent_history(self.room.id, 3)
+            delta = recent_delta(self.room.id, all_ids[-2], limit=10)
+        self.assertEqual((self.ids(messages), has_more), (all_ids[-3:], True))
+        self.assertEqual(self.ids(delta), all_ids[-1:])
+
+        # 새 메시지는 링 버퍼에 덧붙고 N 개로 잘린다
+        new = Message.objects.create(room=self.room, sender=self.user, text='new')
+        with self.assertNumQueries(0):
+            messages, _ = recent_history(self.room.id, 5)
+        self.assertEqual(self.ids(messages), all_ids[-4:] + [new.id])
+
+        # 링 버퍼보다 오래된 커서는 DB 로 확인
+        with self.assertNumQueries(1):
+            delta = recent_delta(self.room.id, all_ids[0], limit=10)
+        self.assertEqual(self.ids(delta), all_ids[1:] + [new.id])
+
+        new.delete()
+        self.assertIsNone(recent_messages().get(self.room.id))
+
+    def test_cold_fill_skipped_when_message_saved_meanwhile(self):
+        backend = recent_messages()
+        generation = backend.generation(self.room.id)
+        rows, _ = Message.history_page(self.room.id, limit=5)
+        # 링 버퍼가 없을 때 저장된 메시지는 덧붙여지지 않고 세대만 올린다
+        late = Message.objects.create(room=self.room, sender=self.user, text='late')
+        backend.fill(self.room.id, [serialize_message(m) for m in rows], generation)
+        self.assertIsNone(backend.get(self.room.id))
+
+        messages, _ = recent_history(self.room.id, 3)
+        self.assertEqual(messages[-1]['id'], late.id)
+        self.assertEqual(self.ids(recent_history(self.room.id, 3)[0]), self.ids(messages))
+
+    def test_out_of_order_appends_are_sorted(self):
+        all_ids = list(Message.objects.filter(room=self.room).order_by('id').values_list('id', flat=True))
+        recent_history(self.room.id, 3)
+        # 다른 프로세스가 나중 id 를 먼저 덧붙인 경우
+        first, second = Message.objects.bulk_create([
+            Message(room=self.room, sender=self.user, text='first'),
+            Message(room=self.room, sender=self.user, text='second'),
+        ])
+        remember_messages(self.room.id, [serialize_message(second)])
+        remember_messages(self.room.id, [serialize_message(first)])
+
+        with self.assertNumQueries(0):
+            messages, _ = recent_history(self.room.id, 3)
+            delta = recent_delta(self.room.id, all_ids[-1], limit=10)
+            after_first = recent_delta(self.room.id, first.id, limit=10)
+        self.assertEqual(self.ids(messages), [all_ids[-1], first.id, second.id])
+        self.assertEqual(self.ids(delta), [first.id, second.id])
+        self.assertEqual(self.ids(after_first), [second.id])
+
+    def test_empty_room_is_cached_too(self):
+        room = ChatRoom.get_room(self.user, User.objects.create_user('quiet', password='password'))
+        self.assertEqual(recent_history(room.id, 3), ([], False))
+        with self.assertNumQueries(0):
+            self.assertEqual(recent_history(room.id, 3), ([], False))
+
+    @override_settings(CHAT_RECENT_MESSAGES_BACKEND='redis', CHAT_RECENT_MESSAGES_URL='redis://127.0.0.1:1/0')
+    def test_falls_back_to_database_without_redis(self):
+        messages, has_more = recent_history(self.room.id, 3)
+        self.assertEqual(len(messages), 3)
+        self.assertTrue(has_more)
+
+
+@override_settings(CHAT_ACTIVITY_FLUSH_INTERVAL=0, CHAT_PERSIST_FLUSH_INTERVAL=0,
+                   CHAT_CONNECTION_RATE=0.001, CHAT_CONNECTION_BURST=3, CHAT_USER_RATE=0.001, CHAT_USER_BURST=5,
+                   CHAT_MAX_FRAME_SIZE=200, CHAT_MAX_MESSAGE_LENGTH=20)
+class ChatLimitsTest(ChatTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.me = User.objects.create_user('me', password='password')
+        cls.other = User.objects.create_user('other', password='password')
+        cls.room = ChatRoom.get_room(cls.me, cls.other)
+
+    def setUp(self):
+        super().setUp()
+        user_buckets.clear()
+
+    def _communicator(self, user, application=None):
+        communicator = WebsocketCommunicator(application or ChatConsumer.as_asgi(), f'/ws/chat/{self.room.id}/')
+        communicator.scope['user'] = user
+        communicator.scope['url_route'] = {'kwargs': {'room_id': str(self.room.id)}}
+        return communicator
+
+    @staticmethod
+    def sample(metric, **labels):
+        return metric._values.get(metric._key(labels), 0)
+
+    def test_connection_and_user_rate_limits(self):
+        throttled = self.sample(CHAT_THROTTLED, scope='connection'), self.sample(CHAT_THROTTLED, scope='user')
+
+        async def run():
+            first = self._communicator(self.me)
+            await first.connect()
+            await first.receive_json_from()  # chat_history
+            for i in range(5):
+                await first.send_json_to({'message': f'first {i}'})
+            first_frames = [await first.receive_json_from() for _ in range(7)]  # 메시지/저장 알림 3쌍 + 오류 1
+            self.assertTrue(await first.receive_nothing())
+
+            # 같은 사용자의 다른 연결은 사용자 버킷의 남은 2개만 쓸 수 있다
+            second = self._communicator(self.me)
+            await second.connect()
+            await second.receive_json_from()
+            for i in range(3):
+                await second.send_json_to({'message': f'second {i}'})
+            second_frames = [await second.receive_json_from() for _ in range(5)]
+            await first.disconnect()
+            await second.disconnect()
+            return first_frames, second_frames
+
+        first_frames, second_frames = async_to_sync(run)()
+        errors = [frame for frame in first_frames + second_frames if frame['type'] == 'error']
+        self.assertEqual(errors, [{'type': 'error', 'error': 'rate limited'}] * 2)
+        self.assertEqual(Message.objects.filter(room=self.room).count(), 5)
+        self.assertEqual(self.sample(CHAT_THROTTLED, scope='connection') - throttled[0], 2)
+        self.assertEqual(self.sample(CHAT_THROTTLED, scope='user') - throttled[1], 1)
+
+    def test_invalid_and_oversized_frames(self):
+        dropped = self.sample(CHAT_DROPPED, reason='invalid'), self.sample(CHAT_DROPPED, reason='too_large')
+
+        async def run():
+            communicator = self._communicator(self.me)
+            await communicator.connect()
+            await communicator.receive_json_from()
+            await communicator.send_to(text_data='not json')
+            invalid = await communicator.receive_json_from()
+            await communicator.send_json_to({'message': 'x' * 21})
+            too_long = await communicator.receive_json_from()
+            await communicator.send_to(text_data=json.dumps({'message': 'x' * 300}))
+            closed = await communicator.receive_output()
+            await communicator.wait()
+            return invalid, too_long, closed
+
+        invalid, too_long, closed = async_to_sync(run)()
+        self.assertEqual(invalid, {'type': 'error', 'error': 'invalid frame'})
+        self.assertEqual(too_long, {'type': 'error', 'error': 'message too long'})
+        self.assertEqual(closed, {'type': 'websocket.close', 'code': 1009})
+        self.assertFalse(Message.objects.exists())
+        self.assertEqual(self.sample(CHAT_DROPPED, reason='invalid') - dropped[0], 1)
+        self.assertEqual(self.sample(CHAT_DROPPED, reason='too_large') - dropped[1], 2)
+
+    @override_settings(CHAT_SEND_WINDOW=3, CHAT_CONNECTION_BURST=10, CHAT_USER_BURST=10)
+    def test_slow_consumer_is_closed(self):
+        dropped = self.sample(CHAT_DROPPED, reason='slow_consumer')
+
+        async def run():
+            # 테스트 통신기는 daphne 처럼 send 를 기다리게 하지 않고 쌓아 두므로, 받았다고 알리지(ack) 않는 쪽만 끊긴다
+            slow = self._communicator(self.me)
+            await slow.connect()
+            sender = self._communicator(self.other)
+            await sender.connect()
+            await sender.receive_json_from()
+            received = 1
+            for i in range(4):
+                await sender.send_json_to({'message': f'message {i}'})
+                for _ in range(2):  # chat_message, chat_persisted
+                    await sender.receive_json_from()
+                received += 2
+                await sender.send_json_to({'command': 'ack', 'received': received})
+
+            outputs = [await slow.receive_output()]
+            while outputs[-1]['type'] != 'websocket.close':
+                outputs.append(await slow.receive_output())
+            await sender.send_json_to({'message': 'still open'})
+            still_open = await sender.receive_json_from()
+            await sender.disconnect()
+            await slow.disconnect()
+            return outputs, still_open
+
+        outputs, still_open = async_to_sync(run)()
+        self.assertEqual(len(outputs), 4)  # 알리지 않은 프레임 3개 뒤에 끊는다
+        self.assertEqual(outputs[-1], {'type': 'websocket.close', 'code': 1013})
+        self.assertEqual(still_open['text'], 'still open')
+        self.assertGreater(self.sample(CHAT_DROPPED, reason='slow_consumer'), dropped)
@@ -0,0 +1,65 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    초당 rate 개씩 채워지고 최대 burst 개까지 모이는 토큰 버킷
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now=None):
+        """
+        토큰 하나를 쓰고 True, 남은 토큰이 없으면 False
+        """
+        self._refill(time.monotonic() if now is None else now)
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def full(self, now):
+        self._refill(now)
+        return self.tokens >= self.burst
+
+
+class UserBuckets:
+    """
+    사용자별 토큰 버킷 (프로세스별, 같은 사용자의 여러 연결이 한 버킷을 나눠 쓴다)
+    가득 찬(한동안 쓰지 않은) 버킷은 사용자 수가 PRUNE_SIZE 를 넘을 때 정리한다.
+    """
+    PRUNE_SIZE = 10000
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, user_id, rate, burst):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(user_id)
+            if bucket is None or (bucket.rate, bucket.burst) != (rate, burst):
+                if len(self._buckets) >= self.PRUNE_SIZE:
+                    self._prune(now)
+                bucket = self._buckets[user_id] = TokenBucket(rate, burst)
+            return bucket.take(now)
+
+    def _prune(self, now):
+        for user_id in [user_id for user_id, bucket in self._buckets.items() if bucket.full(now)]:
+            del self._buckets[user_id]
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+user_buckets = UserBuckets()
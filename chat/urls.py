@@ -6,4 +6,5 @@ urlpatterns = [
     path("room/<int:room_id>/", views.chat_room, name="room"),
     path("with/<int:user_id>/", views.chat_with, name="with"),
     path("latest/", views.latest_room, name="latest"),
+    path("inbox/", views.inbox, name="inbox"),
 ]
\ No newline at end of file
@@ -1,8 +1,14 @@
+from datetime import datetime
+
+from django.conf import settings
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import get_user_model
 from django.db.models import Q
+from django.utils import timezone
+from django.utils.text import Truncator
+from pybo.pagination import KeysetPaginator
 from .models import ChatRoom
 
 @login_required
@@ -29,6 +35,42 @@ def latest_room(request):
     partner = room.user2 if room.user1 == request.user else room.user1
     return JsonResponse({"room_id": room.id, "partner": partner.username})
 
+@login_required
+def inbox(request):
+    """
+    내 대화 목록 (최근 활동순, ?cursor=&snapshot= 로 다음 페이지)
+    새 메시지마다 방의 updated_at 이 바뀌므로 목록은 첫 페이지를 읽은 시각(snapshot)의 스냅샷이다.
+    다음 페이지는 그 시각 이후 활동한 방을 빼고 (updated_at, id) 로 이어 가며, 그런 방은 첫 페이지를 다시 읽으면 맨 위에 나온다.
+    상대, 마지막 메시지 미리보기, 안 읽음 여부를 쿼리 한 번으로 가져온다.
+    """
+    try:
+        snapshot = datetime.fromisoformat(request.GET["snapshot"])
+    except (KeyError, ValueError):
+        snapshot = timezone.now()
+    page = KeysetPaginator(
+        ChatRoom.inbox(request.user).filter(updated_at__lte=snapshot),
+        settings.CHAT_INBOX_PAGE_SIZE, date_field="updated_at",
+    ).page(request.GET.get("cursor"))
+
+    rooms = []
+    for room in page:
+        partner = room.partner_of(request.user)
+        last = room.last_message
+        rooms.append({
+            "room_id": room.id,
+            "partner": partner.username,
+            "partner_id": partner.id,
+            "unread": room.unread,
+            "updated_at": room.updated_at.isoformat(),
+            "last_message": {
+                "id": last.id,
+                "sender": last.sender.username,
+                "text": Truncator(last.text).chars(60),
+                "sent_at": last.sent_at.isoformat(),
+            } if last else None,
+        })
+    return JsonResponse({"rooms": rooms, "next": page.older_cursor, "snapshot": snapshot.isoformat()})
+
 @login_required
 def chat_room(request, room_id):
     return render(request, "chat/room.html", {"room_id": room_id})
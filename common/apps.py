@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class CommonConfig(AppConfig):
     name = 'common'
+
+    def ready(self):
+        # 사용자 캐시(common.auth) 무효화 시그널 등록
+        from . import auth  # noqa: F401
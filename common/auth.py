@@ -0,0 +1,110 @@
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.signals import user_logged_out
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+
+# 캐시하는 User 필드 (인증, 권한 확인, 화면 표시용) — 비밀번호 해시는 캐시하지 않는다
+CACHED_USER_FIELDS = ('id', 'username', 'first_name', 'last_name', 'email', 'is_active', 'is_staff', 'is_superuser')
+
+
+def user_cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+def session_hash_cache_key(user_id):
+    return f'auth:user:{user_id}:session_hash'
+
+
+def invalidate_user(user_id):
+    invalidate_users([user_id])
+
+
+def invalidate_users(user_ids):
+    cache.delete_many([key for user_id in user_ids
+                       for key in (user_cache_key(user_id), session_hash_cache_key(user_id))])
+
+
+def _cached_session_auth_hash(user, session_hash):
+    # 이 인스턴스에서 비밀번호를 바꿨으면(set_password 후 update_session_auth_hash) 새 해시로 계산
+    if 'password' in user.__dict__:
+        return type(user).get_session_auth_hash(user)
+    return session_hash
+
+
+def _user_from_cache(fields, session_hash):
+    """
+    캐시한 필드로 User 를 만든다 (나머지 필드는 지연 로딩, save() 는 불러온 필드만 저장)
+    세션 검증용 해시는 비밀번호 없이 계산할 수 없으므로 캐시한 값을 돌려준다.
+    """
+    User = get_user_model()
+    names = [f.attname for f in User._meta.concrete_fields if f.attname in fields]
+    user = User.from_db(DEFAULT_DB_ALIAS, names, [fields[name] for name in names])
+    user.get_session_auth_hash = partial(_cached_session_auth_hash, user, session_hash)
+    return user
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    세션의 사용자 id 로 User 를 찾을 때 캐시를 먼저 보는 인증 백엔드
+    HTTP(AuthenticationMiddleware)와 WebSocket(channels AuthMiddlewareStack) 모두 get_user 를 거치므로
+    세션(cached_db)과 함께 쓰면 평소 요청의 인증 조회는 DB 쿼리 없이 끝난다.
+    캐시에는 CACHED_USER_FIELDS 와 세션 검증 해시(get_session_auth_hash)만 따로 담는다.
+    키는 사용자 id 기준이라 비밀번호 변경이나 비활성화 한 번으로 그 사용자의 모든 세션에 반영된다.
+    User 저장(비밀번호 변경, last_login 포함)/삭제, 인증 필드를 바꾸는 update(), 로그아웃 시 무효화된다.
+    """
+
+    def get_user(self, user_id):
+        key, hash_key = user_cache_key(user_id), session_hash_cache_key(user_id)
+        cached = cache.get_many([key, hash_key])
+        if key in cached and hash_key in cached:
+            user = _user_from_cache(cached[key], cached[hash_key])
+        else:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            cache.set_many({
+                key: {name: getattr(user, name) for name in CACHED_USER_FIELDS},
+                hash_key: user.get_session_auth_hash(),
+            }, settings.AUTH_USER_CACHE_TIMEOUT)
+        return user if self.user_can_authenticate(user) else None
+
+
+class UserQuerySet(QuerySet):
+    """
+    캐시한 필드나 비밀번호를 update() 로 바꾸면(관리자 일괄 작업, bulk_update 포함) 사용자 캐시를 무효화하는 쿼리셋
+    """
+
+    def update(self, **kwargs):
+        if not {'password', *CACHED_USER_FIELDS}.intersection(kwargs):
+            return super().update(**kwargs)
+        user_ids = list(self.values_list('pk', flat=True))
+        rows = super().update(**kwargs)
+        invalidate_users(user_ids)
+        # 커밋 전에 다른 요청이 이전 값을 다시 캐시했을 수 있으므로 커밋 후 한 번 더
+        transaction.on_commit(lambda: invalidate_users(user_ids))
+        return rows
+
+    update.alters_data = True
+
+
+def _invalidate_saved_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+def _invalidate_logged_out_user(sender, request, user, **kwargs):
+    if user is not None:
+        invalidate_user(user.pk)
+
+
+User = get_user_model()
+# User 는 django.contrib.auth 모델이므로 매니저는 그대로 두고(마이그레이션 상태 유지) 쿼리셋 클래스만 바꾼다
+User.objects._queryset_class = UserQuerySet
+post_save.connect(_invalidate_saved_user, sender=User, dispatch_uid='common.auth.invalidate_saved_user')
+post_delete.connect(_invalidate_saved_user, sender=User, dispatch_uid='common.auth.invalidate_deleted_user')
+user_logged_out.connect(_invalidate_logged_out_user, dispatch_uid='common.auth.invalidate_logged_out_user')
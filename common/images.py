@@ -0,0 +1,218 @@
+import base64
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from io import BytesIO
+
+from django.conf import settings
+from django.db.models.signals import pre_save
+
+logger = logging.getLogger(__name__)
+
+# 용도별 파생 이미지 너비(px)와 포맷
+DERIVATIVE_WIDTHS = {
+    'avatar': (32, 64),
+    'content': (400, 800),
+}
+DERIVATIVE_FORMATS = ('webp', 'jpeg')
+EXTENSIONS = {'webp': 'webp', 'jpeg': 'jpg'}
+QUALITY = {'webp': 80, 'jpeg': 85}
+
+# 업로드 디렉터리(upload_to) → 용도
+UPLOAD_KINDS = {
+    'profile_pics': 'avatar',
+    'question_images': 'content',
+}
+
+DERIVATIVE_ROOT = 'thumbs'
+
+
+def image_kind(name):
+    return UPLOAD_KINDS.get(name.split('/', 1)[0])
+
+
+def derivative_name(name, width, fmt):
+    """
+    question_images/ab/cd/<hash>.jpg → thumbs/question_images/ab/cd/<hash>_400.webp
+    원본이 내용 주소 이름이므로 같은 내용의 파생 이미지도 공유된다.
+    """
+    stem = os.path.splitext(name)[0]
+    return f'{DERIVATIVE_ROOT}/{stem}_{width}.{EXTENSIONS[fmt]}'
+
+
+def derivative_names(name, kind=None):
+    kind = kind or image_kind(name)
+    return [
+        derivative_name(name, width, fmt)
+        for width in DERIVATIVE_WIDTHS.get(kind, ()) for fmt in DERIVATIVE_FORMATS
+    ]
+
+
+def render_derivative(source_path, target_path, kind, width, fmt):
+    """
+    원본 하나에서 파생 이미지 하나 생성 (프로세스 풀에서 실행되므로 Django 에 의존하지 않는다)
+    아바타는 정사각형으로 잘라내고, 본문 이미지는 비율을 유지해 너비만 맞춘다. 확대는 하지 않는다.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+        if kind == 'avatar':
+            size = min(width, image.width, image.height)
+            image = ImageOps.fit(image, (size, size), Image.LANCZOS)
+        elif image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+
+        if fmt == 'jpeg' and image.mode == 'RGBA':
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        tmp_path = f'{target_path}.{os.getpid()}.tmp'
+        image.save(tmp_path, fmt.upper(), quality=QUALITY[fmt], optimize=fmt == 'jpeg')
+        os.replace(tmp_path, target_path)  # 부분적으로 쓰인 파일이 보이지 않도록
+    return target_path
+
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        # 스레드가 여러 개인 서버 프로세스(daphne)를 fork 하지 않도록 forkserver(없으면 spawn)로 워커를 띄운다
+        method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        _executor = ProcessPoolExecutor(max_workers=settings.IMAGE_PROCESS_WORKERS,
+                                        mp_context=multiprocessing.get_context(method))
+    return _executor
+
+
+def _log_failure(name):
+    def callback(future):
+        if future.exception() is not None:
+            logger.warning('thumbnail failed for %s: %s', name, future.exception())
+    return callback
+
+
+def generate_derivatives(name, force=False, background=False):
+    """
+    원본 name 의 파생 이미지를 모두 생성하고 생성한(background 이면 맡긴) 개수 반환
+    background=True 이면 프로세스 풀에 맡기고 기다리지 않는다 (업로드 요청용, 생성 전에는
+    responsive_image 가 원본을 보여준다). IMAGE_PROCESS_WORKERS 가 0 이면 현재 프로세스에서 바로 처리한다.
+    """
+    kind = image_kind(name)
+    if kind is None:
+        return 0
+
+    source_path = os.path.join(settings.MEDIA_ROOT, name)
+    jobs = []
+    for width in DERIVATIVE_WIDTHS[kind]:
+        for fmt in DERIVATIVE_FORMATS:
+            target_path = os.path.join(settings.MEDIA_ROOT, derivative_name(name, width, fmt))
+            if force or not os.path.exists(target_path):
+                jobs.append((source_path, target_path, kind, width, fmt))
+
+    if settings.IMAGE_PROCESS_WORKERS <= 0:
+        try:
+            for job in jobs:
+                render_derivative(*job)
+        except Exception as e:
+            logger.warning('thumbnail failed for %s: %s', name, e)
+            return 0
+        return len(jobs)
+
+    futures = [get_executor().submit(render_derivative, *job) for job in jobs]
+    for future in futures:
+        future.add_done_callback(_log_failure(name))
+    if background:
+        return len(futures)
+    wait(futures)
+    return sum(1 for future in futures if future.exception() is None)
+
+
+def delete_derivatives(name):
+    for derivative in derivative_names(name):
+        path = os.path.join(settings.MEDIA_ROOT, derivative)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# 업로드 시 계산해 모델에 저장하는 이미지 메타데이터 (<prefix>_width/_height/_bytes/_color/_placeholder)
+PLACEHOLDER_WIDTH = 16
+
+
+def extract_metadata(file):
+    """
+    이미지 파일에서 크기, 바이트 수, 대표 색(#rrggbb), 저화질 미리보기(base64 data URI) 추출
+    """
+    from PIL import Image, ImageOps
+
+    file.seek(0)
+    with Image.open(file) as image:
+        image = ImageOps.exif_transpose(image)
+        width, height = image.size
+        image = image.convert('RGB')
+        image.thumbnail((64, 64))
+
+        # 5색으로 줄였을 때 가장 많이 쓰인 색
+        quantized = image.quantize(colors=5)
+        palette = quantized.getpalette()
+        _, index = max(quantized.getcolors())
+        color = '#{:02x}{:02x}{:02x}'.format(*palette[index * 3:index * 3 + 3])
+
+        placeholder = image.resize(
+            (PLACEHOLDER_WIDTH, max(1, round(PLACEHOLDER_WIDTH * height / width))), Image.BILINEAR
+        )
+        buffer = BytesIO()
+        placeholder.save(buffer, 'JPEG', quality=40)
+    file.seek(0)
+    return {
+        'width': width,
+        'height': height,
+        'bytes': file.size,
+        'color': color,
+        'placeholder': 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode(),
+    }
+
+
+# (모델 label, 필드 이름) → 메타데이터 필드 접두어
+METADATA_PREFIXES = {}
+
+
+def metadata_prefix(field_file):
+    return METADATA_PREFIXES.get((field_file.instance._meta.label, field_file.field.name))
+
+
+def apply_metadata(instance, prefix, metadata):
+    for key in ('width', 'height', 'bytes', 'color', 'placeholder'):
+        default = None if key in ('width', 'height', 'bytes') else ''
+        setattr(instance, f'{prefix}_{key}', metadata.get(key, default) if metadata else default)
+
+
+def track_image_metadata(model, field_name, prefix):
+    """
+    모델 저장 시 새로 올라온(또는 메타데이터가 없는) 이미지의 메타데이터를 채운다
+    너비/높이는 ImageField 의 width_field/height_field 와 같은 컬럼을 사용한다.
+    """
+    METADATA_PREFIXES[(model._meta.label, field_name)] = prefix
+
+    def fill_metadata(sender, instance, **kwargs):
+        field_file = getattr(instance, field_name)
+        if not field_file:
+            apply_metadata(instance, prefix, None)
+            return
+        if field_file._committed and getattr(instance, f'{prefix}_bytes') is not None:
+            return
+        try:
+            apply_metadata(instance, prefix, extract_metadata(field_file))
+        except Exception as e:
+            logger.warning('image metadata failed for %s: %s', field_file.name, e)
+        finally:
+            if field_file._committed:
+                field_file.close()
+
+    pre_save.connect(fill_metadata, sender=model, weak=False, dispatch_uid=f'{model._meta.label}.{field_name}.metadata')
@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from common.images import METADATA_PREFIXES, extract_metadata, generate_derivatives, image_kind
+from common.storage import TRACKED_FIELDS
+
+
+class Command(BaseCommand):
+    help = 'Generate missing thumbnails (avatar 32/64, content 400/800, WebP and JPEG) and image metadata for existing media'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate thumbnails even if they already exist'
+        )
+
+    def handle(self, *args, **options):
+        names = set()
+        for model, field_name in TRACKED_FIELDS:
+            names.update(
+                model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+                .values_list(field_name, flat=True).distinct()
+            )
+        names = sorted(name for name in names if image_kind(name))
+
+        self.stdout.write(
+            f'Checking {len(names)} images with {settings.IMAGE_PROCESS_WORKERS} worker processes...'
+        )
+        created = 0
+        for i, name in enumerate(names, 1):
+            created += generate_derivatives(name, force=options['force'])
+            if i % 50 == 0:
+                self.stdout.write(f'{i}/{len(names)} images processed')
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully generated {created} thumbnails.'))
+
+        filled = 0
+        for model, field_name in TRACKED_FIELDS:
+            prefix = METADATA_PREFIXES.get((model._meta.label, field_name))
+            if prefix is None:
+                continue
+            storage = model._meta.get_field(field_name).storage
+            rows = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+            if not options['force']:
+                rows = rows.filter(**{f'{prefix}_placeholder': ''})
+            # 인스턴스를 만들면 크기가 비어 있는 ImageField 가 파일을 열려고 하므로(없으면 실패) 값만 조회
+            for pk, name in rows.values_list('pk', field_name).iterator():
+                try:
+                    with storage.open(name, 'rb') as image_file:
+                        metadata = extract_metadata(image_file)
+                except Exception as e:
+                    self.stdout.write(self.style.WARNING(f'Skipped {name}: {e}'))
+                    continue
+                model.objects.filter(pk=pk).update(**{f'{prefix}_{key}': value for key, value in metadata.items()})
+                filled += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully filled metadata for {filled} images.'))
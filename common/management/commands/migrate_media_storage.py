@@ -0,0 +1,67 @@
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from common.storage import TRACKED_FIELDS, content_hash, is_content_addressed
+
+
+class Command(BaseCommand):
+    help = 'Move existing question images and profile pictures into content-addressed storage'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many files would be moved and deduplicated'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        legacy_names = set()
+        migrated = missing = 0
+        digests = set()
+
+        for model, field_name in TRACKED_FIELDS:
+            field = model._meta.get_field(field_name)
+            storage = field.storage
+            # 해시 이름이 아닌 이전 방식 파일을 참조하는 행
+            rows = (model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+                    .values_list('pk', field_name))
+            rows = [(pk, name) for pk, name in rows if not is_content_addressed(name)]
+            self.stdout.write(f'{model._meta.label}.{field_name}: {len(rows)} rows to migrate...')
+
+            for pk, name in rows:
+                if not storage.exists(name):
+                    missing += 1
+                    self.stdout.write(self.style.WARNING(f'Missing file for {model._meta.label} {pk}: {name}'))
+                    continue
+
+                with storage.open(name, 'rb') as legacy_file:
+                    if dry_run:
+                        digests.add(content_hash(File(legacy_file)))
+                    else:
+                        # (처음 보는 내용이면) 해시 경로에 저장, 행 갱신과 참조 수 증가는 한 트랜잭션으로
+                        new_name = storage.save(name, File(legacy_file))
+                        with transaction.atomic():
+                            model.objects.filter(pk=pk).update(**{field_name: new_name})
+                            storage.acquire(new_name)
+                legacy_names.add((storage.location, name))
+                migrated += 1
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING(
+                f'Would migrate {migrated} rows into {len(digests)} unique files ({missing} missing).'
+            ))
+            return
+
+        # 모든 행이 새 이름을 가리키게 된 뒤 이전 파일 삭제 (참조 수와 무관하게 직접 삭제)
+        for location, name in legacy_names:
+            FileSystemStorage(location=location).delete(name)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully migrated {migrated} rows and removed {len(legacy_names)} legacy files ({missing} missing).'
+        ))
+        # 참조가 끊긴 채 남은 파일(행 저장 실패, 마지막 참조 해제) 정리
+        call_command('sweep_media', stdout=self.stdout)
@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from common.storage import UNREFERENCED_GRACE, media_storage
+
+
+class Command(BaseCommand):
+    help = 'Delete content-addressed media files that have had no references for longer than the grace period'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace',
+            type=int,
+            default=int(UNREFERENCED_GRACE.total_seconds()),
+            help='Seconds a file must stay unreferenced before it is deleted'
+        )
+
+    def handle(self, *args, **options):
+        removed = media_storage().sweep(timedelta(seconds=options['grace']))
+        self.stdout.write(self.style.SUCCESS(f'Removed {removed} unreferenced files.'))
@@ -0,0 +1,145 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+from .exceptions import PermissionDeniedException
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+# 내용 주소 원본(<hash>.ext)과 그 썸네일(<hash>_<width>.ext)은 내용이 바뀌지 않는다
+IMMUTABLE_NAME = re.compile(r'(^|/)([0-9a-f]{2})/([0-9a-f]{2})/\2\3[0-9a-f]{60}(_\d+)?(\.\w+)?$')
+
+
+def check_media_access(request, path):
+    """
+    MEDIA_PUBLIC_PREFIXES 아래 파일은 누구나, 그 외에는 스태프만 접근 가능
+    path 는 MEDIA_ROOT 기준으로 정규화된 상대 경로여야 한다 ('..' 가 남아 있으면 거부)
+    """
+    if '..' in path.split('/'):
+        raise PermissionDeniedException(f"No access to media file {path}")
+    if path.startswith(tuple(settings.MEDIA_PUBLIC_PREFIXES)):
+        return
+    if not request.user.is_staff:
+        raise PermissionDeniedException(f"No access to media file {path}")
+
+
+def media_etag(path, stat):
+    # 내용 주소 이름은 sha256(+썸네일 너비) 자체가 내용 검증자, 그 외에는 수정 시각 + 크기
+    if IMMUTABLE_NAME.search(path):
+        return '"{}"'.format(os.path.splitext(os.path.basename(path))[0])
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def parse_range(header, size):
+    """
+    단일 바이트 범위만 지원 ((start, end) 또는 범위 밖이면 False, 해석할 수 없으면 None)
+    """
+    match = RANGE_RE.match(header.replace(' ', ''))
+    if not match or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if start == '':
+        # bytes=-N : 마지막 N 바이트
+        length = int(end)
+        return (max(size - length, 0), size - 1) if length and size else False
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+@require_safe
+def serve_media(request, path):
+    """
+    /media/ 파일 제공 (접근 검사, ETag/Last-Modified 조건부 요청, Range, 장기 캐시)
+    MEDIA_ACCEL 이 설정되어 있으면 본문 전송은 프론트 프록시(X-Accel-Redirect/X-Sendfile)에 맡긴다.
+    """
+    # 'question_images/../private/x' 나 밖을 가리키는 심볼릭 링크로 접근 검사를 우회하지 못하도록
+    # 실제 경로로 풀어 MEDIA_ROOT 아래인지 확인하고, 이후에는 정규화한 상대 경로만 쓴다
+    media_root = os.path.realpath(settings.MEDIA_ROOT)
+    full_path = os.path.realpath(os.path.join(media_root, path.lstrip('/')))
+    if full_path == media_root or os.path.commonpath((media_root, full_path)) != media_root:
+        raise Http404("Invalid media path")
+    path = os.path.relpath(full_path, media_root).replace(os.sep, '/')
+    try:
+        check_media_access(request, path)
+    except PermissionDeniedException:
+        return HttpResponse(status=403)
+    try:
+        stat = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise Http404("Media file not found")
+    if not os.path.isfile(full_path):
+        raise Http404("Media file not found")
+
+    etag = media_etag(path, stat)
+    last_modified = int(stat.st_mtime)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _file_response(request, path, full_path, stat.st_size, etag)
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    if IMMUTABLE_NAME.search(path):
+        patch_cache_control(response, public=True, max_age=365 * 24 * 60 * 60, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=settings.MEDIA_CACHE_MAX_AGE)
+    return response
+
+
+def _file_response(request, path, full_path, size, etag):
+    content_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+
+    accel = settings.MEDIA_ACCEL
+    if accel == 'x-accel-redirect':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_PREFIX + quote(path)
+        return response
+    if accel == 'x-sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = full_path
+        return response
+
+    byte_range = None
+    range_header = request.headers.get('Range')
+    if_range = request.headers.get('If-Range')
+    # If-Range 가 현재 ETag 와 다르면 전체 파일을 보낸다
+    if range_header and (not if_range or if_range == etag):
+        byte_range = parse_range(range_header, size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+        response['Content-Length'] = str(size)
+    elif byte_range:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            _read_range(full_path, start, end - start + 1), status=206, content_type=content_type
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+    else:
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+    response['Accept-Ranges'] = 'bytes'
+    return response
@@ -0,0 +1,187 @@
+import logging
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.template.backends.django import DjangoTemplates, Template
+
+from .query_budget import QueryRecorder
+
+# 기본 지연시간 버킷(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    """
+    Prometheus 텍스트 형식으로 내보내는 프로세스 단위 메트릭
+    레이블 값 튜플별로 값을 보관한다.
+    """
+    type_name = ''
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _format_labels(self, key, extra=()):
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ''
+        escaped = (
+            '{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for name, value in pairs
+        )
+        return '{' + ','.join(escaped) + '}'
+
+    def samples(self):
+        raise NotImplementedError
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+        lines.extend(self.samples())
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        return [f'{self.name}{self._format_labels(key)} {value}' for key, value in sorted(values.items())]
+
+
+class Gauge(Counter):
+    type_name = 'gauge'
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect_left(self.buckets, value)] += 1
+            self._values[key] = (counts, total + value)
+
+    def samples(self):
+        with self._lock:
+            values = {key: (list(counts), total) for key, (counts, total) in self._values.items()}
+        lines = []
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{self._format_labels(key, [("le", le)])} {cumulative}')
+            lines.append(f'{self.name}_sum{self._format_labels(key)} {total}')
+            lines.append(f'{self.name}_count{self._format_labels(key)} {cumulative}')
+        return lines
+
+
+REGISTRY = []
+
+REQUESTS = Counter(
+    'django_http_requests_total', 'HTTP requests by URL name, method and status.', ('view', 'method', 'status'))
+REQUEST_LATENCY = Histogram(
+    'django_http_request_duration_seconds', 'Total request latency by URL name.', ('view',))
+REQUEST_DB_TIME = Histogram(
+    'django_http_request_db_seconds', 'Time spent executing SQL per request by URL name.', ('view',))
+REQUEST_TEMPLATE_TIME = Histogram(
+    'django_http_request_template_seconds', 'Time spent rendering templates per request (SQL excluded).', ('view',))
+REQUEST_QUERIES = Counter(
+    'django_http_request_db_queries_total', 'SQL queries executed by URL name.', ('view',))
+WEBSOCKET_CONNECTIONS = Counter(
+    'channels_websocket_connections_total', 'WebSocket connection attempts by consumer and outcome.',
+    ('consumer', 'outcome'))
+WEBSOCKET_ACTIVE = Gauge(
+    'channels_websocket_active_connections', 'Currently open WebSocket connections.', ('consumer',))
+WEBSOCKET_MESSAGES = Counter(
+    'channels_websocket_messages_total', 'WebSocket frames by consumer and direction.', ('consumer', 'direction'))
+
+
+def render_metrics():
+    return '\n'.join(metric.render() for metric in REGISTRY) + '\n'
+
+
+# 현재 요청의 템플릿 렌더링 시간 누적 (MetricsMiddleware 가 요청마다 초기화)
+_template_time = ContextVar('template_time', default=None)
+
+
+def start_request_timing():
+    return _template_time.set([0.0])
+
+
+def finish_request_timing(token):
+    timing = _template_time.get()
+    _template_time.reset(token)
+    return timing[0] if timing else 0.0
+
+
+class InstrumentedTemplate(Template):
+    """
+    render() 시간을 현재 요청에 누적 (렌더링 중 지연 실행된 SQL 시간은 제외)
+    """
+
+    def render(self, context=None, request=None):
+        timing = _template_time.get()
+        if timing is None:
+            return super().render(context, request)
+        start = time.perf_counter()
+        with QueryRecorder() as recorder:
+            try:
+                return super().render(context, request)
+            finally:
+                timing[0] += time.perf_counter() - start - recorder.total_time
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """
+    템플릿 렌더링 시간을 측정하는 DjangoTemplates 백엔드 (TEMPLATES BACKEND 로 지정)
+    """
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return InstrumentedTemplate(template.template, self)
+
+
+def log_sampled(logger, event, level=logging.INFO, **fields):
+    """
+    METRICS_LOG_SAMPLE_RATE 비율만큼만 'event key=value ...' 형식으로 로그를 남긴다
+    """
+    if not logger.isEnabledFor(level):
+        return
+    rate = getattr(settings, 'METRICS_LOG_SAMPLE_RATE', 0.01)
+    if rate < 1 and random.random() >= rate:
+        return
+    logger.log(level, '%s %s', event, ' '.join(f'{key}={value}' for key, value in fields.items()))
@@ -0,0 +1,65 @@
+import time
+
+from django.conf import settings
+
+from . import metrics
+from .query_budget import QueryRecorder, check_budget, logger
+
+
+class QueryBudgetMiddleware:
+    """
+    요청별 SQL 개수/시간/중복 SQL 을 기록하고 settings.QUERY_BUDGETS 와 비교
+    QUERY_BUDGET_HEADERS 가 켜져 있으면 응답 헤더로도 내보낸다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+
+        url_name = request.resolver_match.view_name if request.resolver_match else None
+        response.query_stats = recorder
+
+        logger.debug(
+            'query_budget view=%s queries=%d time_ms=%.1f duplicates=%d',
+            url_name, recorder.count, recorder.total_time * 1000, len(recorder.duplicates)
+        )
+        if getattr(settings, 'QUERY_BUDGET_HEADERS', False):
+            response['X-DB-Queries'] = str(recorder.count)
+            response['X-DB-Time-Ms'] = f'{recorder.total_time * 1000:.1f}'
+            response['X-DB-Duplicates'] = str(sum(n - 1 for n in recorder.duplicates.values()))
+        if url_name:
+            check_budget(url_name, recorder)
+        return response
+
+
+class MetricsMiddleware:
+    """
+    URL 이름별 요청 수/지연시간/SQL 시간/템플릿 시간을 common.metrics 에 기록
+    QueryBudgetMiddleware 보다 바깥(앞)에 두어 response.query_stats 를 사용한다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        token = metrics.start_request_timing()
+        try:
+            response = self.get_response(request)
+        finally:
+            template_time = metrics.finish_request_timing(token)
+        duration = time.perf_counter() - start
+
+        match = request.resolver_match
+        view = match.view_name if match else 'unmatched'
+        metrics.REQUESTS.inc(view=view, method=request.method, status=response.status_code)
+        metrics.REQUEST_LATENCY.observe(duration, view=view)
+        metrics.REQUEST_TEMPLATE_TIME.observe(template_time, view=view)
+        recorder = getattr(response, 'query_stats', None)
+        if recorder is not None:
+            metrics.REQUEST_DB_TIME.observe(recorder.total_time, view=view)
+            metrics.REQUEST_QUERIES.inc(recorder.count, view=view)
+        return response
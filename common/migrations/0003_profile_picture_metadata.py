@@ -0,0 +1,78 @@
+# Generated by Django 4.2.21 on 2026-10-18 10:39
+
+import logging
+import os
+
+import common.storage
+from django.conf import settings
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+
+def fill_dimensions(apps, schema_editor):
+    """
+    기존 프로필 사진의 너비/높이/바이트 수 채우기 (헤더만 읽음)
+    width_field 가 비어 있으면 Django 가 행을 불러올 때마다 파일을 열기 때문에 마이그레이션에서 채운다.
+    대표 색과 미리보기는 backfill_images 명령이 채운다.
+    """
+    from PIL import Image
+
+    Model = apps.get_model('common', 'Profile')
+    # 인스턴스를 만들면 ImageField 가 크기를 계산하려고 파일을 열기 때문에 값만 조회
+    rows = Model.objects.exclude(profile_picture='').exclude(profile_picture__isnull=True).values_list('pk', 'profile_picture')
+    for pk, name in rows.iterator():
+        path = os.path.join(settings.MEDIA_ROOT, name)
+        try:
+            with Image.open(path) as image:
+                width, height = image.size
+                # EXIF 회전(5~8)이면 표시 크기는 가로/세로가 바뀐다
+                if image.getexif().get(0x0112) in (5, 6, 7, 8):
+                    width, height = height, width
+            size = os.path.getsize(path)
+        except (OSError, SyntaxError) as e:
+            # 미디어가 마운트되지 않은 환경(CI, 새 컨테이너)일 수 있으므로 참조는 그대로 두고 backfill_images 에 맡긴다
+            logger.warning('Skipped %s: %s (run backfill_images once media is available)', name, e)
+            continue
+        Model.objects.filter(pk=pk).update(picture_width=width, picture_height=height, picture_bytes=size)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_mediablob_alter_profile_profile_picture'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='picture_bytes',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='picture_color',
+            field=models.CharField(blank=True, editable=False, max_length=7),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='picture_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='picture_placeholder',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='picture_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='profile_picture',
+            field=models.ImageField(blank=True, height_field='picture_height', null=True, storage=common.storage.media_storage, upload_to='profile_pics/', width_field='picture_width'),
+        ),
+        migrations.RunPython(fill_dimensions, migrations.RunPython.noop),
+    ]
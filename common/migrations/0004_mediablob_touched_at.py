@@ -0,0 +1,19 @@
+# Generated by Django 4.2.21 on 2026-10-18 11:39
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0003_profile_picture_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediablob',
+            name='touched_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
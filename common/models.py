@@ -2,15 +2,43 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
+
+from .images import track_image_metadata
+from .storage import media_storage, track_references
 
 class Profile(models.Model):
 
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
-    profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True)
+    profile_picture = models.ImageField(upload_to='profile_pics/', storage=media_storage, null=True, blank=True,
+                                        width_field='picture_width', height_field='picture_height')
+    # 업로드 시 계산되는 이미지 메타데이터
+    picture_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    picture_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    picture_bytes = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    picture_color = models.CharField(max_length=7, blank=True, editable=False)
+    picture_placeholder = models.TextField(blank=True, editable=False)
 
     def __str__(self):
         return f'{self.user.username}의 프로필'
 
+class MediaBlob(models.Model):
+    """
+    내용 주소 스토리지(common.storage)에 저장된 파일과 참조 수
+    """
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField(default=0)
+    refcount = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # 마지막 업로드/참조 해제 시각 (sweep 유예 시간 기준)
+    touched_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f'{self.name} ({self.refcount})'
+
+track_references(Profile, 'profile_picture')
+track_image_metadata(Profile, 'profile_picture', 'picture')
+
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
 
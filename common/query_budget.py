@@ -0,0 +1,76 @@
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class QueryRecorder:
+    """
+    블록 안에서 실행된 SQL 개수, 총 시간, 중복 SQL 을 기록
+    모든 DB 연결에 execute_wrapper 를 설치한다.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self._stack = None
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def total_time(self):
+        return sum(duration for _, duration in self.queries)
+
+    @property
+    def duplicates(self):
+        # 같은 SQL(파라미터 제외)이 두 번 이상 실행된 경우 → N+1 의심
+        counts = Counter(sql for sql, _ in self.queries)
+        return {sql: n for sql, n in counts.items() if n > 1}
+
+
+def get_budget(url_name):
+    return getattr(settings, 'QUERY_BUDGETS', {}).get(url_name)
+
+
+def check_budget(url_name, recorder):
+    """
+    예산 초과 시 경고 로그, QUERY_BUDGET_RAISE 설정이 켜져 있으면 예외 발생
+    """
+    budget = get_budget(url_name)
+    if budget is None or recorder.count <= budget:
+        return True
+
+    message = (
+        f"{url_name} ran {recorder.count} queries (budget {budget})"
+        + ''.join(f"\n  {n}x {sql}" for sql, n in recorder.duplicates.items())
+    )
+    logger.warning(message)
+    if getattr(settings, 'QUERY_BUDGET_RAISE', False):
+        raise QueryBudgetExceeded(message)
+    return False
@@ -1,6 +1,7 @@
 
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from .exceptions import ValidationException, AuthenticationException, ResourceNotFoundException
@@ -47,6 +48,7 @@ class UserService:
         if not profile_form.is_valid():
             raise ValidationException("Invalid profile data")
 
-        # Save the profile
-        profile = profile_form.save()
+        # Save the profile (행 저장과 프로필 사진 참조 수 증가를 한 트랜잭션으로)
+        with transaction.atomic():
+            profile = profile_form.save()
         return profile
@@ -0,0 +1,208 @@
+import hashlib
+import os
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from . import images
+
+
+# <업로드 디렉터리>/ab/cd/<sha256>.<확장자>
+CONTENT_ADDRESSED_NAME = re.compile(r'(^|/)([0-9a-f]{2})/([0-9a-f]{2})/\2\3[0-9a-f]{60}(\.\w+)?$')
+
+# 참조 수가 0 이 된 파일을 sweep 이 지우기 전까지의 유예 시간 (업로드 후 행이 저장되기 전에 지우지 않도록)
+UNREFERENCED_GRACE = timedelta(hours=1)
+
+
+def is_content_addressed(name):
+    return bool(name and CONTENT_ADDRESSED_NAME.search(name))
+
+
+def content_hash(content):
+    sha256 = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        sha256.update(chunk)
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return sha256.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    내용 해시(sha256)로 파일을 저장하는 스토리지
+    같은 내용의 업로드는 하나의 파일을 공유하고, common.MediaBlob 의 참조 수가 0 인 채로 유예 시간이 지난 파일만
+    sweep 에서 실제로 삭제한다.
+    참조 수는 파일을 가리키는 행이 저장될 때(track_references) 같은 트랜잭션에서 올린다.
+    """
+
+    def content_name(self, name, content):
+        digest = content_hash(content)
+        directory = os.path.dirname(name)
+        extension = os.path.splitext(name)[1].lower()
+        return os.path.join(directory, digest[:2], digest[2:4], digest + extension).replace('\\', '/')
+
+    def _save(self, name, content):
+        from .models import MediaBlob
+
+        target = self.content_name(name, content)
+        with transaction.atomic():
+            # 참조 수는 올리지 않는다 (행 저장이 실패하면 참조가 남으므로 acquire 에서)
+            blob, created = MediaBlob.objects.get_or_create(name=target, defaults={'size': content.size})
+            # touched_at 갱신으로 행을 잠근 채 파일을 확인/저장 → sweep 이 같은 파일을 지우는 것과 겹치지 않는다
+            # (sweep 이 먼저 행을 지웠다면 파일도 이미 지워졌으므로 아래에서 다시 쓰고, 행은 acquire 가 만든다)
+            MediaBlob.objects.filter(pk=blob.pk).update(touched_at=timezone.now())
+
+            if not self.exists(target):
+                saved = super()._save(target, content)
+                if saved != target:
+                    # 다른 프로세스가 같은 내용을 동시에 저장한 경우 → 중복본 제거
+                    super().delete(saved)
+                else:
+                    # 처음 저장된 내용이면 썸네일 생성 (중복 업로드는 기존 파생 이미지를 공유)
+                    images.generate_derivatives(target, background=True)
+        return target
+
+    def acquire(self, name):
+        """
+        name 파일을 가리키는 행이 하나 늘었음을 기록 (호출한 쪽의 트랜잭션 안에서)
+        """
+        from .models import MediaBlob
+
+        if not name:
+            return
+        with transaction.atomic():
+            blob, created = MediaBlob.objects.get_or_create(name=name)
+            MediaBlob.objects.filter(pk=blob.pk).update(refcount=F('refcount') + 1)
+
+    def delete(self, name):
+        """
+        참조 하나를 해제한다
+        추적되지 않는(이전 방식) 파일은 바로 삭제하고, 참조 수가 0 이 된 파일은 sweep 이 유예 시간 뒤 삭제한다.
+        """
+        from .models import MediaBlob
+
+        if not name:
+            return
+        released = MediaBlob.objects.filter(name=name, refcount__gt=0).update(
+            refcount=F('refcount') - 1, touched_at=timezone.now()
+        )
+        if not released and not is_content_addressed(name):
+            super().delete(name)
+            images.delete_derivatives(name)
+
+    def sweep(self, grace=UNREFERENCED_GRACE):
+        """
+        참조 수가 0 인 채로 grace 이상 지난 파일 삭제 (마지막 참조가 해제된 파일, 행 저장이 실패해 남은 업로드)
+        행을 잠근 채 조건을 다시 확인하고 지우므로, 같은 내용을 다시 올리는 _save 와 겹치지 않는다.
+        """
+        from .models import MediaBlob
+
+        cutoff = timezone.now() - grace
+        self._adopt_orphans(cutoff)
+        removed = 0
+        for pk in list(MediaBlob.objects.filter(refcount=0, touched_at__lte=cutoff).values_list('pk', flat=True)):
+            with transaction.atomic():
+                blob = MediaBlob.objects.select_for_update().filter(pk=pk, refcount=0, touched_at__lte=cutoff).first()
+                if blob is None:
+                    continue
+                super().delete(blob.name)
+                images.delete_derivatives(blob.name)
+                blob.delete()
+            removed += 1
+        return removed
+
+    def _adopt_orphans(self, cutoff):
+        """
+        MediaBlob 행 없이 남은 파일(업로드한 트랜잭션이 롤백된 경우)에 참조 수 0 인 행을 만든다
+        cutoff 이전에 쓰인 파일만 대상으로 하고, 삭제는 다른 행과 같이 sweep 의 잠금 경로로 한다.
+        """
+        from .models import MediaBlob
+
+        if not os.path.isdir(self.location):
+            return
+        for root, dirs, files in os.walk(self.location):
+            if root == self.location:
+                # 파생 이미지는 원본과 함께 지운다
+                dirs[:] = [d for d in dirs if d != images.DERIVATIVE_ROOT]
+            for filename in files:
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, self.location).replace(os.sep, '/')
+                if not is_content_addressed(name):
+                    continue
+                modified = datetime.fromtimestamp(os.path.getmtime(path), tz=dt_timezone.utc)
+                if modified <= cutoff:
+                    MediaBlob.objects.get_or_create(
+                        name=name, defaults={'size': os.path.getsize(path), 'touched_at': modified}
+                    )
+
+
+_media_storage = ContentAddressedStorage()
+
+
+def media_storage():
+    # FileField(storage=...) 용 callable (마이그레이션에 스토리지 인스턴스가 직렬화되지 않도록)
+    return _media_storage
+
+
+def _file_name(value):
+    return getattr(value, 'name', value) or ''
+
+
+# track_references 로 등록된 (모델, 필드 이름) 목록 (migrate_media_storage 명령에서 사용)
+TRACKED_FIELDS = []
+
+
+def previous_name(instance, field_name):
+    """
+    마지막 저장 직전 DB 에 있던 파일 이름 (track_references 로 등록된 필드, 저장 전이면 None)
+    """
+    return instance.__dict__.get(f'_original_{field_name}')
+
+
+def track_references(model, field_name):
+    """
+    모델 파일 필드의 참조 수를 스토리지에 알린다
+    행 저장 시 새 파일의 참조를 올리고(같은 트랜잭션), 교체/비운 파일과 삭제된 행의 파일은 커밋 후 해제한다.
+    이전 이름은 저장할 때만 DB 에서 읽는다 (행을 읽을 때마다 추적하지 않도록).
+    """
+    TRACKED_FIELDS.append((model, field_name))
+    attname = model._meta.get_field(field_name).attname
+    original = f'_original_{attname}'
+
+    def remember(sender, instance, update_fields=None, **kwargs):
+        # 지연 로딩 필드를 건드리지 않도록 __dict__ 에서 직접 읽는다
+        current = _file_name(instance.__dict__.get(attname))
+        if instance._state.adding:
+            old_name = ''
+        elif update_fields is not None and attname not in update_fields and field_name not in update_fields:
+            old_name = current
+        else:
+            old_name = _file_name(model.objects.filter(pk=instance.pk).values_list(attname, flat=True).first())
+        instance.__dict__[original] = old_name
+
+    def update_references(sender, instance, **kwargs):
+        old_name = instance.__dict__.get(original, '')
+        new_name = _file_name(instance.__dict__.get(attname))
+        if old_name == new_name:
+            return
+        if new_name:
+            media_storage().acquire(new_name)
+        if old_name:
+            transaction.on_commit(lambda: media_storage().delete(old_name))
+
+    def release_deleted(sender, instance, **kwargs):
+        name = _file_name(instance.__dict__.get(attname))
+        if name:
+            transaction.on_commit(lambda: media_storage().delete(name))
+
+    uid = f'{model._meta.label}.{field_name}'
+    pre_save.connect(remember, sender=model, weak=False, dispatch_uid=f'{uid}.remember')
+    post_save.connect(update_references, sender=model, weak=False, dispatch_uid=f'{uid}.update_references')
+    post_delete.connect(release_deleted, sender=model, weak=False, dispatch_uid=f'{uid}.release_deleted')
@@ -0,0 +1,69 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from ..images import DERIVATIVE_WIDTHS, derivative_name, image_kind, metadata_prefix
+
+register = template.Library()
+
+
+def _derivative_url(image, width, fmt):
+    return image.storage.url(derivative_name(image.name, width, fmt))
+
+
+@register.simple_tag
+def image_srcset(image, fmt='webp'):
+    """
+    파생 이미지 srcset 문자열 ("...400.webp 400w, ...800.webp 800w")
+    """
+    if not image:
+        return ''
+    widths = DERIVATIVE_WIDTHS.get(image_kind(image.name), ())
+    return ', '.join(f'{_derivative_url(image, width, fmt)} {width}w' for width in widths)
+
+
+def _with_metadata(image, attrs):
+    """
+    모델에 저장된 메타데이터로 width/height 와 미리보기 배경을 채운다 (파일 I/O 없음)
+    """
+    prefix = metadata_prefix(image)
+    if prefix is None:
+        return attrs
+    instance = image.instance
+    attrs = dict(attrs)
+    width, height = getattr(instance, f'{prefix}_width'), getattr(instance, f'{prefix}_height')
+    if width and height and 'width' not in attrs and 'height' not in attrs:
+        attrs['width'], attrs['height'] = width, height
+
+    color, placeholder = getattr(instance, f'{prefix}_color'), getattr(instance, f'{prefix}_placeholder')
+    if color or placeholder:
+        background = f"background: {color or 'transparent'}"
+        if placeholder:
+            background += f" url('{placeholder}') center / cover no-repeat"
+        attrs['style'] = f"{background}; {attrs.get('style', '')}".strip()
+    return attrs
+
+
+@register.simple_tag
+def responsive_image(image, sizes, **attrs):
+    """
+    WebP/JPEG 파생 이미지를 고르는 <picture> 출력
+    저장된 메타데이터가 있으면 크기와 미리보기(LQIP)를 함께 넣어 로딩 중 레이아웃이 밀리지 않게 한다.
+    파생 이미지가 아직 없으면(backfill_images 전) 원본으로 대체한다.
+    """
+    if not image:
+        return ''
+    widths = DERIVATIVE_WIDTHS.get(image_kind(image.name))
+    attrs = _with_metadata(image, attrs)
+    attributes = format_html_join(' ', '{}="{}"', ((key.replace('_', '-'), value) for key, value in attrs.items()))
+    if not widths:
+        return format_html('<img src="{}" {}>', image.url, attributes)
+
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" {} loading="lazy" decoding="async" data-original="{}" '
+        'onerror="this.onerror=null;this.srcset=\'\';this.src=this.dataset.original;'
+        'if(this.previousElementSibling){{this.previousElementSibling.remove();}}"></picture>',
+        image_srcset(image, 'webp'), sizes,
+        _derivative_url(image, widths[-1], 'jpeg'), image_srcset(image, 'jpeg'), sizes, attributes,
+        image.url,
+    )
@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+from .query_budget import QueryRecorder, get_budget
+
+
+# 테스트는 Redis 없이 프로세스 메모리 캐시 사용
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+# collectstatic 결과(매니페스트) 없이 {% static %} 이 원래 이름을 쓰는 저장소
+TEST_STATICFILES_STORAGE = {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}
+
+
+class TestRunner(DiscoverRunner):
+    """
+    staticfiles 저장소를 TEST_STATICFILES_STORAGE 로 바꿔 테스트가 STATIC_ROOT 에 의존하지 않게 하고,
+    QUERY_BUDGET_RAISE 를 켜서 모든 테스트의 요청이 QUERY_BUDGETS 를 지키도록 한다.
+    매니페스트 저장소 자체는 StaticFilesTest 가 임시 STATIC_ROOT 에 collectstatic 해서 검사한다.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._static_settings = override_settings(
+            STORAGES={**settings.STORAGES, 'staticfiles': TEST_STATICFILES_STORAGE},
+            QUERY_BUDGET_RAISE=True,
+        )
+        self._static_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._static_settings.disable()
+        super().teardown_test_environment(**kwargs)
+
+
+class QueryBudgetTestMixin:
+    """
+    테스트용 쿼리 예산 검사
+    요청 밖의 코드에도 예산을 적용하고(assertQueryBudget), 응답의 쿼리 수를 직접 확인한다.
+    캐시는 TEST_CACHES 로 바꾸고 테스트마다 비운다.
+    """
+
+    def setUp(self):
+        super().setUp()
+        budget_settings = override_settings(QUERY_BUDGET_RAISE=True, CACHES=TEST_CACHES)
+        budget_settings.enable()
+        self.addCleanup(budget_settings.disable)
+        cache.clear()
+
+    def assertWithinQueryBudget(self, response):
+        url_name = response.resolver_match.view_name
+        budget = get_budget(url_name)
+        self.assertIsNotNone(budget, f"No query budget declared for {url_name}")
+        recorder = response.query_stats
+        self.assertLessEqual(
+            recorder.count, budget,
+            f"{url_name} ran {recorder.count} queries (budget {budget})"
+            + ''.join(f"\n  {n}x {sql}" for sql, n in recorder.duplicates.items())
+        )
+
+    @contextmanager
+    def assertQueryBudget(self, url_name):
+        # 요청이 아닌 코드(서비스, 컨슈머 등)에 예산을 적용할 때 사용
+        budget = get_budget(url_name)
+        self.assertIsNotNone(budget, f"No query budget declared for {url_name}")
+        with QueryRecorder() as recorder:
+            yield recorder
+        self.assertLessEqual(recorder.count, budget, f"{url_name} ran {recorder.count} queries (budget {budget})")
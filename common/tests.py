@@ -1,3 +1,431 @@
-from django.test import TestCase
+import os
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
 
-# Create your tests here.
+from PIL import Image
+
+from asgiref.sync import async_to_sync
+from channels.auth import get_user as get_channels_user
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.cached_db import SessionStore
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.template import Context, Template
+from django.templatetags.static import static
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .auth import CachedModelBackend, user_cache_key
+from . import images
+from .images import derivative_name, derivative_names
+from .models import MediaBlob, Profile
+from .storage import is_content_addressed, media_storage
+from .testing import TEST_CACHES
+from .writebehind import WriteBehindBuffer
+
+
+@override_settings(CACHES=TEST_CACHES, METRICS_TOKEN='secret')
+class MetricsTest(TestCase):
+
+    def test_requires_token_or_staff(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+
+        staff = User.objects.create_user('staff', password='password', is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 200)
+
+    def test_records_request_breakdown(self):
+        self.client.get(reverse('pybo:index'))
+        body = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer secret').content.decode()
+        self.assertIn('django_http_requests_total{view="pybo:index",method="GET",status="200"}', body)
+        self.assertIn('django_http_request_duration_seconds_count{view="pybo:index"}', body)
+        self.assertIn('django_http_request_db_seconds_count{view="pybo:index"}', body)
+        self.assertIn('django_http_request_template_seconds_count{view="pybo:index"}', body)
+
+
+@override_settings(CACHES=TEST_CACHES, IMAGE_PROCESS_WORKERS=0)
+class ContentAddressedStorageTest(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_settings = override_settings(MEDIA_ROOT=media_root.name)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.user = User.objects.create_user('uploader', password='password')
+
+    @staticmethod
+    def image_bytes(color='red', size=(1000, 500)):
+        buffer = BytesIO()
+        Image.new('RGB', size, color).save(buffer, 'PNG')
+        return buffer.getvalue()
+
+    def upload(self, profile, content=None):
+        content = content or self.image_bytes()
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.profile_picture = SimpleUploadedFile('photo.JPG', content)
+            profile.save()
+
+    def test_identical_uploads_share_one_file(self):
+        other = User.objects.create_user('other', password='password')
+        self.upload(self.user.profile)
+        self.upload(other.profile)
+
+        name = self.user.profile.profile_picture.name
+        self.assertTrue(is_content_addressed(name))
+        self.assertTrue(name.startswith('profile_pics/') and name.endswith('.jpg'))
+        self.assertEqual(other.profile.profile_picture.name, name)
+        self.assertEqual(MediaBlob.objects.get(name=name).refcount, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+        self.assertTrue(media_storage().exists(name))
+        self.upload(self.user.profile, self.image_bytes('blue'))
+        # 참조 수가 0 이 돼도 유예 시간 동안은 남아 있다
+        self.assertTrue(media_storage().exists(name))
+        self.assertEqual(MediaBlob.objects.get(name=name).refcount, 0)
+        self.assertEqual(media_storage().sweep(), 0)
+
+        call_command('sweep_media', '--grace', '0', stdout=StringIO())
+        self.assertFalse(media_storage().exists(name))
+        self.assertFalse(MediaBlob.objects.filter(name=name).exists())
+        self.assertTrue(media_storage().exists(self.user.profile.profile_picture.name))
+
+    def test_reupload_during_sweep_keeps_file(self):
+        self.upload(self.user.profile)
+        name = self.user.profile.profile_picture.name
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.profile.profile_picture = None
+            self.user.profile.save()
+        cutoff = MediaBlob.objects.get(name=name).touched_at
+
+        # 같은 내용을 다시 올리면 touched_at 이 갱신돼 sweep 이 지우지 않는다
+        self.upload(self.user.profile)
+        self.assertEqual(media_storage().sweep(timezone.now() - cutoff), 0)
+        self.assertTrue(media_storage().exists(name))
+
+        # sweep 이 먼저 지웠다면 다시 올릴 때 파일을 새로 쓴다
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.profile.profile_picture = None
+            self.user.profile.save()
+        self.assertEqual(media_storage().sweep(timedelta(0)), 1)
+        self.assertFalse(media_storage().exists(name))
+        self.upload(self.user.profile)
+        self.assertTrue(media_storage().exists(name))
+        self.assertEqual(MediaBlob.objects.get(name=name).refcount, 1)
+
+    def test_failed_row_save_does_not_leak_reference(self):
+        duplicate = Profile(user_id=self.user.pk, profile_picture=SimpleUploadedFile('photo.jpg', self.image_bytes()))
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            duplicate.save()  # 사용자당 프로필 하나 → INSERT 실패
+        self.assertFalse(MediaBlob.objects.filter(refcount__gt=0).exists())
+        # 롤백으로 행 없이 남은 업로드는 sweep 이 정리한다
+        orphan = media_storage().content_name('profile_pics/photo.jpg', ContentFile(self.image_bytes()))
+        self.assertTrue(media_storage().exists(orphan))
+        self.assertEqual(media_storage().sweep(), 0)
+        self.assertEqual(media_storage().sweep(timedelta(0)), 1)
+        self.assertFalse(media_storage().exists(orphan))
+
+        # 이미 있는 파일 이름을 다른 행에 지정해도 참조로 센다
+        self.upload(self.user.profile)
+        name = self.user.profile.profile_picture.name
+        other = User.objects.create_user('other', password='password').profile
+        with self.captureOnCommitCallbacks(execute=True):
+            other.profile_picture = name
+            other.save()
+        self.assertEqual(MediaBlob.objects.get(name=name).refcount, 2)
+
+    def test_migrate_command_moves_legacy_files(self):
+        for i, user in enumerate([self.user, User.objects.create_user('other', password='password')]):
+            legacy = FileSystemStorage().save(f'profile_pics/legacy_{i}.jpg', ContentFile(self.image_bytes('green')))
+            Profile.objects.filter(user=user).update(profile_picture=legacy)
+
+        call_command('migrate_media_storage', stdout=StringIO())
+
+        names = set(Profile.objects.values_list('profile_picture', flat=True))
+        self.assertEqual(len(names), 1)
+        name = names.pop()
+        self.assertTrue(is_content_addressed(name))
+        self.assertEqual(MediaBlob.objects.get(name=name).refcount, 2)
+        self.assertFalse(FileSystemStorage().exists('profile_pics/legacy_0.jpg'))
+
+    def test_backfill_keeps_missing_files(self):
+        Profile.objects.filter(user=self.user).update(profile_picture='profile_pics/missing.jpg')
+        present = FileSystemStorage().save('profile_pics/present.png', ContentFile(self.image_bytes('green')))
+        other = User.objects.create_user('other', password='password')
+        Profile.objects.filter(user=other).update(profile_picture=present)
+
+        out = StringIO()
+        call_command('backfill_images', stdout=out)
+
+        self.assertIn('Skipped profile_pics/missing.jpg', out.getvalue())
+        missing = Profile.objects.values_list('profile_picture', 'picture_width').get(user=self.user)
+        self.assertEqual(missing, ('profile_pics/missing.jpg', None))
+        self.assertEqual(Profile.objects.values_list('picture_width', flat=True).get(user=other), 1000)
+
+    def test_upload_generates_thumbnails(self):
+        self.upload(self.user.profile)
+
+        picture = self.user.profile.profile_picture
+        for name in derivative_names(picture.name):
+            self.assertTrue(media_storage().exists(name), name)
+        with Image.open(media_storage().path(derivative_name(picture.name, 64, 'webp'))) as thumb:
+            self.assertEqual(thumb.size, (64, 64))
+
+        html = Template("{% load image_tags %}{% responsive_image picture '20px' alt='x' %}").render(
+            Context({'picture': picture}))
+        self.assertIn('_32.webp 32w', html)
+        self.assertIn('_64.jpg 64w', html)
+
+    @override_settings(IMAGE_PROCESS_WORKERS=1)
+    def test_derivatives_are_generated_in_background(self):
+        self.addCleanup(setattr, images, '_executor', None)
+        images._executor = None
+        executor = images.get_executor()
+        self.assertIn(executor._mp_context.get_start_method(), ('forkserver', 'spawn'))
+
+        name = media_storage().save('profile_pics/photo.png', ContentFile(self.image_bytes('green')))
+        # 업로드(storage.save)는 워커를 기다리지 않으므로 여기서 맡긴 작업이 끝나기를 기다린다
+        executor.shutdown(wait=True)
+        for derivative in derivative_names(name):
+            self.assertTrue(media_storage().exists(derivative), derivative)
+
+    def test_upload_stores_metadata(self):
+        self.upload(self.user.profile, self.image_bytes('blue', (300, 150)))
+        profile = Profile.objects.get(pk=self.user.profile.pk)
+        self.assertEqual((profile.picture_width, profile.picture_height), (300, 150))
+        self.assertEqual(profile.picture_color, '#0000ff')
+        self.assertGreater(profile.picture_bytes, 0)
+        self.assertTrue(profile.picture_placeholder.startswith('data:image/jpeg;base64,'))
+
+        html = Template("{% load image_tags %}{% responsive_image picture '20px' %}").render(
+            Context({'picture': profile.profile_picture}))
+        self.assertIn('width="300" height="150"', html)
+        self.assertIn('background: #0000ff url(', html)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.profile_picture = None
+            profile.save()
+        self.assertEqual((profile.picture_width, profile.picture_bytes, profile.picture_color), (None, None, ''))
+
+
+@override_settings(CACHES=TEST_CACHES, MEDIA_ACCEL='')
+class MediaServeTest(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_settings = override_settings(MEDIA_ROOT=media_root.name)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.name = FileSystemStorage().save('question_images/a.jpg', ContentFile(b'0123456789'))
+        self.url = f'/media/{self.name}'
+
+    def test_full_and_conditional_requests(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), b'0123456789')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('max-age=86400', response['Cache-Control'])
+
+        etag = response['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        last_modified = response['Last-Modified']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+    def test_range_requests(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=2-4')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 2-4/10')
+        self.assertEqual(b''.join(response.streaming_content), b'234')
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-3')
+        self.assertEqual(b''.join(response.streaming_content), b'789')
+        self.assertEqual(self.client.get(self.url, HTTP_RANGE='bytes=20-').status_code, 416)
+        response = self.client.get(self.url, HTTP_RANGE='bytes=2-4', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_access_checks_and_offload(self):
+        FileSystemStorage().save('private/report.txt', ContentFile(b'secret'))
+        self.assertEqual(self.client.get('/media/private/report.txt').status_code, 403)
+        self.assertEqual(self.client.get('/media/../settings.py').status_code, 404)
+        # 공개 경로를 거쳐 비공개 파일로 올라가는 요청
+        self.assertEqual(self.client.get('/media/question_images/../private/report.txt').status_code, 403)
+        self.assertEqual(self.client.get('/media/question_images/%2E%2E/private/report.txt').status_code, 403)
+        self.assertEqual(self.client.get('/media/question_images/../../settings.py').status_code, 404)
+        outside = tempfile.NamedTemporaryFile(suffix='.txt')
+        self.addCleanup(outside.close)
+        os.symlink(outside.name, os.path.join(settings.MEDIA_ROOT, 'question_images', 'link.txt'))
+        self.assertEqual(self.client.get('/media/question_images/link.txt').status_code, 404)
+
+        with override_settings(MEDIA_ACCEL='x-accel-redirect'):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.name}')
+        self.assertEqual(response.content, b'')
+
+    def test_content_addressed_files_are_immutable(self):
+        name = FileSystemStorage().save(f'thumbs/question_images/ab/cd/abcd{"0" * 60}_400.webp', ContentFile(b'x'))
+        response = self.client.get(f'/media/{name}')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['ETag'], f'"abcd{"0" * 60}_400"')
+
+
+@override_settings(CACHES=TEST_CACHES)
+class StaticFilesTest(TestCase):
+
+    def setUp(self):
+        static_root = tempfile.TemporaryDirectory()
+        self.addCleanup(static_root.cleanup)
+        # 테스트 러너가 바꿔 둔 저장소 대신 운영 설정과 같은 매니페스트 저장소로 collectstatic
+        static_settings = override_settings(STATIC_ROOT=static_root.name, STORAGES={
+            **settings.STORAGES,
+            'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+        })
+        static_settings.enable()
+        self.addCleanup(static_settings.disable)
+        call_command('collectstatic', '--noinput', verbosity=0)
+
+    def test_hashed_names_are_compressed_and_immutable(self):
+        url = static('bootstrap.min.css')
+        self.assertRegex(url, r'^/static/bootstrap\.min\.[0-9a-f]{12}\.css$')
+        self.assertTrue(os.path.exists(os.path.join(settings.STATIC_ROOT, url[len(settings.STATIC_URL):] + '.gz')))
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('immutable', response['Cache-Control'])
+
+        response = self.client.get('/static/bootstrap.min.css')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('immutable', response['Cache-Control'])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CachedAuthTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('me', password='password')
+        self.client.login(username='me', password='password')
+
+    def _auth_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('chat:latest'))
+        return response, [q['sql'] for q in queries if 'FROM "django_session"' in q['sql'] or 'FROM "auth_user"' in q['sql']]
+
+    def test_steady_state_has_no_session_or_user_queries(self):
+        self._auth_queries()  # 첫 요청에서 사용자 캐시
+        response, queries = self._auth_queries()
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(queries, [])
+
+    def test_websocket_handshake_uses_same_cache(self):
+        self._auth_queries()
+        scope = {'session': SessionStore(self.client.session.session_key)}
+        with self.assertNumQueries(0):
+            user = async_to_sync(get_channels_user)(scope)
+        self.assertEqual(user, self.user)
+
+    def test_password_change_and_logout_invalidate(self):
+        self._auth_queries()
+        self.user.set_password('changed')
+        self.user.save()
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        # 이전 비밀번호로 만든 세션은 더 이상 유효하지 않다
+        self.assertEqual(self.client.get(reverse('chat:latest')).status_code, 302)
+
+        self.client.login(username='me', password='changed')
+        self._auth_queries()
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+        self.client.logout()
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+    def test_cache_holds_no_password_and_saves_only_loaded_fields(self):
+        self._auth_queries()
+        self.assertNotIn('password', cache.get(user_cache_key(self.user.pk)))
+
+        user = CachedModelBackend().get_user(self.user.pk)
+        user.first_name = 'Kim'
+        user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Kim')
+        self.assertTrue(self.user.check_password('password'))
+
+    def test_update_of_auth_fields_logs_user_out(self):
+        self._auth_queries()
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        self.assertEqual(self.client.get(reverse('chat:latest')).status_code, 302)
+
+        User.objects.filter(pk=self.user.pk).update(is_active=True)
+        self.client.login(username='me', password='password')
+        self._auth_queries()
+        User.objects.filter(pk=self.user.pk).update(password='!')
+        self.assertEqual(self.client.get(reverse('chat:latest')).status_code, 302)
+
+
+class CountingBuffer(WriteBehindBuffer):
+    """
+    키별 합계를 모으는 테스트용 버퍼 (fail 이 남아 있으면 반영 실패)
+    """
+    name = 'counting'
+    interval = 60
+
+    def __init__(self):
+        super().__init__()
+        self.fail = 0
+        self.written = {}
+
+    def add(self, key, amount):
+        with self._lock:
+            self.merge(self._pending, {key: amount})
+        self.recorded()
+
+    def merge(self, pending, batch):
+        for key, amount in batch.items():
+            pending[key] = pending.get(key, 0) + amount
+
+    def write(self, batch):
+        if self.fail:
+            self.fail -= 1
+            raise RuntimeError('database is locked')
+        for key, amount in batch.items():
+            self.written[key] = self.written.get(key, 0) + amount
+
+
+class WriteBehindBufferTest(TestCase):
+
+    def test_failed_flush_is_requeued_and_retried(self):
+        buffer = CountingBuffer()
+        buffer.add('a', 1)
+        buffer.add('b', 2)
+        buffer.fail = 1
+        with self.assertLogs('common.writebehind', 'ERROR'):
+            self.assertFalse(buffer.flush())
+        self.assertEqual(buffer.written, {})
+        self.assertIsNotNone(buffer._timer)  # 재시도 예약
+
+        # 실패한 배치는 그 사이 들어온 쓰기와 합쳐져 다음 반영에 포함된다
+        buffer.add('a', 3)
+        self.assertTrue(buffer.flush())
+        self.assertEqual(buffer.written, {'a': 4, 'b': 2})
+        self.assertIsNone(buffer._timer)
+        self.assertTrue(buffer.flush())  # 빈 대기열
+        self.assertEqual(buffer._failures, 0)
+
+    def test_zero_interval_writes_immediately(self):
+        buffer = CountingBuffer()
+        buffer.interval = 0
+        buffer.add('a', 1)
+        self.assertEqual(buffer.written, {'a': 1})
@@ -6,10 +6,14 @@ from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
 from django.contrib.auth.models import User
 from django.contrib import messages
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
 
 from .forms import UserForm, ProfileForm
 from .services import UserService
 from .exceptions import ValidationException, AuthenticationException, ResourceNotFoundException
+from .metrics import render_metrics
 
 
 class SignupView(View):
@@ -110,3 +114,14 @@ def profile(request, user_id=None):
 def profile_update(request):
     view = ProfileUpdateView.as_view()
     return view(request)
+
+
+def metrics(request):
+    """
+    Prometheus 텍스트 형식 메트릭 (METRICS_TOKEN 베어러 토큰 또는 스태프 사용자만)
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    auth = request.headers.get('Authorization', '')
+    if not (request.user.is_staff or (token and constant_time_compare(auth, f'Bearer {token}'))):
+        return HttpResponse(status=403)
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
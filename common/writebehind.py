@@ -0,0 +1,128 @@
+import atexit
+import logging
+import os
+import signal
+import threading
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# 반영 실패 시 재시도 간격 상한(초)
+MAX_RETRY_DELAY = 30.0
+
+_buffers = []
+
+
+class WriteBehindBuffer:
+    """
+    쓰기를 메모리에 모았다가 interval 초마다 한 번에 반영하는 write-behind 버퍼 (pybo.votes, chat.activity)
+    하위 클래스는 interval, merge(pending, batch), write(batch) 를 구현하고, 대기열(self._pending, dict)을
+    self._lock 안에서 고친 뒤 recorded() 를 호출한다.
+
+    - interval 이 0 이면 바로 반영한다.
+    - 반영에 실패한 배치는 대기열에 다시 합치고 점점 긴 간격(최대 MAX_RETRY_DELAY 초)으로 재시도한다.
+    - 타이머 스레드는 반영 후 자신이 연 DB 연결을 닫는다.
+    - 프로세스 종료 시(atexit, 다른 처리기가 없는 SIGTERM) 남은 쓰기를 반영한다.
+      SIGKILL 이나 비정상 종료 시에는 마지막 interval 초 동안의 쓰기를 잃을 수 있다.
+    """
+    name = 'write-behind'
+
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.RLock()  # SIGTERM 처리기가 잠금을 쥔 스레드에서 flush 할 수 있으므로 재진입 가능
+        self._timer = None
+        self._failures = 0
+        _register(self)
+
+    @property
+    def interval(self):
+        raise NotImplementedError
+
+    def merge(self, pending, batch):
+        """
+        반영하지 못한 batch 를 대기열 pending 에 다시 합친다 (그 사이 새로 들어온 쓰기와 함께)
+        """
+        raise NotImplementedError
+
+    def write(self, batch):
+        raise NotImplementedError
+
+    def recorded(self):
+        if self.interval <= 0:
+            self.flush()
+        else:
+            self._schedule(self.interval)
+
+    def _schedule(self, delay):
+        with self._lock:
+            if self._timer is None:
+                self._timer = threading.Timer(delay, self._run_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _run_timer(self):
+        try:
+            self.flush()
+        finally:
+            # 타이머마다 새 스레드이므로 그 스레드의 DB 연결을 남기지 않는다
+            connection.close()
+
+    def flush(self):
+        """
+        모인 쓰기를 반영하고 성공 여부를 반환 (실패한 배치는 대기열로 되돌리고 재시도를 예약)
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            timer, self._timer = self._timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()  # 타이머 전에 직접 호출된 경우
+        if not batch:
+            return True
+
+        try:
+            self.write(batch)
+        except Exception:
+            with self._lock:
+                self.merge(self._pending, batch)
+                self._failures += 1
+                failures = self._failures
+            delay = min(max(self.interval, 0.1) * 2 ** failures, MAX_RETRY_DELAY)
+            logger.exception('%s flush failed (%d keys, attempt %d), retrying in %.1fs',
+                             self.name, len(batch), failures, delay)
+            self._schedule(delay)
+            return False
+
+        with self._lock:
+            self._failures = 0
+        return True
+
+
+def flush_all():
+    for buffer in list(_buffers):
+        buffer.flush()
+
+
+def _register(buffer):
+    _buffers.append(buffer)
+    if len(_buffers) == 1:
+        atexit.register(flush_all)
+        _install_sigterm_handler()
+
+
+def _install_sigterm_handler():
+    # daphne/uvicorn/gunicorn 은 SIGTERM 을 받아 정상 종료하므로 atexit 이 실행된다.
+    # SIGTERM 이 기본 동작(atexit 없이 즉시 종료)인 프로세스에서만 남은 쓰기를 반영한 뒤 종료한다.
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+        return
+
+    def handle_sigterm(signum, frame):
+        try:
+            flush_all()
+        finally:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
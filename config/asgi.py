@@ -9,14 +9,12 @@ django_asgi = get_asgi_application()
 
 import chat.routing
 
-channels_app = ProtocolTypeRouter(
+# 정적 파일은 Django 미들웨어(WhiteNoise)가 collectstatic 결과에서 제공
+application = ProtocolTypeRouter(
     {
         "http": django_asgi,
         "websocket": AuthMiddlewareStack(
             URLRouter(chat.routing.websocket_urlpatterns)
         ),
     }
-)
-
-from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
-application = ASGIStaticFilesHandler(channels_app)
\ No newline at end of file
+)
\ No newline at end of file
@@ -49,8 +49,84 @@ CHANNEL_LAYERS = {
     },
 }
 
+# 렌더링된 프래그먼트 등 애플리케이션 캐시 (Redis)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv('REDIS_CACHE_URL', 'redis://127.0.0.1:6379/1'),
+    },
+}
+
+# 세션은 캐시(Redis)에서 읽고 DB 에도 기록 (캐시가 비워져도 로그인 유지)
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# 세션 사용자 조회를 캐시하는 인증 백엔드 (common.auth), 사용자 캐시 유지 시간(초)
+# ModelBackend 는 이 설정 이전에 로그인한 세션을 위한 것으로, 세션 만료(SESSION_COOKIE_AGE) 이후 제거해도 된다.
+AUTHENTICATION_BACKENDS = [
+    'common.auth.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+AUTH_USER_CACHE_TIMEOUT = 300
+
+# 질문 상세 프래그먼트 캐시 유지 시간(초). 쓰기 시 버전이 바뀌므로 만료는 메모리 회수용
+PYBO_FRAGMENT_CACHE_TIMEOUT = 60 * 60
+
+# 비로그인 목록/검색 페이지 전체 캐시 유지 시간(초). 질문/답변 쓰기 시 목록 세대가 바뀌어 즉시 무효화된다
+PYBO_PAGE_CACHE_TIMEOUT = 30
+
+# 검색어 자동완성: 최대 결과 수, 응답 Cache-Control max-age(초)
+PYBO_SUGGEST_LIMIT = 8
+PYBO_SUGGEST_MAX_AGE = 30
+
+# 검색 결과 id 목록 LRU 캐시 (프로세스별): 최대 검색어 수, 수명(초),
+# 전체 캐시에 담는 id 수의 합 (이보다 결과가 많은 검색어는 캐시하지 않음)
+PYBO_SEARCH_CACHE_SIZE = 256
+PYBO_SEARCH_CACHE_TTL = 300
+PYBO_SEARCH_CACHE_MAX_IDS = 100000
+
+# 추천 write-behind 버퍼 반영 간격(초). 0 이면 요청 안에서 바로 반영
+PYBO_VOTE_FLUSH_INTERVAL = float(os.getenv('PYBO_VOTE_FLUSH_INTERVAL', '1.0'))
+
+# 채팅 이전 메시지 페이지 크기 (접속 시/load_history 기본값, 클라이언트가 요청할 수 있는 최대값)
+CHAT_HISTORY_PAGE_SIZE = 30
+CHAT_HISTORY_MAX_PAGE_SIZE = 100
+# 재접속 시 last_id 이후 밀린 메시지를 이 개수까지만 보내고, 넘으면 전체 다시 받기(full_reload)
+CHAT_RESYNC_MAX_DELTA = 100
+# 채팅방 최근 활동 시각(updated_at) 반영 간격(초). 메시지가 몰려도 방마다 간격당 한 번만 쓴다. 0 이면 즉시 반영
+CHAT_ACTIVITY_FLUSH_INTERVAL = float(os.getenv('CHAT_ACTIVITY_FLUSH_INTERVAL', '1.0'))
+# 채팅 메시지 비동기 저장 큐(chat.persistence): 모아 쓰는 간격(초, 0 이면 바로 저장), 한 번에 쓰는 최대 개수,
+# 큐 최대 길이(가득 차면 메시지 수신이 자리가 날 때까지 대기), 저장 실패 시 배치 재시도 횟수(이후 메시지별로 저장)
+CHAT_PERSIST_FLUSH_INTERVAL = float(os.getenv('CHAT_PERSIST_FLUSH_INTERVAL', '0.2'))
+CHAT_PERSIST_BATCH_SIZE = 200
+CHAT_PERSIST_QUEUE_SIZE = 5000
+CHAT_PERSIST_RETRIES = 5
+
+# 방별 최근 메시지 링 버퍼(chat.history): 'redis' 또는 'local'(프로세스 메모리, 테스트/개발용),
+# 방마다 보관할 메시지 수, 쓰기가 없는 방의 보관 시간(초)
+CHAT_RECENT_MESSAGES_BACKEND = os.getenv('CHAT_RECENT_MESSAGES_BACKEND', 'redis')
+CHAT_RECENT_MESSAGES_URL = os.getenv('CHAT_RECENT_MESSAGES_URL', 'redis://127.0.0.1:6379/2')
+CHAT_RECENT_MESSAGES = 50
+CHAT_RECENT_MESSAGES_TTL = 7 * 24 * 60 * 60
+
+# 채팅 받은편지함(/chat/inbox/) 페이지당 방 수
+CHAT_INBOX_PAGE_SIZE = 20
+
+# 채팅 연결 제한(chat.consumers.ChatConsumer): 받는 프레임 최대 길이(문자, 넘으면 연결을 끊음), 메시지 최대 길이,
+# 연결별/사용자별 토큰 버킷(초당 프레임 수, 한 번에 몰아 보낼 수 있는 수),
+# 클라이언트가 받았다고 알리지(ack) 않은 보낸 프레임 수 상한(넘으면 연결을 끊음, 위젯은 32 개마다 알림)
+CHAT_MAX_FRAME_SIZE = 16 * 1024
+CHAT_MAX_MESSAGE_LENGTH = 2000
+CHAT_CONNECTION_RATE = 5
+CHAT_CONNECTION_BURST = 10
+CHAT_USER_RATE = 10
+CHAT_USER_BURST = 20
+CHAT_SEND_WINDOW = 256
+
 MIDDLEWARE = [
+    'common.middleware.MetricsMiddleware',
+    'common.middleware.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -59,11 +135,48 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# URL 이름별 요청당 SQL 쿼리 예산 (세션/인증 쿼리 포함)
+# 초과 시 경고 로그, 테스트(common.testing.TestRunner)에서는 모든 요청에서 실패 처리
+QUERY_BUDGETS = {
+    'index': 6,  # 홈(/), pybo:index 와 같은 IndexView
+    'pybo:index': 6,
+    'pybo:detail': 8,
+    'pybo:search': 6,
+    'pybo:suggest': 1,  # 프로세스 시작/다른 프로세스 변경 후 첫 요청의 인덱스 재구성만 허용
+    'chat:latest': 4,
+    'chat:inbox': 3,
+}
+QUERY_BUDGET_HEADERS = DEBUG  # X-DB-Queries, X-DB-Time-Ms, X-DB-Duplicates 응답 헤더
+QUERY_BUDGET_RAISE = False
+
+# /metrics 접근용 베어러 토큰 (비어 있으면 스태프 사용자만 접근 가능)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+# 요청 디버그 로그 샘플링 비율 (0~1)
+METRICS_LOG_SAMPLE_RATE = float(os.getenv('METRICS_LOG_SAMPLE_RATE', '0.01'))
+
+# 앱 로거(pybo, chat, common)는 콘솔로 출력
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {'format': '{asctime} {levelname} {name} {message}', 'style': '{'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'simple'},
+    },
+    'loggers': {
+        app: {'handlers': ['console'], 'level': os.getenv('APP_LOG_LEVEL', 'INFO')}
+        for app in ('pybo', 'chat', 'common')
+    },
+}
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # 렌더링 시간을 /metrics 로 내보내는 DjangoTemplates 백엔드
+        'BACKEND': 'common.metrics.InstrumentedDjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -123,11 +236,39 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
 
-STATIC_ROOT = BASE_DIR / 'static'
+# collectstatic 결과 (해시 파일명 + gzip/brotli 사전 압축본), WhiteNoise 가 제공
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+# 해시 파일명은 WhiteNoise 가 1년 immutable 캐시로 제공
+# 매니페스트에 없는 파일은 STATIC_ROOT 의 파일로 해시를 다시 계산한다 (STATIC_ROOT 에도 없으면 ValueError 이므로 배포 전 collectstatic 필수)
+WHITENOISE_MANIFEST_STRICT = False
+# 테스트는 collectstatic 없이 돌도록 staticfiles 저장소를 매니페스트 없는 저장소로 바꾼다
+TEST_RUNNER = 'common.testing.TestRunner'
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# /media/ 제공 (common.media.serve_media)
+# 공개 디렉터리 외의 파일은 스태프만 접근, 해시 이름이 아닌 파일의 캐시 시간(초)
+MEDIA_PUBLIC_PREFIXES = ['question_images/', 'profile_pics/', 'thumbs/']
+MEDIA_CACHE_MAX_AGE = 24 * 60 * 60
+# 본문 전송을 프록시에 맡기는 방식: '' (직접 전송) | 'x-accel-redirect' (nginx) | 'x-sendfile' (Apache 등)
+# nginx 는 MEDIA_ACCEL_PREFIX 를 internal location 으로 MEDIA_ROOT 에 alias 한다.
+MEDIA_ACCEL = os.getenv('MEDIA_ACCEL', '')
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+# 업로드 이미지 썸네일(common.images) 생성 프로세스 수 (0 이면 요청 프로세스에서 처리)
+# 업로드 요청은 생성을 기다리지 않는다
+IMAGE_PROCESS_WORKERS = int(os.getenv('IMAGE_PROCESS_WORKERS', '2'))
+
 # 로그인/로그아웃 성공후 이동하는 URL
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
@@ -1,9 +1,12 @@
 
+import re
+
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import include, path, re_path
 from django.conf import settings
-from django.conf.urls.static import static
 
+from common.media import serve_media
+from common.views import metrics
 from pybo.views import base_views
 from pybo.views.base_views import IndexView
 
@@ -12,9 +15,11 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('pybo/', include('pybo.urls')),
     path('common/', include('common.urls')),
+    path('metrics', metrics, name='metrics'),
     path('', IndexView.as_view(), name='index'),
 ]
 
-# 개발 환경에서 미디어 파일 서빙 설정
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# 미디어 파일 서빙 (DEBUG 와 무관, 조건부 요청/Range/프록시 오프로드 지원)
+urlpatterns += [
+    re_path(r'^{}(?P<path>.+)$'.format(re.escape(settings.MEDIA_URL.lstrip('/'))), serve_media, name='media'),
+]
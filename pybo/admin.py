@@ -1,5 +1,8 @@
 from django.contrib import admin
+from .cache import bump_list_generation, bump_question_version
 from .models import Question, Answer, Comment
+from .services.search_service import SearchService
+from .suggest import subject_index
 
 
 class QuestionAdmin(admin.ModelAdmin):
@@ -8,6 +11,31 @@ class QuestionAdmin(admin.ModelAdmin):
     list_filter = ['create_date', 'modify_date']
     raw_id_fields = ['author', 'voter']
 
+    # 관리자 페이지에서의 변경도 검색 인덱스에 반영
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        SearchService.index_question(obj.id)
+        subject_index.add(obj.id, obj.subject)
+        bump_list_generation()
+        bump_question_version(obj.id)
+
+    def delete_model(self, request, obj):
+        question_id = obj.id
+        super().delete_model(request, obj)
+        SearchService.remove_question(question_id)
+        subject_index.remove(question_id)
+        bump_list_generation()
+        bump_question_version(question_id)
+
+    def delete_queryset(self, request, queryset):
+        question_ids = list(queryset.values_list('id', flat=True))
+        super().delete_queryset(request, queryset)
+        for question_id in question_ids:
+            SearchService.remove_question(question_id)
+            subject_index.remove(question_id)
+            bump_list_generation()
+            bump_question_version(question_id)
+
 
 class AnswerAdmin(admin.ModelAdmin):
     search_fields = ['content']
@@ -15,6 +43,32 @@ class AnswerAdmin(admin.ModelAdmin):
     list_filter = ['create_date', 'modify_date']
     raw_id_fields = ['author', 'question', 'voter']
 
+    def save_model(self, request, obj, form, change):
+        old_question_id = form.initial.get('question') if change else None
+        super().save_model(request, obj, form, change)
+        SearchService.index_question(obj.question_id)
+        bump_list_generation()
+        bump_question_version(obj.question_id)
+        if old_question_id and old_question_id != obj.question_id:
+            SearchService.index_question(old_question_id)
+            bump_list_generation()
+            bump_question_version(old_question_id)
+
+    def delete_model(self, request, obj):
+        question_id = obj.question_id
+        super().delete_model(request, obj)
+        SearchService.index_question(question_id)
+        bump_list_generation()
+        bump_question_version(question_id)
+
+    def delete_queryset(self, request, queryset):
+        question_ids = set(queryset.values_list('question_id', flat=True))
+        super().delete_queryset(request, queryset)
+        for question_id in question_ids:
+            SearchService.index_question(question_id)
+            bump_list_generation()
+            bump_question_version(question_id)
+
 
 class CommentAdmin(admin.ModelAdmin):
     search_fields = ['content']
@@ -22,6 +76,22 @@ class CommentAdmin(admin.ModelAdmin):
     list_filter = ['create_date', 'modify_date']
     raw_id_fields = ['author', 'question', 'answer']
 
+    # 관리자 페이지에서의 변경도 질문 상세 프래그먼트 캐시에 반영
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        bump_question_version(obj.question_id or obj.answer.question_id)
+
+    def delete_model(self, request, obj):
+        question_id = obj.question_id or obj.answer.question_id
+        super().delete_model(request, obj)
+        bump_question_version(question_id)
+
+    def delete_queryset(self, request, queryset):
+        question_ids = {c.question_id or c.answer.question_id for c in queryset.select_related('answer')}
+        super().delete_queryset(request, queryset)
+        for question_id in question_ids:
+            bump_question_version(question_id)
+
 
 admin.site.register(Question, QuestionAdmin)
 admin.site.register(Answer, AnswerAdmin)
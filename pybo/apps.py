@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class PyboConfig(AppConfig):
     name = 'pybo'
+
+    def ready(self):
+        # 작성자 이름/프로필 사진 변경 시 검색 인덱스, 프래그먼트 캐시 갱신 시그널 등록
+        from . import signals  # noqa: F401
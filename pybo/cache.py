@@ -0,0 +1,109 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import patch_vary_headers
+
+from .services.search_service import SearchService
+
+
+QUESTION_VERSION_KEY = 'pybo:question:{}:version'
+
+
+def question_version(question_id):
+    """
+    질문 상세 프래그먼트 캐시 버전
+    키가 없으면 현재 시각으로 초기화하므로 캐시가 비워져도 예전 버전 번호가 재사용되지 않는다.
+    """
+    key = QUESTION_VERSION_KEY.format(question_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_question_version(question_id):
+    # 질문/답변/댓글/추천 변경 시 호출 → 이전 버전의 프래그먼트는 더 이상 읽히지 않는다
+    # 커밋 후에 올린다 (커밋 전에 올리면 다른 요청이 커밋 전 데이터를 새 버전으로 캐시할 수 있다)
+    transaction.on_commit(lambda: cache.set(QUESTION_VERSION_KEY.format(question_id), time.time_ns(), None))
+
+
+def bump_user_fragments(user_id):
+    """
+    사용자 이름/프로필 사진 변경 시 호출 → 그 사용자가 질문/답변/댓글을 쓴 질문의 프래그먼트와 목록 페이지 무효화
+    """
+    from .models import Answer, Comment, Question
+
+    question_ids = set(Question.objects.filter(author_id=user_id).values_list('id', flat=True))
+    question_ids.update(Answer.objects.filter(author_id=user_id).values_list('question_id', flat=True))
+    for question_id, answer_question_id in Comment.objects.filter(author_id=user_id).values_list(
+            'question_id', 'answer__question_id'):
+        question_ids.add(question_id or answer_question_id)
+
+    def bump():
+        version = time.time_ns()
+        cache.set_many({QUESTION_VERSION_KEY.format(question_id): version for question_id in question_ids}, None)
+        cache.set(LIST_GENERATION_KEY, version, None)
+    transaction.on_commit(bump)
+
+
+LIST_GENERATION_KEY = 'pybo:list:generation'
+PAGE_CACHE_KEY = 'pybo:page:{}:{}'
+# 페이지 내용에 영향을 주는 쿼리 파라미터 (그 외 파라미터는 키에서 제외)
+PAGE_CACHE_PARAMS = ('page', 'cursor', 'sort')
+
+
+def list_generation():
+    key = LIST_GENERATION_KEY
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_list_generation():
+    # 질문/답변 쓰기 시 호출 → 캐시된 목록/검색 페이지 전체 무효화 (커밋 후)
+    transaction.on_commit(lambda: cache.set(LIST_GENERATION_KEY, time.time_ns(), None))
+
+
+def page_cache_key(request, generation):
+    """
+    목록/검색 페이지 캐시 키: 경로 + page/cursor/sort + 정규화된 kw + 목록 세대
+    """
+    params = [(name, request.GET.get(name, '')) for name in PAGE_CACHE_PARAMS]
+    params.append(('kw', SearchService.normalize_keyword(request.GET.get('kw', ''))))
+    digest = hashlib.md5(repr((request.path, params)).encode()).hexdigest()
+    return PAGE_CACHE_KEY.format(generation, digest)
+
+
+def anonymous_page_cache(view_func):
+    """
+    비로그인 사용자의 GET 요청 응답 전체를 캐시하는 뷰 데코레이터
+    로그인 사용자, 메시지가 남아 있는 요청, 쿠키를 설정하는 응답은 캐시하지 않는다.
+    """
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        if request.method != 'GET' or request.user.is_authenticated:
+            return view_func(request, *args, **kwargs)
+
+        key = page_cache_key(request, list_generation())
+        response = cache.get(key)
+        if response is not None:
+            response['X-Page-Cache'] = 'hit'
+            return response
+
+        response = view_func(request, *args, **kwargs)
+        if hasattr(response, 'render') and callable(response.render):
+            response.render()
+        if response.status_code == 200 and not response.cookies and not get_messages(request):
+            cache.set(key, response, getattr(settings, 'PYBO_PAGE_CACHE_TIMEOUT', 30))
+        patch_vary_headers(response, ('Cookie',))
+        response['X-Page-Cache'] = 'miss'
+        return response
+    return _wrapped_view
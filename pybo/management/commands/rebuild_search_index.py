@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from pybo.services.search_service import SearchService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for questions'
+
+    def handle(self, *args, **options):
+        if not SearchService.is_available():
+            self.stdout.write(self.style.WARNING(
+                'Search index table not found (SQLite FTS5 required). Falling back to icontains search.'
+            ))
+            return
+
+        self.stdout.write('Rebuilding search index...')
+        count = SearchService.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Successfully indexed {count} questions.'))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from pybo.services.counter_service import CounterService
+
+
+class Command(BaseCommand):
+    help = 'Repair denormalized vote/answer/comment counters on questions and answers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report rows whose counters have drifted'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        self.stdout.write('Checking counters...')
+        questions, answers = CounterService.reconcile(dry_run=dry_run)
+
+        if not questions and not answers:
+            self.stdout.write(self.style.SUCCESS('All counters are consistent. No action needed.'))
+        elif dry_run:
+            self.stdout.write(self.style.WARNING(
+                f'Found drift in {questions} questions and {answers} answers.'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Successfully repaired {questions} questions and {answers} answers.'
+            ))
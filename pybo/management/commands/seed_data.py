@@ -6,6 +6,8 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 from django.core.files import File
 from pybo.models import Question, Answer, Comment
+from pybo.services.counter_service import CounterService
+from pybo.services.search_service import SearchService
 
 class Command(BaseCommand):
     help = 'Seed database with test data'
@@ -57,6 +59,12 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'Creating votes...'))
         self._create_votes(users, questions, answers)
 
+        self.stdout.write(self.style.SUCCESS(f'Rebuilding search index...'))
+        SearchService.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f'Updating counters...'))
+        CounterService.reconcile()
+
         self.stdout.write(self.style.SUCCESS('Database seeded successfully!'))
 
     def _create_users(self, num_users):
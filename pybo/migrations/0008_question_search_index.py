@@ -0,0 +1,41 @@
+from django.db import migrations, OperationalError
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        try:
+            # trigram 토크나이저: 띄어쓰기/조사와 무관하게 한글 부분 문자열 검색 가능
+            cursor.execute(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS pybo_question_fts '
+                'USING fts5(subject, content, author, answers, tokenize="trigram")'
+            )
+        except OperationalError:
+            # FTS5/trigram 을 지원하지 않는 SQLite 빌드는 icontains 검색을 계속 사용
+            return
+        cursor.execute(
+            'INSERT INTO pybo_question_fts (rowid, subject, content, author, answers) '
+            'SELECT q.id, q.subject, q.content, u.username, '
+            "COALESCE((SELECT group_concat(a.content, char(10)) FROM pybo_answer a WHERE a.question_id = q.id), '') "
+            'FROM pybo_question q JOIN auth_user u ON u.id = q.author_id'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('DROP TABLE IF EXISTS pybo_question_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('pybo', '0007_question_image'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.21 on 2026-10-18 10:24
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, field):
+    return Coalesce(Subquery(
+        queryset.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(c=Count('*')).values('c')
+    ), Value(0))
+
+
+def fill_counters(apps, schema_editor):
+    Question = apps.get_model('pybo', 'Question')
+    Answer = apps.get_model('pybo', 'Answer')
+    Comment = apps.get_model('pybo', 'Comment')
+    Question.objects.update(
+        vote_count=_count(Question.voter.through.objects.all(), 'question_id'),
+        answer_count=_count(Answer.objects.all(), 'question_id'),
+        comment_count=_count(Comment.objects.all(), 'question_id'),
+    )
+    Answer.objects.update(
+        vote_count=_count(Answer.voter.through.objects.all(), 'answer_id'),
+        comment_count=_count(Comment.objects.all(), 'answer_id'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pybo', '0008_question_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='answer',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='vote_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='answer_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='vote_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.21 on 2026-10-18 10:36
+
+import common.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pybo', '0009_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='question',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=common.storage.media_storage, upload_to='question_images/'),
+        ),
+    ]
@@ -1,15 +1,29 @@
 from django.contrib.auth.models import User
 from django.db import models
 
+from common.images import track_image_metadata
+from common.storage import media_storage, track_references
+
 
 class Question(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='author_question')
     subject = models.CharField(max_length=200)
     content = models.TextField()
-    image = models.ImageField(upload_to='question_images/', null=True, blank=True)
+    image = models.ImageField(upload_to='question_images/', storage=media_storage, null=True, blank=True,
+                              width_field='image_width', height_field='image_height')
+    # 업로드 시 계산되는 이미지 메타데이터 (렌더링 시 파일을 열지 않도록)
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_bytes = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_color = models.CharField(max_length=7, blank=True, editable=False)
+    image_placeholder = models.TextField(blank=True, editable=False)
     create_date = models.DateTimeField()
     modify_date = models.DateTimeField(null=True, blank=True)
     voter = models.ManyToManyField(User, related_name='voter_question')
+    # 비정규화 카운터 (서비스 레이어에서 갱신, reconcile_counters 명령으로 보정)
+    vote_count = models.IntegerField(default=0)
+    answer_count = models.IntegerField(default=0)
+    comment_count = models.IntegerField(default=0)
 
     def __str__(self):
         return self.subject
@@ -22,6 +36,8 @@ class Answer(models.Model):
     create_date = models.DateTimeField()
     modify_date = models.DateTimeField(null=True, blank=True)
     voter = models.ManyToManyField(User, related_name='voter_answer')
+    vote_count = models.IntegerField(default=0)
+    comment_count = models.IntegerField(default=0)
 
 
 class Comment(models.Model):
@@ -31,3 +47,8 @@ class Comment(models.Model):
     modify_date = models.DateTimeField(null=True, blank=True)
     question = models.ForeignKey(Question, null=True, blank=True, on_delete=models.CASCADE)
     answer = models.ForeignKey(Answer, null=True, blank=True, on_delete=models.CASCADE)
+
+
+# 이미지 교체/삭제 시 내용 주소 스토리지의 참조 해제, 업로드 시 메타데이터 계산
+track_references(Question, 'image')
+track_image_metadata(Question, 'image', 'image')
@@ -0,0 +1,173 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from django.http import Http404
+
+
+# 번호 페이지네이션(OFFSET)을 제공하는 최대 페이지, 이후로는 커서로 이동
+OFFSET_PAGE_LIMIT = 5
+# 현재 번호 페이지 앞뒤로 보여 주는 번호 수
+PAGE_LINK_RADIUS = 2
+
+OLDER = 'o'
+NEWER = 'n'
+
+
+def encode_cursor(obj, direction, date_field='create_date'):
+    """
+    (date_field, id) 위치를 불투명한 토큰으로 변환
+    """
+    raw = json.dumps([direction, getattr(obj, date_field).isoformat(), obj.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    토큰을 (direction, 날짜, id) 로 변환, 잘못된 토큰이면 ValueError
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        direction, create_date, pk = json.loads(raw)
+        if direction not in (OLDER, NEWER):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(create_date), int(pk)
+    except (TypeError, ValueError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+class KeysetPage:
+
+    def __init__(self, object_list, has_newer, has_older, date_field='create_date'):
+        self.object_list = object_list
+        self.has_newer = has_newer
+        self.has_older = has_older
+        self.date_field = date_field
+
+    @property
+    def newer_cursor(self):
+        if self.has_newer and self.object_list:
+            return encode_cursor(self.object_list[0], NEWER, self.date_field)
+        return None
+
+    @property
+    def older_cursor(self):
+        if self.has_older and self.object_list:
+            return encode_cursor(self.object_list[-1], OLDER, self.date_field)
+        return None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    (date_field, id) 기준 커서 페이지네이션 (기본 create_date)
+    COUNT(*) 와 OFFSET 없이 인덱스 범위 조회 한 번으로 페이지를 가져온다.
+    queryset 은 ('-<date_field>', '-id') 순으로 정렬되어 있어야 한다.
+    """
+
+    def __init__(self, queryset, per_page, date_field='create_date'):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.date_field = date_field
+
+    def page(self, cursor=None):
+        if cursor:
+            try:
+                direction, date, pk = decode_cursor(cursor)
+            except ValueError:
+                direction = None
+        else:
+            direction = None
+        field = self.date_field
+
+        if direction == OLDER:
+            rows = list(self.queryset.filter(
+                Q(**{f'{field}__lt': date}) | Q(**{field: date, 'id__lt': pk})
+            )[:self.per_page + 1])
+            return KeysetPage(rows[:self.per_page], has_newer=True, has_older=len(rows) > self.per_page,
+                              date_field=field)
+
+        if direction == NEWER:
+            rows = list(self.queryset.filter(
+                Q(**{f'{field}__gt': date}) | Q(**{field: date, 'id__gt': pk})
+            ).order_by(field, 'id')[:self.per_page + 1])
+            has_newer = len(rows) > self.per_page
+            rows = rows[:self.per_page][::-1]
+            return KeysetPage(rows, has_newer=has_newer, has_older=True, date_field=field)
+
+        rows = list(self.queryset[:self.per_page + 1])
+        return KeysetPage(rows[:self.per_page], has_newer=False, has_older=len(rows) > self.per_page,
+                          date_field=field)
+
+
+class OffsetPage:
+    """
+    OFFSET_PAGE_LIMIT 안의 번호 페이지 (Django Page 중 목록 템플릿이 쓰는 부분만)
+    following 은 링크로 보여 줄 뒤쪽 페이지 수, has_more 는 바로 다음 페이지가 있는지 여부
+    """
+
+    def __init__(self, object_list, number, following, has_more):
+        self.object_list = object_list
+        self.number = number
+        self.following = following
+        self.has_more = has_more
+
+    @property
+    def page_range(self):
+        return range(max(1, self.number - PAGE_LINK_RADIUS), self.number + self.following + 1)
+
+    def has_next(self):
+        return self.has_more
+
+    def has_previous(self):
+        return self.number > 1
+
+    def has_other_pages(self):
+        return self.has_more or self.has_previous()
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class OffsetPaginator:
+    """
+    COUNT(*) 없는 번호 페이지네이션 (OFFSET_PAGE_LIMIT 페이지까지)
+    보여 줄 뒤쪽 번호(최대 PAGE_LINK_RADIUS 페이지, OFFSET_PAGE_LIMIT 안)만큼 행을 더 읽어
+    다음 페이지 존재 여부와 링크할 번호를 조회 한 번으로 정한다.
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = per_page
+
+    def page(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise Http404("Invalid page")
+        if not 1 <= number <= OFFSET_PAGE_LIMIT:
+            raise Http404("Invalid page")
+
+        lookahead = min(PAGE_LINK_RADIUS, OFFSET_PAGE_LIMIT - number)
+        start = (number - 1) * self.per_page
+        rows = list(self.queryset[start:start + self.per_page * (1 + lookahead) + 1])
+        if not rows and number > 1:
+            raise Http404("Invalid page")
+        rest = len(rows) - self.per_page
+        following = min(lookahead, -(-rest // self.per_page)) if rest > 0 else 0
+        return OffsetPage(rows[:self.per_page], number, following, has_more=rest > 0)
@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from common.metrics import Counter
+from .cache import list_generation
+from .models import Question
+from .services.search_service import SearchService
+
+
+SEARCH_CACHE_REQUESTS = Counter(
+    'pybo_search_cache_requests_total', 'Search result id cache lookups by result.', ('result',))
+
+
+class LRUCache:
+    """
+    크기(항목 수, 값 길이의 합)와 수명(초)으로 제한되는 프로세스 내 LRU 캐시
+    max_items 가 있으면 저장된 값(시퀀스) 길이의 합을 그 안으로 유지하고, 혼자서 넘는 값은 저장하지 않는다.
+    """
+
+    def __init__(self, max_entries, max_age, max_items=None):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.max_items = max_items
+        self.items = 0  # 저장된 값 길이의 합
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()  # key → (저장 시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and time.monotonic() - item[0] > self.max_age:
+                self._pop(key)
+                self.evictions += 1
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def _pop(self, key):
+        _, value = self._data.pop(key)
+        self.items -= len(value)
+
+    def set(self, key, value):
+        if self.max_items is not None and len(value) > self.max_items:
+            return
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            self._data[key] = (time.monotonic(), value)
+            self.items += len(value)
+            while len(self._data) > self.max_entries or (self.max_items is not None and self.items > self.max_items):
+                self._pop(next(iter(self._data)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.items = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self._data),
+                'items': self.items}
+
+
+result_cache = LRUCache(
+    getattr(settings, 'PYBO_SEARCH_CACHE_SIZE', 256),
+    getattr(settings, 'PYBO_SEARCH_CACHE_TTL', 300),
+    getattr(settings, 'PYBO_SEARCH_CACHE_MAX_IDS', 100000),
+)
+
+
+def search_result_ids(kw, ranked=False):
+    """
+    검색 결과 질문 id 목록 (정렬 순서 유지)
+    키에 목록 세대를 포함하므로 질문/답변 쓰기 이후에는 자연히 새로 계산된다.
+    """
+    key = (SearchService.normalize_keyword(kw), ranked, list_generation())
+    ids = result_cache.get(key)
+    if ids is None:
+        SEARCH_CACHE_REQUESTS.inc(result='miss')
+        ids = tuple(SearchService.search(kw, ranked=ranked).values_list('id', flat=True))
+        result_cache.set(key, ids)
+    else:
+        SEARCH_CACHE_REQUESTS.inc(result='hit')
+    return ids
+
+
+class SearchResultList:
+    """
+    캐시된 id 목록을 Paginator 에 넘기기 위한 시퀀스
+    슬라이스할 때 해당 페이지의 행만 id__in 쿼리 한 번으로 가져온다.
+    """
+
+    def __init__(self, ids, queryset=None):
+        self.ids = ids
+        self.queryset = queryset if queryset is not None else Question.objects.all()
+
+    def count(self):
+        return len(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0] if index >= 0 else self[len(self.ids) + index]
+        page_ids = self.ids[index]
+        rows = {obj.id: obj for obj in self.queryset.filter(id__in=page_ids)}
+        # id__in 결과는 순서가 보장되지 않으므로 캐시된 순서대로 재배열 (그 사이 삭제된 행은 건너뜀)
+        return [rows[question_id] for question_id in page_ids if question_id in rows]
@@ -1,7 +1,11 @@
 
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 
+from ..cache import bump_list_generation, bump_question_version
 from ..models import Question, Answer
+from .search_service import SearchService
 from common.exceptions import ResourceNotFoundException, PermissionDeniedException
 
 
@@ -21,7 +25,12 @@ class AnswerService:
             create_date=timezone.now(),
             author=user
         )
-        answer.save()
+        with transaction.atomic():
+            answer.save()
+            Question.objects.filter(pk=question.pk).update(answer_count=F('answer_count') + 1)
+        SearchService.index_question(question.id)
+        bump_list_generation()
+        bump_question_version(question.id)
         return answer
 
     @staticmethod
@@ -43,6 +52,9 @@ class AnswerService:
         answer.content = content
         answer.modify_date = timezone.now()
         answer.save()
+        SearchService.index_question(answer.question_id)
+        bump_list_generation()
+        bump_question_version(answer.question_id)
         return answer
 
     @staticmethod
@@ -53,11 +65,22 @@ class AnswerService:
         if answer.author != user:
             raise PermissionDeniedException("You are not the author of this answer")
         
-        answer.delete()
+        with transaction.atomic():
+            answer.delete()
+            Question.objects.filter(pk=answer.question_id).update(answer_count=F('answer_count') - 1)
+        SearchService.index_question(answer.question_id)
+        bump_list_generation()
+        bump_question_version(answer.question_id)
 
     @staticmethod
     def vote_answer(answer_id, user):
 
-        answer = AnswerService.get_answer(answer_id)
-        answer.voter.add(user)
+        with transaction.atomic():
+            answer = AnswerService.get_answer(answer_id)
+            # 실제로 추천 행을 만든 경우에만 카운터를 올린다 (동시 추천이 두 번 세지 않도록)
+            _, created = Answer.voter.through.objects.get_or_create(answer_id=answer.pk, user_id=user.pk)
+            if created:
+                Answer.objects.filter(pk=answer.pk).update(vote_count=F('vote_count') + 1)
+                answer.vote_count += 1
+                bump_question_version(answer.question_id)
         return answer
\ No newline at end of file
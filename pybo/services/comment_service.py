@@ -1,6 +1,9 @@
 
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 
+from ..cache import bump_question_version
 from ..models import Question, Answer, Comment
 from common.exceptions import ResourceNotFoundException, PermissionDeniedException
 
@@ -21,7 +24,10 @@ class CommentService:
             create_date=timezone.now(),
             author=user
         )
-        comment.save()
+        with transaction.atomic():
+            comment.save()
+            Question.objects.filter(pk=question.pk).update(comment_count=F('comment_count') + 1)
+        bump_question_version(question.id)
         return comment
 
     @staticmethod
@@ -38,17 +44,25 @@ class CommentService:
             create_date=timezone.now(),
             author=user
         )
-        comment.save()
+        with transaction.atomic():
+            comment.save()
+            Answer.objects.filter(pk=answer.pk).update(comment_count=F('comment_count') + 1)
+        bump_question_version(answer.question_id)
         return comment
 
     @staticmethod
     def get_comment(comment_id):
 
         try:
-            return Comment.objects.get(pk=comment_id)
+            return Comment.objects.select_related('answer').get(pk=comment_id)
         except Comment.DoesNotExist:
             raise ResourceNotFoundException(f"Comment with ID {comment_id} not found")
 
+    @staticmethod
+    def get_question_id(comment):
+        # 답변 댓글이면 답변이 속한 질문 (get_comment 에서 answer 를 함께 조회)
+        return comment.question_id or comment.answer.question_id
+
     @staticmethod
     def modify_comment(comment_id, content, user):
 
@@ -60,6 +74,7 @@ class CommentService:
         comment.content = content
         comment.modify_date = timezone.now()
         comment.save()
+        bump_question_version(CommentService.get_question_id(comment))
         return comment
 
     @staticmethod
@@ -70,4 +85,10 @@ class CommentService:
         if comment.author != user:
             raise PermissionDeniedException("You are not the author of this comment")
         
-        comment.delete()
\ No newline at end of file
+        with transaction.atomic():
+            comment.delete()
+            if comment.question_id:
+                Question.objects.filter(pk=comment.question_id).update(comment_count=F('comment_count') - 1)
+            if comment.answer_id:
+                Answer.objects.filter(pk=comment.answer_id).update(comment_count=F('comment_count') - 1)
+        bump_question_version(CommentService.get_question_id(comment))
\ No newline at end of file
@@ -0,0 +1,54 @@
+from django.db.models import Count, OuterRef, Subquery, Value, Q, F
+from django.db.models.functions import Coalesce
+
+from ..models import Question, Answer, Comment
+
+
+def _count(queryset, field):
+    # 상관 서브쿼리로 실제 개수를 계산 (없으면 0)
+    return Coalesce(Subquery(
+        queryset.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(c=Count('*')).values('c')
+    ), Value(0))
+
+
+class CounterService:
+
+    @staticmethod
+    def actual_question_counts():
+        return {
+            'vote_count': _count(Question.voter.through.objects.all(), 'question_id'),
+            'answer_count': _count(Answer.objects.all(), 'question_id'),
+            'comment_count': _count(Comment.objects.all(), 'question_id'),
+        }
+
+    @staticmethod
+    def actual_answer_counts():
+        return {
+            'vote_count': _count(Answer.voter.through.objects.all(), 'answer_id'),
+            'comment_count': _count(Comment.objects.all(), 'answer_id'),
+        }
+
+    @staticmethod
+    def find_drift(model, counts):
+        """
+        저장된 카운터와 실제 개수가 다른 행의 쿼리셋 반환
+        """
+        annotations = {f'actual_{name}': expression for name, expression in counts.items()}
+        mismatch = Q()
+        for name in counts:
+            mismatch |= ~Q(**{name: F(f'actual_{name}')})
+        return model.objects.annotate(**annotations).filter(mismatch)
+
+    @staticmethod
+    def reconcile(dry_run=False):
+        """
+        카운터 컬럼을 실제 개수로 보정, (질문 수, 답변 수) 형태로 보정된 행 수를 반환
+        """
+        fixed = []
+        for model, counts in ((Question, CounterService.actual_question_counts()),
+                              (Answer, CounterService.actual_answer_counts())):
+            drifted_ids = list(CounterService.find_drift(model, counts).values_list('id', flat=True))
+            if drifted_ids and not dry_run:
+                model.objects.filter(id__in=drifted_ids).update(**counts)
+            fixed.append(len(drifted_ids))
+        return tuple(fixed)
@@ -1,9 +1,19 @@
+import logging
+from functools import partial
+
 from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import F, Prefetch, prefetch_related_objects
 from django.utils import timezone
-from django.db.models import Q
 
-from ..models import Question
+from ..cache import bump_list_generation, bump_question_version
+from ..models import Question, Answer, Comment
+from ..suggest import subject_index
+from .search_service import SearchService
 from common.exceptions import ResourceNotFoundException, PermissionDeniedException
+from common.metrics import log_sampled
+
+logger = logging.getLogger(__name__)
 
 
 class QuestionService:
@@ -12,21 +22,16 @@ class QuestionService:
     def get_question_list(page=1, kw=''):
 
         if kw:
-            question_list = Question.objects.filter(
-                Q(subject__icontains=kw) |  # Subject contains keyword
-                Q(content__icontains=kw) |  # Content contains keyword
-                Q(author__username__icontains=kw) |  # Author username contains keyword
-                Q(answer__content__icontains=kw)  # Answer content contains keyword
-            ).distinct().order_by('-create_date')
+            question_list = SearchService.search(kw)
         else:
-            question_list = Question.objects.order_by('-create_date')
+            question_list = Question.objects.order_by('-create_date', '-id')
 
         # Apply pagination
         paginator = Paginator(question_list, 10, orphans=3)  # 10 items per page, combine last page if it has 3 or fewer items
         page_obj = paginator.get_page(page)
 
-        # Log pagination info for debugging
-        print(f"Page {page} of {paginator.num_pages}, {len(page_obj.object_list)} items")
+        log_sampled(logger, 'question_list', page=page_obj.number, num_pages=paginator.num_pages,
+                    items=len(page_obj.object_list))
 
         return page_obj
 
@@ -37,6 +42,58 @@ class QuestionService:
         except Question.DoesNotExist:
             raise ResourceNotFoundException(f"Question with ID {question_id} not found")
 
+    @staticmethod
+    def get_question_detail(question_id):
+        """
+        상세 페이지에 필요한 질문/답변/댓글/작성자/프로필을 고정된 쿼리 수(4회)로 조회
+        추천/답변/댓글 수는 카운터 컬럼을 사용하므로 별도 집계가 필요 없다.
+        """
+        question = QuestionService.get_question_with_author(question_id)
+        QuestionService.load_comments(question)
+        QuestionService.load_answers(question)
+        return question
+
+    @staticmethod
+    def get_question_with_author(question_id):
+        try:
+            return Question.objects.select_related('author__profile').get(pk=question_id)
+        except Question.DoesNotExist:
+            raise ResourceNotFoundException(f"Question with ID {question_id} not found")
+
+    @staticmethod
+    def load_comments(question):
+        """
+        질문 댓글을 작성자/프로필과 함께 조회 (1회, 이미 조회했으면 0회)
+        """
+        comments = Comment.objects.select_related('author__profile').order_by('id')
+        prefetch_related_objects([question], Prefetch('comment_set', queryset=comments))
+        return question.comment_set.all()
+
+    @staticmethod
+    def load_answers(question):
+        """
+        답변과 답변 댓글을 작성자/프로필과 함께 조회 (2회, 이미 조회했으면 0회)
+        """
+        comments = Comment.objects.select_related('author__profile').order_by('id')
+        answers = (Answer.objects
+                   .select_related('author__profile')
+                   .prefetch_related(Prefetch('comment_set', queryset=comments))
+                   .order_by('id'))
+        prefetch_related_objects([question], Prefetch('answer_set', queryset=answers))
+        return question.answer_set.all()
+
+    @staticmethod
+    def detail_context(question):
+        """
+        상세 템플릿 컨텍스트: 답변/댓글은 템플릿이 처음 읽을 때 조회한다
+        (프래그먼트 캐시가 맞으면 조회하지 않는다)
+        """
+        return {
+            'question': question,
+            'question_comments': partial(QuestionService.load_comments, question),
+            'answers': partial(QuestionService.load_answers, question),
+        }
+
     @staticmethod
     def create_question(subject, content, user, image=None):
         question = Question(
@@ -46,7 +103,11 @@ class QuestionService:
             author=user,
             image=image
         )
-        question.save()
+        with transaction.atomic():  # 행 저장과 이미지 참조 수 증가를 한 트랜잭션으로
+            question.save()
+        SearchService.index_question(question.id)
+        subject_index.add(question.id, question.subject)
+        bump_list_generation()
         return question
 
     @staticmethod
@@ -62,7 +123,12 @@ class QuestionService:
         if image is not None:
             question.image = image
         question.modify_date = timezone.now()
-        question.save()
+        with transaction.atomic():  # 행 저장과 이미지 참조 수 증가를 한 트랜잭션으로
+            question.save()
+        SearchService.index_question(question.id)
+        subject_index.add(question.id, question.subject)
+        bump_list_generation()
+        bump_question_version(question.id)
         return question
 
     @staticmethod
@@ -74,10 +140,21 @@ class QuestionService:
             raise PermissionDeniedException("You are not the author of this question")
 
         question.delete()
+        SearchService.remove_question(question_id)
+        subject_index.remove(question_id)
+        bump_list_generation()
+        bump_question_version(question_id)
 
     @staticmethod
     def vote_question(question_id, user):
 
-        question = QuestionService.get_question(question_id)
-        question.voter.add(user)
+        with transaction.atomic():
+            question = QuestionService.get_question(question_id)
+            # 실제로 추천 행을 만든 경우에만 카운터를 올린다 (동시 추천이 두 번 세지 않도록)
+            _, created = Question.voter.through.objects.get_or_create(question_id=question.pk, user_id=user.pk)
+            if created:
+                Question.objects.filter(pk=question.pk).update(vote_count=F('vote_count') + 1)
+                question.vote_count += 1
+                bump_question_version(question.id)
+                bump_list_generation()
         return question
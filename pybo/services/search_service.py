@@ -0,0 +1,143 @@
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from ..models import Question, Answer
+
+
+# FTS5 가상 테이블 이름 (rowid = Question.id)
+FTS_TABLE = 'pybo_question_fts'
+
+# trigram 토크나이저는 3글자 미만의 검색어를 인덱스로 찾을 수 없다
+MIN_MATCH_LENGTH = 3
+
+
+class SearchService:
+
+    _available = {}  # 데이터베이스 이름 → FTS 테이블 존재 여부 (테스트 DB 로 바뀌면 다시 확인)
+
+    @staticmethod
+    def is_available():
+        """
+        FTS5 인덱스를 사용할 수 있는지 확인 (SQLite + 마이그레이션 적용 여부)
+        """
+        if connection.vendor != 'sqlite':
+            return False
+        name = connection.settings_dict['NAME']
+        if name not in SearchService._available:
+            with connection.cursor() as cursor:
+                SearchService._available[name] = FTS_TABLE in connection.introspection.table_names(cursor)
+        return SearchService._available[name]
+
+    @staticmethod
+    def normalize_keyword(kw):
+        # 앞뒤/연속 공백 정리 (페이지 캐시 키와 검색어를 같은 기준으로 맞춘다)
+        return ' '.join(kw.split())
+
+    @staticmethod
+    def search(kw, ranked=False):
+        """
+        검색어에 해당하는 질문 쿼리셋 반환
+        ranked=True 이면 BM25 점수순, 아니면 최신순으로 정렬한다.
+        """
+        kw = SearchService.normalize_keyword(kw)
+        if not SearchService.is_available():
+            return SearchService._search_icontains(kw)
+
+        if len(kw) >= MIN_MATCH_LENGTH:
+            match = '"{}"'.format(kw.replace('"', '""'))
+            question_list = Question.objects.filter(id__in=RawSQL(
+                f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', (match,)
+            ))
+            if ranked:
+                # bm25()는 값이 작을수록 관련도가 높다
+                return question_list.annotate(search_rank=RawSQL(
+                    f'SELECT bm25({FTS_TABLE}) FROM {FTS_TABLE} '
+                    f'WHERE {FTS_TABLE} MATCH %s AND rowid = {Question._meta.db_table}.id', (match,)
+                )).order_by('search_rank', '-create_date', '-id')
+            return question_list.order_by('-create_date', '-id')
+
+        # 짧은 검색어는 비정규화된 FTS 테이블 하나만 LIKE로 훑는다 (조인/distinct 없음)
+        pattern = '%{}%'.format(kw.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_'))
+        like = " OR ".join(f"{column} LIKE %s ESCAPE '\\'" for column in ('subject', 'content', 'author', 'answers'))
+        return Question.objects.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {like}', (pattern,) * 4
+        )).order_by('-create_date', '-id')
+
+    @staticmethod
+    def _search_icontains(kw):
+        return Question.objects.filter(
+            Q(subject__icontains=kw) |  # Subject contains keyword
+            Q(content__icontains=kw) |  # Content contains keyword
+            Q(author__username__icontains=kw) |  # Author username contains keyword
+            Q(answer__content__icontains=kw)  # Answer content contains keyword
+        ).distinct().order_by('-create_date', '-id')
+
+    @staticmethod
+    def index_question(question_id):
+        """
+        질문 하나의 인덱스 행을 다시 작성 (질문/답변 등록, 수정, 삭제 시 호출)
+        """
+        if not SearchService.is_available():
+            return
+
+        row = (Question.objects
+               .filter(pk=question_id)
+               .values_list('subject', 'content', 'author__username')
+               .first())
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [question_id])
+            if row is None:
+                return
+            answers = '\n'.join(
+                Answer.objects.filter(question_id=question_id).order_by('id').values_list('content', flat=True)
+            )
+            cursor.execute(
+                f'INSERT INTO {FTS_TABLE} (rowid, subject, content, author, answers) VALUES (%s, %s, %s, %s, %s)',
+                [question_id, *row, answers]
+            )
+
+    @staticmethod
+    def remove_question(question_id):
+
+        if not SearchService.is_available():
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [question_id])
+
+    @staticmethod
+    def rename_author(user_id, username):
+        """
+        작성자 이름이 바뀌면 그 사용자의 질문 인덱스 행의 author 를 갱신
+        """
+        if not SearchService.is_available():
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {FTS_TABLE} SET author = %s '
+                f'WHERE rowid IN (SELECT id FROM {Question._meta.db_table} WHERE author_id = %s) AND author != %s',
+                [username, user_id, username]
+            )
+
+    @staticmethod
+    def rebuild():
+        """
+        전체 인덱스 재작성, 인덱스된 질문 수를 반환
+        """
+        if not SearchService.is_available():
+            return 0
+
+        question_table = Question._meta.db_table
+        answer_table = Answer._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE}')
+            cursor.execute(
+                f'INSERT INTO {FTS_TABLE} (rowid, subject, content, author, answers) '
+                f'SELECT q.id, q.subject, q.content, u.username, '
+                f"COALESCE((SELECT group_concat(a.content, char(10)) FROM {answer_table} a WHERE a.question_id = q.id), '') "
+                f'FROM {question_table} q JOIN auth_user u ON u.id = q.author_id'
+            )
+            cursor.execute(f'SELECT count(*) FROM {FTS_TABLE}')
+            return cursor.fetchone()[0]
@@ -0,0 +1,38 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from common.models import Profile
+from common.storage import previous_name
+from .cache import bump_user_fragments
+from .services.search_service import SearchService
+
+
+def _changed(instance, field, update_fields):
+    # 저장 전 DB 값과 비교 (새 행이거나 update_fields 에 없는 필드는 바뀌지 않은 것으로 본다)
+    if instance._state.adding or (update_fields is not None and field not in update_fields):
+        return False
+    old = type(instance).objects.filter(pk=instance.pk).values_list(field, flat=True).first()
+    return old is not None and old != getattr(instance, field)
+
+
+@receiver(pre_save, sender=User, dispatch_uid='pybo.signals.check_username')
+def check_username(sender, instance, update_fields=None, **kwargs):
+    # 로그인(last_login) 등 username 을 건드리지 않는 저장은 조회하지 않는다
+    instance._username_changed = _changed(instance, 'username', update_fields)
+
+
+@receiver(post_save, sender=User, dispatch_uid='pybo.signals.reindex_author')
+def reindex_author(sender, instance, **kwargs):
+    # 작성자 이름은 검색 인덱스와 질문 상세/목록 프래그먼트에 들어 있다
+    if getattr(instance, '_username_changed', False):
+        SearchService.rename_author(instance.pk, instance.username)
+        bump_user_fragments(instance.pk)
+
+
+@receiver(post_save, sender=Profile, dispatch_uid='pybo.signals.invalidate_avatar')
+def invalidate_avatar(sender, instance, **kwargs):
+    # 프로필 사진(아바타)도 프래그먼트와 목록 카드에 들어 있다 (이전 이름은 common.storage 가 저장 직전에 기록)
+    previous = previous_name(instance, 'profile_picture')
+    if previous is not None and previous != (instance.profile_picture.name or ''):
+        bump_user_fragments(instance.user_id)
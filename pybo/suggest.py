@@ -0,0 +1,136 @@
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.core.cache import cache
+
+from .models import Question
+
+
+SUGGEST_GENERATION_KEY = 'pybo:suggest:generation'
+SUGGEST_DELTA_KEY = 'pybo:suggest:delta:{}'
+
+# 한 접두어로 모으는 최대 후보 수 (이 중 최신 질문 순으로 limit 개 반환)
+MAX_CANDIDATES = 200
+
+# 세대별 변경 내역 보관 시간(초)과, 이보다 많이 뒤처진 프로세스는 변경 내역 대신 전체를 다시 만든다
+DELTA_TIMEOUT = 60 * 60
+MAX_DELTAS = 500
+
+
+def normalize(text):
+    return ' '.join(text.casefold().split())
+
+
+def index_keys(subject):
+    """
+    제목 전체와 각 단어에서 시작하는 접미 문자열 → 중간 단어로도 접두어 검색 가능
+    """
+    words = normalize(subject).split(' ')
+    return {' '.join(words[i:]) for i in range(len(words)) if words[i]}
+
+
+class SubjectIndex:
+    """
+    질문 제목 접두어 인덱스 (정렬된 (키, 질문 id) 배열 + bisect)
+    프로세스마다 하나씩 메모리에 둔다. 쓰기는 캐시의 세대 값을 올리고 그 세대의 변경 내역(질문 id, 제목 또는 삭제)을
+    캐시에 남기며, 각 프로세스는 뒤처진 세대만큼의 변경 내역을 차례로 적용한다.
+    변경 내역이 없거나(만료, 기록 전) MAX_DELTAS 세대 넘게 뒤처졌으면 DB 에서 전체를 다시 만든다.
+    """
+
+    def __init__(self):
+        self._entries = []   # [(key, question_id)] 정렬 상태 유지
+        self._subjects = {}  # question_id → subject
+        self._generation = None
+        self._lock = threading.Lock()
+
+    def rebuild(self, generation=None):
+        entries = []
+        subjects = {}
+        for question_id, subject in Question.objects.values_list('id', 'subject').iterator():
+            subjects[question_id] = subject
+            entries.extend((key, question_id) for key in index_keys(subject))
+        entries.sort()
+        with self._lock:
+            self._entries = entries
+            self._subjects = subjects
+            self._generation = generation
+
+    def ensure_current(self):
+        generation = cache.get(SUGGEST_GENERATION_KEY)
+        if generation is None:
+            cache.add(SUGGEST_GENERATION_KEY, time.time_ns(), None)
+            generation = cache.get(SUGGEST_GENERATION_KEY)
+        if generation == self._generation:
+            return
+        if self._generation is None or not 0 < generation - self._generation <= MAX_DELTAS:
+            self.rebuild(generation)
+            return
+
+        keys = [SUGGEST_DELTA_KEY.format(g) for g in range(self._generation + 1, generation + 1)]
+        deltas = cache.get_many(keys)
+        if len(deltas) != len(keys):
+            self.rebuild(generation)
+            return
+        with self._lock:
+            for key in keys:
+                question_id, subject = deltas[key]
+                self._remove_locked(question_id)
+                if subject is not None:
+                    self._insert_locked(question_id, subject)
+            self._generation = generation
+
+    @staticmethod
+    def _publish(question_id, subject):
+        """
+        세대를 원자적으로 1 올리고 그 세대의 변경 내역을 기록 (subject 가 None 이면 삭제)
+        """
+        try:
+            generation = cache.incr(SUGGEST_GENERATION_KEY)
+        except ValueError:
+            cache.add(SUGGEST_GENERATION_KEY, time.time_ns(), None)
+            generation = cache.incr(SUGGEST_GENERATION_KEY)
+        cache.set(SUGGEST_DELTA_KEY.format(generation), (question_id, subject), DELTA_TIMEOUT)
+
+    def _remove_locked(self, question_id):
+        subject = self._subjects.pop(question_id, None)
+        if subject is None:
+            return
+        for key in index_keys(subject):
+            i = bisect_left(self._entries, (key, question_id))
+            if i < len(self._entries) and self._entries[i] == (key, question_id):
+                del self._entries[i]
+
+    def _insert_locked(self, question_id, subject):
+        self._subjects[question_id] = subject
+        for key in index_keys(subject):
+            insort(self._entries, (key, question_id))
+
+    def add(self, question_id, subject):
+        # 로컬 인덱스도 기록한 변경 내역을 적용해 갱신한다 (그 사이 다른 프로세스의 변경과 순서가 맞도록)
+        self._publish(question_id, subject)
+        self.ensure_current()
+
+    def remove(self, question_id):
+        self._publish(question_id, None)
+        self.ensure_current()
+
+    def suggest(self, prefix, limit=8):
+        """
+        접두어와 일치하는 질문 [(id, subject)] (최신 질문 우선)
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        self.ensure_current()
+        with self._lock:
+            entries, subjects = self._entries, self._subjects
+            matches = set()
+            i = bisect_left(entries, (prefix,))
+            while i < len(entries) and len(matches) < MAX_CANDIDATES and entries[i][0].startswith(prefix):
+                matches.add(entries[i][1])
+                i += 1
+            return [(question_id, subjects[question_id]) for question_id in sorted(matches, reverse=True)[:limit]]
+
+
+subject_index = SubjectIndex()
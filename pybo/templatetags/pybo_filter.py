@@ -1,4 +1,7 @@
 from django import template
+from django.conf import settings
+
+from ..cache import question_version
 
 register = template.Library()
 
@@ -9,4 +12,15 @@ def sub(value, arg):
 
 @register.simple_tag
 def reverse_index(total_count, start_index, counter0):
-    return total_count - (start_index + counter0) + 1
\ No newline at end of file
+    return total_count - (start_index + counter0) + 1
+
+
+@register.simple_tag
+def question_cache_version(question_id):
+    # {% cache %} 키에 넣을 질문 버전 (쓰기 시 bump → 이전 프래그먼트 무효화)
+    return question_version(question_id)
+
+
+@register.simple_tag
+def fragment_cache_timeout():
+    return getattr(settings, 'PYBO_FRAGMENT_CACHE_TIMEOUT', 600)
@@ -1,3 +1,589 @@
-from django.test import TestCase
+from io import StringIO
+from urllib.parse import urlencode
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.http import Http404
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from common.query_budget import QueryBudgetExceeded
+from common.testing import QueryBudgetTestMixin
+from .cache import question_version
+from .search_cache import LRUCache, result_cache
+from .suggest import SUGGEST_DELTA_KEY, SUGGEST_GENERATION_KEY, SubjectIndex
+from .services.answer_service import AnswerService
+from .models import Answer, Question
+from .pagination import (
+    NEWER, OFFSET_PAGE_LIMIT, OLDER, KeysetPaginator, OffsetPaginator, decode_cursor, encode_cursor,
+)
+from .services.comment_service import CommentService
+from .services.counter_service import CounterService
+from .services.question_service import QuestionService
+from .services.search_service import FTS_TABLE, SearchService
+from .votes import vote_buffer
+
+
+class QueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    """
+    목록/상세/검색 페이지가 settings.QUERY_BUDGETS 안에서 동작하는지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.users = [User.objects.create_user(f'user{i}', password='password') for i in range(3)]
+        for i in range(12):
+            question = QuestionService.create_question(f'장고 질문 {i}', f'내용 {i}', cls.author)
+            CommentService.create_question_comment(question.id, '질문 댓글', cls.users[0])
+            for user in cls.users:
+                answer = AnswerService.create_answer(question.id, f'{user.username}의 답변', user)
+                CommentService.create_answer_comment(answer.id, '답변 댓글', cls.author)
+                AnswerService.vote_answer(answer.id, cls.author)
+                QuestionService.vote_question(question.id, user)
+        cls.question = question
+
+    def test_index(self):
+        response = self.client.get(reverse('pybo:index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinQueryBudget(response)
+
+    def test_home(self):
+        response = self.client.get(reverse('index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinQueryBudget(response)
+
+    def test_index_authenticated(self):
+        self.client.force_login(self.users[0])
+        response = self.client.get(reverse('pybo:index'), {'page': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinQueryBudget(response)
+
+    def test_detail(self):
+        self.client.force_login(self.users[0])
+        response = self.client.get(reverse('pybo:detail', args=[self.question.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinQueryBudget(response)
+
+    def test_search(self):
+        for kw in ('장고', '장고 질문', 'user1'):
+            response = self.client.get(reverse('pybo:search'), {'kw': kw})
+            self.assertEqual(response.status_code, 200)
+            self.assertWithinQueryBudget(response)
+
+
+class QueryBudgetRunnerTest(TestCase):
+    """
+    테스트 러너가 QUERY_BUDGET_RAISE 를 켜므로 QueryBudgetTestMixin 없는 테스트의 요청도 예산을 넘으면 실패한다
+    """
+
+    @override_settings(QUERY_BUDGETS={'index': 0})
+    def test_budget_enforced_without_mixin(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get(reverse('index'))
+
+
+class SearchServiceTest(TestCase):
+    """
+    FTS5 검색: 일치, BM25 순위, 짧은 검색어 LIKE 대체, 인덱스 재작성/작성자 이름 변경
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('writer', password='password')
+        cls.other = User.objects.create_user('other', password='password')
+        cls.tuning = QuestionService.create_question('postgres tuning', 'tuning tuning tuning', cls.author)
+        cls.mention = QuestionService.create_question(
+            'slow queries', 'a long question that mentions tuning once among many other words', cls.other)
+        cls.answered = QuestionService.create_question('deploy', 'how do I deploy 50 apps?', cls.other)
+        AnswerService.create_answer(cls.answered.id, 'use a vacuum schedule', cls.author)
+
+    def ids(self, kw, ranked=False):
+        return list(SearchService.search(kw, ranked=ranked).values_list('id', flat=True))
+
+    def test_index_available(self):
+        self.assertTrue(SearchService.is_available())
+
+    def test_match_subject_content_author_and_answers(self):
+        self.assertEqual(self.ids('tuning'), [self.mention.id, self.tuning.id])
+        self.assertEqual(self.ids('vacuum'), [self.answered.id])
+        self.assertEqual(self.ids('writer'), [self.tuning.id])
+        self.assertEqual(self.ids('  postgres   tuning '), [self.tuning.id])
+
+    def test_ranked_by_bm25(self):
+        self.assertEqual(self.ids('tuning', ranked=True), [self.tuning.id, self.mention.id])
+
+    def test_short_keyword_uses_like(self):
+        self.assertEqual(self.ids('50'), [self.answered.id])
+        # LIKE 와일드카드는 문자 그대로 찾는다
+        self.assertEqual(self.ids('5%'), [])
+        self.assertEqual(self.ids('_'), [])
+
+    def test_rebuild_command(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        self.assertEqual(self.ids('vacuum'), [])
+
+        out = StringIO()
+        call_command('rebuild_search_index', stdout=out)
+        self.assertIn('Successfully indexed 3 questions.', out.getvalue())
+        self.assertEqual(self.ids('vacuum'), [self.answered.id])
+
+    def test_author_rename_is_reindexed(self):
+        self.author.username = 'renamed'
+        self.author.save()
+        self.assertEqual(self.ids('renamed'), [self.tuning.id])
+        self.assertEqual(self.ids('writer'), [])
+
+
+class CounterTest(TestCase):
+    """
+    비정규화 카운터(vote/answer/comment_count)와 reconcile_counters 보정
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.voter = User.objects.create_user('voter', password='password')
+        cls.question = QuestionService.create_question('카운터 질문', '내용', cls.author)
+        cls.answer = AnswerService.create_answer(cls.question.id, '답변', cls.voter)
+        CommentService.create_question_comment(cls.question.id, '댓글', cls.voter)
+
+    def test_votes_count_once(self):
+        for _ in range(2):
+            QuestionService.vote_question(self.question.id, self.voter)
+            AnswerService.vote_answer(self.answer.id, self.author)
+        self.question.refresh_from_db()
+        self.answer.refresh_from_db()
+        self.assertEqual((self.question.vote_count, self.question.answer_count, self.question.comment_count), (1, 1, 1))
+        self.assertEqual(self.answer.vote_count, 1)
+
+    def test_concurrent_vote_is_not_counted_twice(self):
+        # 다른 요청이 먼저 추천 행을 넣은 경우 (존재 확인과 추가 사이의 경쟁)
+        Question.voter.through.objects.create(question_id=self.question.id, user_id=self.voter.id)
+        Question.objects.filter(pk=self.question.pk).update(vote_count=1)
+        question = QuestionService.vote_question(self.question.id, self.voter)
+        self.assertEqual(question.vote_count, 1)
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.vote_count, 1)
+
+    def test_reconcile_counters(self):
+        Question.objects.filter(pk=self.question.pk).update(vote_count=5, answer_count=0)
+        Answer.objects.filter(pk=self.answer.pk).update(comment_count=3)
+
+        out = StringIO()
+        call_command('reconcile_counters', '--dry-run', stdout=out)
+        self.assertIn('Found drift in 1 questions and 1 answers.', out.getvalue())
+        self.assertEqual(Question.objects.get(pk=self.question.pk).vote_count, 5)
+
+        out = StringIO()
+        call_command('reconcile_counters', stdout=out)
+        self.assertIn('Successfully repaired 1 questions and 1 answers.', out.getvalue())
+        question = Question.objects.get(pk=self.question.pk)
+        self.assertEqual((question.vote_count, question.answer_count), (0, 1))
+        self.assertEqual(Answer.objects.get(pk=self.answer.pk).comment_count, 0)
+        self.assertEqual(CounterService.reconcile(), (0, 0))
+
+
+class KeysetPaginationTest(TestCase):
+    """
+    커서 페이지네이션: 토큰 왕복, 이전/최신 방향 이동, 잘못된 토큰, 번호 페이지 제한
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        for i in range(7):
+            QuestionService.create_question(f'페이지 질문 {i}', '내용', cls.author)
+        # 같은 시각의 글도 id 로 순서가 정해진다
+        Question.objects.update(create_date=Question.objects.first().create_date)
+        cls.ids = list(Question.objects.order_by('-create_date', '-id').values_list('id', flat=True))
+
+    def paginator(self):
+        return KeysetPaginator(Question.objects.order_by('-create_date', '-id'), 3)
+
+    def test_cursor_round_trip(self):
+        question = Question.objects.get(pk=self.ids[0])
+        direction, create_date, pk = decode_cursor(encode_cursor(question, OLDER))
+        self.assertEqual((direction, create_date, pk), (OLDER, question.create_date, question.id))
+        for token in ('', 'not-a-cursor', encode_cursor(question, 'x')):
+            with self.assertRaises(ValueError):
+                decode_cursor(token)
+
+    def test_walk_older_then_newer(self):
+        pages = [self.paginator().page()]
+        while pages[-1].older_cursor:
+            pages.append(self.paginator().page(pages[-1].older_cursor))
+        self.assertEqual([[q.id for q in page] for page in pages], [self.ids[0:3], self.ids[3:6], self.ids[6:]])
+        self.assertIsNone(pages[0].newer_cursor)
+
+        back = self.paginator().page(pages[-1].newer_cursor)
+        self.assertEqual([q.id for q in back], self.ids[3:6])
+        back = self.paginator().page(back.newer_cursor)
+        self.assertEqual([q.id for q in back], self.ids[0:3])
+        self.assertFalse(back.has_newer)
+        self.assertEqual(decode_cursor(back.older_cursor)[0], OLDER)
+        self.assertEqual(decode_cursor(pages[1].newer_cursor)[0], NEWER)
+
+    def test_bad_cursor_falls_back_to_first_page(self):
+        page = self.paginator().page('garbage')
+        self.assertEqual([q.id for q in page], self.ids[0:3])
+        response = self.client.get(reverse('pybo:index'), {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_offset_pages_without_count(self):
+        paginator = OffsetPaginator(Question.objects.order_by('-create_date', '-id'), 2)
+        first = paginator.page(1)
+        self.assertEqual(([q.id for q in first], list(first.page_range)), (self.ids[0:2], [1, 2, 3]))
+        self.assertTrue(first.has_next())
+        third = paginator.page(3)
+        self.assertEqual(([q.id for q in third], list(third.page_range)), (self.ids[4:6], [1, 2, 3, 4]))
+        last = paginator.page(4)
+        self.assertEqual((list(last.page_range), last.has_next()), ([2, 3, 4], False))
+        for number in (5, 'x'):
+            with self.assertRaises(Http404):
+                paginator.page(number)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('pybo:index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([q['sql'] for q in queries if 'COUNT(' in q['sql'].upper()])
+
+    def test_deep_offset_pages_redirect(self):
+        expected = f"{reverse('pybo:search')}?{urlencode({'kw': '페이지', 'page': OFFSET_PAGE_LIMIT})}"
+        for page in (str(OFFSET_PAGE_LIMIT + 1), 'last'):
+            response = self.client.get(reverse('pybo:search'), {'kw': '페이지', 'page': page})
+            self.assertRedirects(response, expected, fetch_redirect_response=False)
+        # 정확도순은 커서가 없으므로 번호 페이지를 그대로 쓴다
+        response = self.client.get(reverse('pybo:search'), {'kw': '페이지', 'sort': 'rank', 'page': 1})
+        self.assertEqual(response.status_code, 200)
+
+
+class QuestionDetailQueryTest(TestCase):
+    """
+    get_question_detail 의 쿼리 수가 답변/댓글 수와 무관하게 고정(4회)인지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.question = QuestionService.create_question('상세 질문', '내용', cls.author)
+
+    def load_detail(self):
+        # 템플릿이 쓰는 관계를 모두 따라가 본다 (지연 로딩이 있으면 쿼리 수가 늘어난다)
+        question = QuestionService.get_question_detail(self.question.id)
+        seen = [question.author.profile.profile_picture]
+        for comment in question.comment_set.all():
+            seen.append(comment.author.profile.profile_picture)
+        for answer in question.answer_set.all():
+            seen.append(answer.author.profile.profile_picture)
+            for comment in answer.comment_set.all():
+                seen.append(comment.author.profile.profile_picture)
+        return len(seen)
+
+    def add_thread(self, n):
+        for i in range(n):
+            user = User.objects.create_user(f'user{n}_{i}', password='password')
+            answer = AnswerService.create_answer(self.question.id, '답변', user)
+            CommentService.create_answer_comment(answer.id, '답변 댓글', self.author)
+            CommentService.create_question_comment(self.question.id, '질문 댓글', user)
+
+    def test_query_count_stays_flat(self):
+        self.add_thread(1)
+        with self.assertNumQueries(4):
+            self.assertEqual(self.load_detail(), 4)
+
+        self.add_thread(10)
+        with self.assertNumQueries(4):
+            self.assertEqual(self.load_detail(), 34)
+
+
+class FragmentCacheTest(QueryBudgetTestMixin, TestCase):
+    """
+    질문 상세 프래그먼트 캐시가 쓰기 후 바로 갱신되는지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.other = User.objects.create_user('other', password='password')
+        cls.question = QuestionService.create_question('캐시 질문', '원래 내용', cls.author)
+
+    def get_detail(self):
+        return self.client.get(reverse('pybo:detail', args=[self.question.id]))
+
+    def test_writes_invalidate_fragments(self):
+        self.assertContains(self.get_detail(), '원래 내용')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            QuestionService.modify_question(self.question.id, '캐시 질문', '바뀐 내용', self.author)
+        self.assertContains(self.get_detail(), '바뀐 내용')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            answer = AnswerService.create_answer(self.question.id, '새 답변', self.other)
+        self.assertContains(self.get_detail(), '새 답변')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CommentService.create_answer_comment(answer.id, '새 댓글', self.author)
+        self.assertContains(self.get_detail(), '새 댓글')
+
+    def test_version_bumps_after_commit(self):
+        version = question_version(self.question.id)
+        with self.captureOnCommitCallbacks() as callbacks:
+            QuestionService.vote_question(self.question.id, self.other)
+            # 커밋 전에는 이전 버전 그대로 (다른 요청이 커밋 전 데이터를 새 버전으로 캐시하지 않도록)
+            self.assertEqual(question_version(self.question.id), version)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(question_version(self.question.id), version)
+
+    def test_author_changes_invalidate_fragments(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            answer = AnswerService.create_answer(self.question.id, '다른 사람 답변', self.other)
+        self.assertContains(self.get_detail(), 'other')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.username = 'renamed'
+            self.other.save()
+        self.assertContains(self.get_detail(), 'renamed')
+
+        version = question_version(answer.question_id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.last_login = self.other.date_joined
+            self.other.save(update_fields=['last_login'])  # 로그인은 무효화하지 않는다
+        self.assertEqual(question_version(answer.question_id), version)
+
+    def test_warm_fragments_skip_answer_queries(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            answer = AnswerService.create_answer(self.question.id, '답변', self.other)
+            CommentService.create_answer_comment(answer.id, '댓글', self.author)
+            CommentService.create_question_comment(self.question.id, '질문 댓글', self.other)
+        with CaptureQueriesContext(connection) as cold:
+            self.assertContains(self.get_detail(), '댓글')
+        with CaptureQueriesContext(connection) as warm:
+            self.assertContains(self.get_detail(), '댓글')
+        # 질문 + 질문 댓글 + 답변 + 답변 댓글 → 두 프래그먼트가 모두 캐시에 있으면 질문 조회만
+        self.assertEqual(len(cold) - len(warm), 3)
+
+    def test_owner_links_are_user_independent(self):
+        self.client.force_login(self.other)
+        response = self.get_detail()
+        self.assertContains(response, f'data-owner="{self.author.id}"')
+        self.assertContains(response, f'<meta name="current-user-id" content="{self.other.id}">')
+
+
+class AnonymousPageCacheTest(QueryBudgetTestMixin, TestCase):
+    """
+    비로그인 목록/검색 페이지 캐시와 목록 세대 무효화 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.question = QuestionService.create_question('캐시 목록 질문', '내용', cls.author)
+
+    def test_anonymous_index_is_cached(self):
+        self.assertEqual(self.client.get(reverse('pybo:index'))['X-Page-Cache'], 'miss')
+        response = self.client.get(reverse('pybo:index'))
+        self.assertEqual(response['X-Page-Cache'], 'hit')
+        self.assertContains(response, '캐시 목록 질문')
+
+    def test_search_key_uses_normalized_kw(self):
+        self.client.get(reverse('pybo:search'), {'kw': '캐시 목록'})
+        response = self.client.get(reverse('pybo:search'), {'kw': '  캐시   목록 ', 'utm': 'x'})
+        self.assertEqual(response['X-Page-Cache'], 'hit')
+
+    def test_writes_bump_list_generation(self):
+        self.client.get(reverse('pybo:index'))
+        with self.captureOnCommitCallbacks(execute=True):
+            QuestionService.create_question('새로 올린 질문', '내용', self.author)
+        response = self.client.get(reverse('pybo:index'))
+        self.assertEqual(response['X-Page-Cache'], 'miss')
+        self.assertContains(response, '새로 올린 질문')
+
+    def test_authenticated_requests_bypass_cache(self):
+        self.client.get(reverse('pybo:index'))
+        self.client.force_login(self.author)
+        response = self.client.get(reverse('pybo:index'))
+        self.assertNotIn('X-Page-Cache', response)
+
+
+class SuggestTest(QueryBudgetTestMixin, TestCase):
+    """
+    자동완성 접두어 인덱스가 서비스 쓰기와 함께 갱신되는지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.first = QuestionService.create_question('Django 모델 질문', '내용', cls.author)
+        cls.second = QuestionService.create_question('장고 Django 뷰 질문', '내용', cls.author)
+
+    def suggest(self, q):
+        response = self.client.get(reverse('pybo:suggest'), {'q': q})
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinQueryBudget(response)
+        return [item['id'] for item in response.json()['results']]
+
+    def test_prefix_matches_subject_words(self):
+        self.assertEqual(self.suggest('django'), [self.second.id, self.first.id])
+        self.assertEqual(self.suggest('장고'), [self.second.id])
+        self.assertEqual(self.suggest('없는'), [])
+
+    def test_service_writes_update_index(self):
+        self.suggest('django')
+        QuestionService.modify_question(self.first.id, 'Flask 질문', '내용', self.author)
+        self.assertEqual(self.suggest('django'), [self.second.id])
+        QuestionService.delete_question(self.second.id, self.author)
+        self.assertEqual(self.suggest('django'), [])
+
+    def test_warm_index_runs_no_queries(self):
+        self.suggest('dj')
+        with self.assertNumQueries(0):
+            self.client.get(reverse('pybo:suggest'), {'q': 'dja'})
+
+    def test_other_process_changes_apply_incrementally(self):
+        index = SubjectIndex()
+        index.ensure_current()
+        other_process = SubjectIndex()
+        question = Question.objects.create(subject='Django 다른 프로세스', content='내용',
+                                           create_date=timezone.now(), author=self.author)
+        other_process.add(question.id, question.subject)
+        other_process.remove(self.first.id)
+
+        # 다른 프로세스의 쓰기는 변경 내역만 적용하고 질문 전체를 다시 읽지 않는다
+        with self.assertNumQueries(0):
+            self.assertEqual([question_id for question_id, _ in index.suggest('django')],
+                             [question.id, self.second.id])
+
+        # 변경 내역이 사라졌거나 너무 뒤처졌으면 전체를 다시 만든다
+        other_process.add(self.first.id, self.first.subject)
+        cache.delete(SUGGEST_DELTA_KEY.format(cache.get(SUGGEST_GENERATION_KEY)))
+        with self.assertNumQueries(1):
+            self.assertIn(self.first.id, [question_id for question_id, _ in index.suggest('django')])
+
+
+class SearchResultCacheTest(QueryBudgetTestMixin, TestCase):
+    """
+    검색 결과 id 목록 LRU 캐시 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        for i in range(12):
+            QuestionService.create_question(f'캐시 검색 질문 {i}', '내용', cls.author)
+
+    def setUp(self):
+        super().setUp()
+        result_cache.clear()
+
+    def test_pages_share_cached_ids(self):
+        self.client.get(reverse('pybo:search'), {'kw': '캐시 검색'})
+        hits = result_cache.hits
+        response = self.client.get(reverse('pybo:search'), {'kw': ' 캐시  검색', 'page': 2})
+        self.assertEqual(result_cache.hits, hits + 1)
+        self.assertEqual(
+            [q.subject for q in response.context['question_list']],
+            [f'캐시 검색 질문 {i}' for i in (2, 1, 0)],
+        )
+
+    def test_writes_change_key(self):
+        self.client.get(reverse('pybo:search'), {'kw': '캐시 검색'})
+        with self.captureOnCommitCallbacks(execute=True):
+            QuestionService.create_question('캐시 검색 새 질문', '내용', self.author)
+        response = self.client.get(reverse('pybo:search'), {'kw': '캐시 검색'})
+        self.assertEqual(response.context['paginator'].count, 13)
+
+    def test_lru_eviction_by_size_and_age(self):
+        cache = LRUCache(max_entries=2, max_age=60)
+        cache.set('a', (1,))
+        cache.set('b', (2,))
+        cache.get('a')
+        cache.set('c', (3,))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), (1,))
+
+        cache.max_age = -1
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.evictions, 2)
+
+    def test_lru_bounded_by_total_ids(self):
+        cache = LRUCache(max_entries=10, max_age=60, max_items=5)
+        cache.set('a', (1, 2))
+        cache.set('b', (3, 4))
+        cache.set('c', (5, 6))  # 합이 6 → 가장 오래된 a 제거
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['items'], 4)
+
+        cache.set('huge', tuple(range(6)))  # 혼자서 한도를 넘는 값은 저장하지 않는다
+        self.assertIsNone(cache.get('huge'))
+        self.assertEqual(cache.get('b'), (3, 4))
+
+        cache.set('b', (3,))
+        self.assertEqual(cache.stats()['items'], 3)
+        cache.clear()
+        self.assertEqual(cache.stats()['items'], 0)
+
+
+class VoteJsonTest(QueryBudgetTestMixin, TestCase):
+    """
+    AJAX 추천 엔드포인트와 write-behind 버퍼 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.voters = [User.objects.create_user(f'voter{i}', password='password') for i in range(3)]
+        cls.question = QuestionService.create_question('추천 질문', '내용', cls.author)
+        cls.answer = AnswerService.create_answer(cls.question.id, '추천 답변', cls.voters[0])
+
+    def vote(self, user, url_name, obj_id):
+        self.client.force_login(user)
+        return self.client.post(reverse(url_name, args=[obj_id]))
+
+    @override_settings(PYBO_VOTE_FLUSH_INTERVAL=0)
+    def test_vote_returns_count_and_state(self):
+        response = self.vote(self.voters[1], 'pybo:vote_question_json', self.question.id)
+        self.assertEqual(response.json(), {'id': self.question.id, 'vote_count': 1, 'voted': True})
+        response = self.vote(self.voters[1], 'pybo:vote_question_json', self.question.id)
+        self.assertEqual(response.json()['vote_count'], 1)
+
+        self.assertEqual(self.vote(self.author, 'pybo:vote_question_json', self.question.id).status_code, 400)
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.vote_count, 1)
+
+    @override_settings(PYBO_VOTE_FLUSH_INTERVAL=60)
+    def test_burst_is_flushed_in_one_batch(self):
+        for voter in self.voters[1:]:
+            response = self.vote(voter, 'pybo:vote_answer_json', self.answer.id)
+        self.assertEqual(response.json()['vote_count'], 2)
+        self.answer.refresh_from_db()
+        self.assertEqual(self.answer.vote_count, 0)
+
+        with self.assertNumQueries(5):  # savepoint, bulk insert, 카운터 갱신, 질문 id 조회, release
+            vote_buffer.flush()
+        self.answer.refresh_from_db()
+        self.assertEqual(self.answer.vote_count, 2)
+        self.assertEqual(self.answer.voter.count(), 2)
+
+    @override_settings(PYBO_VOTE_FLUSH_INTERVAL=60)
+    def test_count_after_flush_is_not_doubled(self):
+        stale = Answer.objects.get(pk=self.answer.id)
+        vote_buffer.vote(stale, self.voters[1])
+        vote_buffer.flush()
+        # flush 전에 읽은 객체(vote_count=0)로 추천해도 반영된 추천을 다시 세지 않는다
+        self.assertEqual(vote_buffer.vote(stale, self.voters[2]), (2, True))
+        self.assertEqual(vote_buffer.vote(stale, self.voters[1]), (2, True))
+        vote_buffer.flush()
+
+    def test_redirect_urls_still_work(self):
+        self.client.force_login(self.voters[1])
+        response = self.client.get(reverse('pybo:vote_question', args=[self.question.id]))
+        self.assertRedirects(response, reverse('pybo:detail', args=[self.question.id]))
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.vote_count, 1)
@@ -1,7 +1,7 @@
 from django.urls import path
 
 from .views import base_views, question_views, answer_views, comment_views, vote_views
-from .views.base_views import IndexView, DetailView, SearchView
+from .views.base_views import IndexView, DetailView, SearchView, SuggestView
 from .views.question_views import QuestionCreateView, QuestionModifyView, QuestionDeleteView
 from .views.answer_views import AnswerCreateView, AnswerModifyView, AnswerDeleteView
 from .views.comment_views import (
@@ -16,6 +16,7 @@ urlpatterns = [
     path('', IndexView.as_view(), name='index'),
     path('<int:question_id>/', DetailView.as_view(), name='detail'),
     path('search/', SearchView.as_view(), name='search'),
+    path('search/suggest/', SuggestView.as_view(), name='suggest'),
 
     # question_views.py
     path('question/create/', QuestionCreateView.as_view(), name='question_create'),
@@ -38,4 +39,6 @@ urlpatterns = [
     # vote_views.py
     path('vote/question/<int:question_id>/', vote_views.vote_question, name='vote_question'),
     path('vote/answer/<int:answer_id>/', vote_views.vote_answer, name='vote_answer'),
+    path('vote/question/<int:question_id>/json/', vote_views.vote_question_json, name='vote_question_json'),
+    path('vote/answer/<int:answer_id>/json/', vote_views.vote_answer_json, name='vote_answer_json'),
 ]
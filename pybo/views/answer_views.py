@@ -20,11 +20,8 @@ class AnswerCreateView(View):
     pybo 답변등록 뷰
     """
     def post(self, request, question_id):
+        form = AnswerForm(request.POST)
         try:
-            # 서비스 레이어를 통해 질문 조회
-            question = QuestionService.get_question(question_id)
-
-            form = AnswerForm(request.POST)
             if form.is_valid():
                 # 서비스 레이어를 통해 답변 생성
                 answer = AnswerService.create_answer(
@@ -33,22 +30,24 @@ class AnswerCreateView(View):
                     user=request.user
                 )
                 return redirect('pybo:detail', question_id=question_id)
+
+            # 서비스 레이어를 통해 상세 페이지용 질문 조회
+            question = QuestionService.get_question_with_author(question_id)
         except ResourceNotFoundException:
             question = get_object_or_404(Question, pk=question_id)
 
-        form = AnswerForm()
-        context = {'question': question, 'form': form}
+        context = {**QuestionService.detail_context(question), 'form': form}
         return render(request, 'pybo/question_detail.html', context)
 
     def get(self, request, question_id):
         try:
-            # 서비스 레이어를 통해 질문 조회
-            question = QuestionService.get_question(question_id)
+            # 서비스 레이어를 통해 상세 페이지용 질문 조회
+            question = QuestionService.get_question_with_author(question_id)
         except ResourceNotFoundException:
             question = get_object_or_404(Question, pk=question_id)
 
         form = AnswerForm()
-        context = {'question': question, 'form': form}
+        context = {**QuestionService.detail_context(question), 'form': form}
         return render(request, 'pybo/question_detail.html', context)
 
 
@@ -67,7 +66,7 @@ class AnswerModifyView(View):
             # 권한 확인
             if request.user != answer.author:
                 messages.error(request, '수정권한이 없습니다')
-                return redirect('pybo:detail', question_id=answer.question.id)
+                return redirect('pybo:detail', question_id=answer.question_id)
 
             form = AnswerForm(instance=answer)
             return render(request, self.template_name, {'answer': answer, 'form': form})
@@ -79,7 +78,7 @@ class AnswerModifyView(View):
             # 서비스 레이어를 통해 답변 수정
             try:
                 answer = AnswerService.get_answer(answer_id)
-                question_id = answer.question.id
+                question_id = answer.question_id
 
                 answer = AnswerService.modify_answer(
                     answer_id=answer_id,
@@ -90,7 +89,7 @@ class AnswerModifyView(View):
             except PermissionDeniedException:
                 answer = AnswerService.get_answer(answer_id)
                 messages.error(request, '수정권한이 없습니다')
-                return redirect('pybo:detail', question_id=answer.question.id)
+                return redirect('pybo:detail', question_id=answer.question_id)
         except ResourceNotFoundException:
             return get_object_or_404(Answer, pk=answer_id)
 
@@ -105,7 +104,7 @@ class AnswerDeleteView(View):
             # 서비스 레이어를 통해 답변 조회 및 삭제
             try:
                 answer = AnswerService.get_answer(answer_id)
-                question_id = answer.question.id
+                question_id = answer.question_id
 
                 AnswerService.delete_answer(
                     answer_id=answer_id,
@@ -122,7 +121,7 @@ class AnswerDeleteView(View):
                 messages.error(request, '삭제권한이 없습니다')
             else:
                 answer.delete()
-            return redirect('pybo:detail', question_id=answer.question.id)
+            return redirect('pybo:detail', question_id=answer.question_id)
 
 
 # For backwards compatibility
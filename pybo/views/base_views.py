@@ -1,17 +1,36 @@
+import logging
+from urllib.parse import quote
+
+from django.conf import settings
 from django.core.paginator import Paginator
-from django.shortcuts import render, get_object_or_404
+from django.http import JsonResponse
+from django.shortcuts import render, get_object_or_404, redirect
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.generic import ListView, DetailView
-from django.db.models import Q
 
+from ..cache import anonymous_page_cache
 from ..models import Question
+from ..pagination import (
+    KeysetPaginator, KeysetPage, OffsetPage, OffsetPaginator, OFFSET_PAGE_LIMIT, OLDER, PAGE_LINK_RADIUS,
+    encode_cursor,
+)
 from ..services.question_service import QuestionService
+from ..search_cache import SearchResultList, search_result_ids
+from ..services.search_service import SearchService
+from ..suggest import subject_index
 from common.exceptions import ResourceNotFoundException
+from common.metrics import log_sampled
+
+logger = logging.getLogger(__name__)
 
 
+@method_decorator(anonymous_page_cache, name='dispatch')
 class IndexView(ListView):
     """
-    pybo 목록 출력 뷰
+    pybo 목록 출력 뷰 (비로그인 요청은 페이지 전체 캐시, SearchView 도 동일)
     """
     template_name = 'pybo/question_list.html'
     context_object_name = 'question_list'
@@ -19,37 +38,88 @@ class IndexView(ListView):
 
     def get_queryset(self):
         # 검색어
-        kw = self.request.GET.get('kw', '')  # 검색어
+        kw = SearchService.normalize_keyword(self.request.GET.get('kw', ''))  # 검색어
 
         # 검색어에 따른 질문 목록 조회 (페이지네이션은 ListView가 처리)
         if kw:
-            question_list = Question.objects.filter(
-                Q(subject__icontains=kw) |  # Subject contains keyword
-                Q(content__icontains=kw) |  # Content contains keyword
-                Q(author__username__icontains=kw) |  # Author username contains keyword
-                Q(answer__content__icontains=kw)  # Answer content contains keyword
-            ).distinct().order_by('-create_date')
+            question_list = SearchService.search(kw)
         else:
-            question_list = Question.objects.order_by('-create_date')
-
-        # Debug: Print the number of questions
-        print(f"Total questions: {question_list.count()}")
-
-        return question_list
+            question_list = Question.objects.order_by('-create_date', '-id')
+
+        # 카드마다 작성자/프로필을 조회하지 않도록 함께 가져온다
+        return question_list.select_related('author__profile')
+
+    def use_cursor(self):
+        # 커서는 (create_date, id) 정렬에서만 사용할 수 있다
+        return True
+
+    def get(self, request, *args, **kwargs):
+        # OFFSET_PAGE_LIMIT 를 넘는 번호 페이지(깊은 OFFSET 스캔)는 마지막 번호 페이지로 보낸다 (이후는 커서로 이동)
+        page = request.GET.get(self.page_kwarg, '')
+        if self.use_cursor() and (page == 'last' or (page.isdigit() and int(page) > OFFSET_PAGE_LIMIT)):
+            query = request.GET.copy()
+            query[self.page_kwarg] = OFFSET_PAGE_LIMIT
+            return redirect(f'{request.path}?{query.urlencode()}')
+        return super().get(request, *args, **kwargs)
+
+    def search_ranked(self):
+        return False
+
+    def paginate_queryset(self, queryset, page_size):
+        cursor = self.request.GET.get('cursor')
+        if cursor and self.use_cursor():
+            # 커서 모드: COUNT(*)/OFFSET 없이 (create_date, id) 범위 조회
+            page = KeysetPaginator(queryset, page_size).page(cursor)
+            return None, page, page.object_list, True
+
+        kw = SearchService.normalize_keyword(self.request.GET.get('kw', ''))
+        if not kw and self.use_cursor():
+            # 번호 페이지(OFFSET_PAGE_LIMIT 까지)도 COUNT(*) 없이 조회, 목록 번호(paginator.count)는 표시하지 않는다
+            page = OffsetPaginator(queryset, page_size).page(self.request.GET.get(self.page_kwarg) or 1)
+            return None, page, page.object_list, page.has_other_pages()
+        if kw:
+            # 검색어별 결과 id 목록은 LRU 캐시에서, 현재 페이지 행만 id__in 으로 조회
+            queryset = SearchResultList(
+                search_result_ids(kw, ranked=self.search_ranked()),
+                Question.objects.select_related('author__profile'),
+            )
+        return super().paginate_queryset(queryset, page_size)
 
     def get_context_data(self, **kwargs):
         # 기본 컨텍스트 데이터 가져오기
         context = super().get_context_data(**kwargs)
         # 검색어 추가
-        context['kw'] = self.request.GET.get('kw', '')
-
-        # Debug: Print pagination info
-        if 'page_obj' in context:
-            print(f"Page {context['page_obj'].number} of {context['page_obj'].paginator.num_pages}")
-            print(f"Has previous: {context['page_obj'].has_previous()}, Has next: {context['page_obj'].has_next()}")
-            print(f"Page range: {list(context['page_obj'].paginator.page_range)}")
-        else:
-            print("No page_obj in context")
+        context['kw'] = SearchService.normalize_keyword(self.request.GET.get('kw', ''))
+
+        # 최신/이전 글 커서
+        page = context.get('page_obj')
+        context['cursor_mode'] = isinstance(page, KeysetPage)
+        query = {'kw': context['kw'], 'sort': self.request.GET.get('sort', '')}
+        context['query_suffix'] = ''.join(f'&{key}={quote(value)}' for key, value in query.items() if value)
+        if context['cursor_mode']:
+            context['newer_cursor'] = page.newer_cursor
+            context['older_cursor'] = page.older_cursor
+        elif isinstance(page, OffsetPage):
+            context['page_numbers'] = page.page_range
+        elif page is not None:
+            context['page_numbers'] = [
+                number for number in page.paginator.page_range
+                if abs(number - page.number) <= PAGE_LINK_RADIUS
+                and (number <= OFFSET_PAGE_LIMIT or not self.use_cursor())
+            ]
+        if not context['cursor_mode'] and page is not None and self.use_cursor() and page.has_next():
+            context['older_cursor'] = encode_cursor(list(page.object_list)[-1], OLDER)
+
+        # 페이지네이션 정보 샘플링 로그
+        if context['cursor_mode']:
+            log_sampled(logger, 'question_list', view=type(self).__name__, mode='cursor',
+                        has_newer=page.has_newer, has_older=page.has_older)
+        elif isinstance(page, OffsetPage):
+            log_sampled(logger, 'question_list', view=type(self).__name__, mode='offset',
+                        page=page.number, has_next=page.has_next())
+        elif page is not None:
+            log_sampled(logger, 'question_list', view=type(self).__name__, mode='offset',
+                        page=page.number, num_pages=page.paginator.num_pages)
 
         return context
 
@@ -64,13 +134,18 @@ class DetailView(DetailView):
     pk_url_kwarg = 'question_id'
 
     def get_object(self, queryset=None):
-        # 서비스 레이어를 통해 질문 조회
+        # 서비스 레이어를 통해 질문과 작성자 프로필만 조회 (답변/댓글은 get_context_data 에서 지연 조회)
         try:
-            return QuestionService.get_question(self.kwargs.get(self.pk_url_kwarg))
+            return QuestionService.get_question_with_author(self.kwargs.get(self.pk_url_kwarg))
         except ResourceNotFoundException:
             # Django's get_object_or_404 equivalent
             return get_object_or_404(Question, pk=self.kwargs.get(self.pk_url_kwarg))
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(QuestionService.detail_context(self.object))
+        return context
+
 
 class SearchView(IndexView):
     """
@@ -80,27 +155,51 @@ class SearchView(IndexView):
 
     def get_queryset(self):
         # 검색어
-        kw = self.request.GET.get('kw', '')
+        kw = SearchService.normalize_keyword(self.request.GET.get('kw', ''))
 
         # 검색어가 없으면 빈 쿼리셋 반환
         if not kw:
             return Question.objects.none()
 
-        # 검색어에 따른 질문 목록 조회
-        question_list = Question.objects.filter(
-            Q(subject__icontains=kw) |  # Subject contains keyword
-            Q(content__icontains=kw) |  # Content contains keyword
-            Q(author__username__icontains=kw) |  # Author username contains keyword
-            Q(answer__content__icontains=kw)  # Answer content contains keyword
-        ).distinct().order_by('-create_date')
+        # 검색어에 따른 질문 목록 조회 (sort=rank 이면 BM25 정확도순)
+        question_list = SearchService.search(kw, ranked=self.search_ranked())
 
-        return question_list
+        return question_list.select_related('author__profile')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['is_search'] = True
+        context['sort'] = self.request.GET.get('sort', '')
         return context
 
+    def use_cursor(self):
+        # BM25 정확도순은 번호 페이지네이션만 지원
+        return self.request.GET.get('sort') != 'rank'
+
+    def search_ranked(self):
+        return self.request.GET.get('sort') == 'rank'
+
+
+class SuggestView(View):
+    """
+    검색어 자동완성 뷰 (메모리 접두어 인덱스 사용, 요청마다 DB 조회 없음)
+    """
+
+    def get(self, request):
+        q = request.GET.get('q', '')[:100]
+        try:
+            limit = min(int(request.GET.get('limit', settings.PYBO_SUGGEST_LIMIT)), settings.PYBO_SUGGEST_LIMIT)
+        except ValueError:
+            limit = settings.PYBO_SUGGEST_LIMIT
+
+        results = [
+            {'id': question_id, 'subject': subject, 'url': reverse('pybo:detail', args=[question_id])}
+            for question_id, subject in subject_index.suggest(q, max(limit, 1))
+        ]
+        response = JsonResponse({'q': q, 'results': results})
+        patch_cache_control(response, public=True, max_age=settings.PYBO_SUGGEST_MAX_AGE)
+        return response
+
 
 # For backwards compatibility
 def index(request):
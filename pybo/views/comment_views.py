@@ -67,7 +67,7 @@ class CommentModifyQuestionView(View):
             # 권한 확인
             if request.user != comment.author:
                 messages.error(request, '댓글수정권한이 없습니다')
-                return redirect('pybo:detail', question_id=comment.question.id)
+                return redirect('pybo:detail', question_id=comment.question_id)
 
             form = CommentForm(instance=comment)
             return render(request, self.template_name, {'form': form})
@@ -79,7 +79,7 @@ class CommentModifyQuestionView(View):
             # 서비스 레이어를 통해 댓글 수정
             try:
                 comment = CommentService.get_comment(comment_id)
-                question_id = comment.question.id
+                question_id = comment.question_id
 
                 comment = CommentService.modify_comment(
                     comment_id=comment_id,
@@ -90,7 +90,7 @@ class CommentModifyQuestionView(View):
             except PermissionDeniedException:
                 comment = CommentService.get_comment(comment_id)
                 messages.error(request, '댓글수정권한이 없습니다')
-                return redirect('pybo:detail', question_id=comment.question.id)
+                return redirect('pybo:detail', question_id=comment.question_id)
         except ResourceNotFoundException:
             return get_object_or_404(Comment, pk=comment_id)
 
@@ -105,7 +105,7 @@ class CommentDeleteQuestionView(View):
             # 서비스 레이어를 통해 댓글 조회 및 삭제
             try:
                 comment = CommentService.get_comment(comment_id)
-                question_id = comment.question.id
+                question_id = comment.question_id
 
                 CommentService.delete_comment(
                     comment_id=comment_id,
@@ -115,7 +115,7 @@ class CommentDeleteQuestionView(View):
             except PermissionDeniedException:
                 comment = CommentService.get_comment(comment_id)
                 messages.error(request, '댓글삭제권한이 없습니다')
-                return redirect('pybo:detail', question_id=comment.question.id)
+                return redirect('pybo:detail', question_id=comment.question_id)
         except ResourceNotFoundException:
             comment = get_object_or_404(Comment, pk=comment_id)
             if request.user != comment.author:
@@ -148,9 +148,8 @@ class CommentCreateAnswerView(View):
                     user=request.user
                 )
 
-                # 답변의 질문 ID 조회
-                answer = AnswerService.get_answer(answer_id)
-                return redirect('pybo:detail', question_id=answer.question.id)
+                # 답변의 질문 ID 조회 (댓글에 연결된 답변 사용, 추가 조회 없음)
+                return redirect('pybo:detail', question_id=comment.answer.question_id)
             except ResourceNotFoundException:
                 # 답변이 존재하지 않는 경우
                 answer = get_object_or_404(Answer, pk=answer_id)
@@ -161,7 +160,7 @@ class CommentCreateAnswerView(View):
                 comment.create_date = timezone.now()
                 comment.answer = answer
                 comment.save()
-                return redirect('pybo:detail', question_id=answer.question.id)
+                return redirect('pybo:detail', question_id=answer.question_id)
 
         return render(request, self.template_name, {'form': form})
 
@@ -181,7 +180,7 @@ class CommentModifyAnswerView(View):
             # 권한 확인
             if request.user != comment.author:
                 messages.error(request, '댓글수정권한이 없습니다')
-                return redirect('pybo:detail', question_id=comment.answer.question.id)
+                return redirect('pybo:detail', question_id=comment.answer.question_id)
 
             form = CommentForm(instance=comment)
             return render(request, self.template_name, {'form': form})
@@ -193,7 +192,7 @@ class CommentModifyAnswerView(View):
             # 서비스 레이어를 통해 댓글 수정
             try:
                 comment = CommentService.get_comment(comment_id)
-                question_id = comment.answer.question.id
+                question_id = comment.answer.question_id
 
                 comment = CommentService.modify_comment(
                     comment_id=comment_id,
@@ -204,7 +203,7 @@ class CommentModifyAnswerView(View):
             except PermissionDeniedException:
                 comment = CommentService.get_comment(comment_id)
                 messages.error(request, '댓글수정권한이 없습니다')
-                return redirect('pybo:detail', question_id=comment.answer.question.id)
+                return redirect('pybo:detail', question_id=comment.answer.question_id)
         except ResourceNotFoundException:
             return get_object_or_404(Comment, pk=comment_id)
 
@@ -219,7 +218,7 @@ class CommentDeleteAnswerView(View):
             # 서비스 레이어를 통해 댓글 조회 및 삭제
             try:
                 comment = CommentService.get_comment(comment_id)
-                question_id = comment.answer.question.id
+                question_id = comment.answer.question_id
 
                 CommentService.delete_comment(
                     comment_id=comment_id,
@@ -229,15 +228,15 @@ class CommentDeleteAnswerView(View):
             except PermissionDeniedException:
                 comment = CommentService.get_comment(comment_id)
                 messages.error(request, '댓글삭제권한이 없습니다')
-                return redirect('pybo:detail', question_id=comment.answer.question.id)
+                return redirect('pybo:detail', question_id=comment.answer.question_id)
         except ResourceNotFoundException:
             comment = get_object_or_404(Comment, pk=comment_id)
             if request.user != comment.author:
                 messages.error(request, '댓글삭제권한이 없습니다')
-                return redirect('pybo:detail', question_id=comment.answer.question.id)
+                return redirect('pybo:detail', question_id=comment.answer.question_id)
             else:
                 comment.delete()
-                return redirect('pybo:detail', question_id=comment.answer.question.id)
+                return redirect('pybo:detail', question_id=comment.answer.question_id)
 
 
 # For backwards compatibility
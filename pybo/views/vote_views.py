@@ -1,8 +1,13 @@
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
+from django.views.decorators.http import require_POST
 
 from ..models import Question, Answer
+from ..services.question_service import QuestionService
+from ..services.answer_service import AnswerService
+from ..votes import vote_buffer
 
 
 @login_required(login_url='common:login')
@@ -14,7 +19,8 @@ def vote_question(request, question_id):
     if request.user == question.author:
         messages.error(request, '본인이 작성한 글은 추천할수 없습니다')
     else:
-        question.voter.add(request.user)
+        # 서비스 레이어를 통해 추천 (추천 수 카운터 함께 갱신)
+        QuestionService.vote_question(question.id, request.user)
     return redirect('pybo:detail', question_id=question.id)
 
 
@@ -27,5 +33,34 @@ def vote_answer(request, answer_id):
     if request.user == answer.author:
         messages.error(request, '본인이 작성한 글은 추천할수 없습니다')
     else:
-        answer.voter.add(request.user)
-    return redirect('pybo:detail', question_id=answer.question.id)
+        # 서비스 레이어를 통해 추천 (추천 수 카운터 함께 갱신)
+        AnswerService.vote_answer(answer.id, request.user)
+    return redirect('pybo:detail', question_id=answer.question_id)
+
+
+def _vote_json(request, obj):
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': '로그인이 필요합니다'}, status=401)
+    if request.user == obj.author:
+        return JsonResponse({'error': '본인이 작성한 글은 추천할수 없습니다'}, status=400)
+    # write-behind 버퍼에 기록 (DB 반영은 PYBO_VOTE_FLUSH_INTERVAL 이내)
+    count, voted = vote_buffer.vote(obj, request.user)
+    return JsonResponse({'id': obj.id, 'vote_count': count, 'voted': voted})
+
+
+@require_POST
+def vote_question_json(request, question_id):
+    """
+    pybo 질문추천등록 (AJAX, JSON 응답)
+    """
+    question = get_object_or_404(Question, pk=question_id)
+    return _vote_json(request, question)
+
+
+@require_POST
+def vote_answer_json(request, answer_id):
+    """
+    pybo 답글추천등록 (AJAX, JSON 응답)
+    """
+    answer = get_object_or_404(Answer, pk=answer_id)
+    return _vote_json(request, answer)
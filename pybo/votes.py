@@ -0,0 +1,89 @@
+from django.conf import settings
+from django.db import transaction
+
+from common.writebehind import WriteBehindBuffer
+from .cache import bump_list_generation, bump_question_version
+from .models import Question, Answer
+from .services.counter_service import CounterService
+
+
+class VoteBuffer(WriteBehindBuffer):
+    """
+    추천 write-behind 버퍼
+    추천을 메모리에 모았다가 PYBO_VOTE_FLUSH_INTERVAL 초마다 through 테이블 bulk_create 와
+    카운터 재계산으로 한꺼번에 반영한다 (간격, 재시도, 종료 시 반영은 common.writebehind).
+    """
+    name = 'vote'
+
+    @property
+    def interval(self):
+        return getattr(settings, 'PYBO_VOTE_FLUSH_INTERVAL', 1.0)
+
+    def pending_votes(self, model, obj_id):
+        with self._lock:
+            return set(self._pending.get((model, obj_id), ()))
+
+    def vote(self, obj, user):
+        """
+        obj(Question/Answer)에 user 의 추천을 기록하고 (반영될 추천 수, 추천 여부) 반환
+        이미 추천한 경우에는 수를 늘리지 않는다.
+        추천 수는 잠금 안에서 DB 의 vote_count 를 새로 읽어 대기 중인 추천과 더한다. flush 는 잠금 안에서
+        대기열을 비우므로, 이미 vote_count 에 반영된 추천을 대기 중인 추천으로 한 번 더 세지 않는다
+        (반영 중인 배치는 잠시 빠질 수 있다).
+        """
+        model = type(obj)
+        already_voted = obj.voter.filter(pk=user.pk).exists()
+        with self._lock:
+            pending = self._pending.setdefault((model, obj.id), set())
+            if not already_voted:
+                pending.add(user.pk)
+            voted = already_voted or user.pk in pending
+            count = model.objects.filter(pk=obj.id).values_list('vote_count', flat=True).first() or 0
+            count += len(pending)
+
+        self.recorded()
+        return count, voted
+
+    def merge(self, pending, batch):
+        for key, user_ids in batch.items():
+            pending.setdefault(key, set()).update(user_ids)
+
+    def write(self, batch):
+        """
+        모인 추천을 DB 에 반영 (같은 사용자의 중복 추천은 ignore_conflicts 로 무시)
+        """
+        votes = {Question: {}, Answer: {}}
+        for (model, obj_id), user_ids in batch.items():
+            votes[model][obj_id] = user_ids
+
+        with transaction.atomic():
+            question_ids = self._write(Question, 'question_id', votes[Question],
+                                       CounterService.actual_question_counts()['vote_count'])
+            answer_ids = self._write(Answer, 'answer_id', votes[Answer],
+                                     CounterService.actual_answer_counts()['vote_count'])
+            question_ids |= set(
+                Answer.objects.filter(id__in=answer_ids).values_list('question_id', flat=True)
+            )
+
+        for question_id in question_ids:
+            bump_question_version(question_id)
+        if votes[Question]:
+            bump_list_generation()
+
+    @staticmethod
+    def _write(model, field, votes, actual_count):
+        votes = {obj_id: user_ids for obj_id, user_ids in votes.items() if user_ids}
+        if not votes:
+            return set()
+        through = model.voter.through
+        through.objects.bulk_create(
+            [through(**{field: obj_id, 'user_id': user_id})
+             for obj_id, user_ids in votes.items() for user_id in user_ids],
+            ignore_conflicts=True,
+        )
+        # 여러 프로세스가 같은 글에 반영해도 맞도록 증가가 아닌 실제 개수로 재계산
+        model.objects.filter(id__in=votes).update(vote_count=actual_count)
+        return set(votes)
+
+
+vote_buffer = VoteBuffer()
@@ -8,6 +8,13 @@ document.addEventListener('DOMContentLoaded', function() {
     let chatSocket = null;
     let currentRoomId = null;
     let lastUserId = null;
+    // 이전 메시지 페이지 상태 (가장 오래된 메시지 id 가 다음 load_history 커서)
+    let oldestMessageId = null;
+    let hasMoreHistory = false;
+    let loadingHistory = false;
+    const HISTORY_PAGE_SIZE = 30;
+    // 받은 프레임 수를 서버에 알리는 간격 (서버는 알리지 않은 프레임이 CHAT_SEND_WINDOW 를 넘으면 끊는다)
+    const ACK_EVERY = 32;
 
 
     const chatToggle = document.getElementById('chat-toggle');
@@ -16,6 +23,15 @@ document.addEventListener('DOMContentLoaded', function() {
     const chatInput = document.getElementById('chat-input');
     const chatSendBtn = document.getElementById('chat-send');
     const chatPartner = document.getElementById('chat-partner');
+    const chatInputContainer = document.getElementById('chat-input-container');
+    const inboxToggle = document.getElementById('chat-inbox-toggle');
+    const inboxPanel = document.getElementById('chat-inbox');
+    const inboxList = document.getElementById('chat-inbox-list');
+    const inboxMore = document.getElementById('chat-inbox-more');
+    const unreadTotal = document.getElementById('chat-unread-total');
+    let currentPartnerName = null;
+    let inboxCursor = null;
+    let inboxSnapshot = null;  // 첫 페이지를 읽은 시각 (다음 페이지는 이 시각 기준 목록에서 이어 간다)
 
     // 채팅 아이콘 강조 효과 추가 함수
     function highlightChatIcon() {
@@ -97,8 +113,8 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     } else {
         chatDropdown.classList.add('show');
-        // 최신 채팅방 가져오기
-        fetchLatestRoom();
+        // 최신 채팅방 열기 (알림 채널이 알려 준 방, 아직 모르면 /chat/latest/ 조회)
+        openLatestRoom();
     }
 });
 
@@ -171,77 +187,449 @@ document.addEventListener('click', function(e) {
         `;
     }
 
+    // 방별 메시지 캐시 (sessionStorage): 다시 열거나 재접속할 때 ?last_id= 로 밀린 메시지만 받는다
+    const ROOM_CACHE_LIMIT = 100;
+    let roomMessages = [];
+    let reconnectDelay = 1000;
+
+    function roomCacheKey(roomId) {
+        return `chat:room:${roomId}`;
+    }
+
+    function loadRoomCache(roomId) {
+        try {
+            return JSON.parse(sessionStorage.getItem(roomCacheKey(roomId)));
+        } catch (e) {
+            return null;
+        }
+    }
+
+    function saveRoomCache() {
+        if (currentRoomId === null) return;
+        let messages = roomMessages;
+        let hasMore = hasMoreHistory;
+        if (messages.length > ROOM_CACHE_LIMIT) {
+            // 최신 메시지만 보관, 나머지는 load_history 로 다시 받는다
+            messages = messages.slice(-ROOM_CACHE_LIMIT);
+            hasMore = true;
+        }
+        try {
+            sessionStorage.setItem(roomCacheKey(currentRoomId), JSON.stringify({messages: messages, hasMore: hasMore}));
+        } catch (e) {
+            // 저장 공간 부족 등: 캐시 없이 동작
+        }
+    }
+
+    // 마지막으로 저장이 확인된(id 가 있는) 메시지 id
+    function lastMessageId() {
+        for (let i = roomMessages.length - 1; i >= 0; i--) {
+            if (roomMessages[i].id !== null && roomMessages[i].id !== undefined) {
+                return roomMessages[i].id;
+            }
+        }
+        return null;
+    }
+
+    function findByClientId(clientId) {
+        if (!clientId) return null;
+        return roomMessages.find(message => message.client_id === clientId) || null;
+    }
+
+    function newClientId() {
+        if (window.crypto && crypto.randomUUID) {
+            return crypto.randomUUID();
+        }
+        return 'xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx'.replace(/[xy]/g, function(c) {
+            const r = Math.random() * 16 | 0;
+            return (c === 'x' ? r : (r & 0x3 | 0x8)).toString(16);
+        });
+    }
+
+    // 서버가 저장을 마친 메시지에 실제 id 를 채운다 (다음 재접속 last_id, load_history 커서에 사용)
+    function markPersisted(ids) {
+        Object.keys(ids).forEach(clientId => {
+            const message = findByClientId(clientId);
+            if (!message) return;
+            message.id = ids[clientId];
+            const element = chatMessages.querySelector(`[data-client-id="${clientId}"]`);
+            if (element) {
+                element.dataset.id = message.id;
+            }
+        });
+        saveRoomCache();
+    }
+
+    // 열려 있는 방에서 본 마지막 메시지까지 읽음 처리 (메시지가 몰릴 때를 위해 잠시 모아서 보낸다)
+    let lastMarkedRead = null;
+    let markReadTimer = null;
+
+    function scheduleMarkRead() {
+        if (markReadTimer) return;
+        markReadTimer = setTimeout(function() {
+            markReadTimer = null;
+            const lastId = lastMessageId();
+            if (lastId === null || (lastMarkedRead !== null && lastId <= lastMarkedRead)) return;
+            if (!chatDropdown.classList.contains('show')) return;
+            if (!chatSocket || chatSocket.readyState !== WebSocket.OPEN) return;
+            chatSocket.send(JSON.stringify({
+                'command': 'mark_read',
+                'last_id': lastId
+            }));
+            lastMarkedRead = lastId;
+        }, 500);
+    }
+
+    // 대화 목록(받은편지함) 패널
+    function showInbox() {
+        inboxPanel.classList.remove('d-none');
+        chatMessages.classList.add('d-none');
+        chatInputContainer.classList.add('d-none');
+        chatPartner.textContent = '대화 목록';
+        fetchInbox(null);
+    }
+
+    function hideInbox() {
+        inboxPanel.classList.add('d-none');
+        chatMessages.classList.remove('d-none');
+        chatInputContainer.classList.remove('d-none');
+        if (currentPartnerName !== null) {
+            chatPartner.textContent = currentPartnerName;
+        }
+    }
+
+    function fetchInbox(cursor) {
+        const url = cursor
+            ? `/chat/inbox/?cursor=${encodeURIComponent(cursor)}&snapshot=${encodeURIComponent(inboxSnapshot)}`
+            : '/chat/inbox/';
+        fetch(url)
+            .then(response => response.json())
+            .then(data => {
+                if (!cursor) {
+                    inboxList.innerHTML = '';
+                }
+                if (!cursor && data.rooms.length === 0) {
+                    inboxList.innerHTML = '<li class="no-chat-message">아직 대화가 없습니다.</li>';
+                }
+                data.rooms.forEach(room => {
+                    inboxList.appendChild(createInboxItem(room));
+                });
+                inboxCursor = data.next;
+                inboxSnapshot = data.snapshot;
+                inboxMore.classList.toggle('d-none', !data.next);
+            })
+            .catch(error => {
+                console.error('Error fetching inbox:', error);
+            });
+    }
+
+    function setUnreadTotal(total) {
+        [unreadTotal, notifyBadge].forEach(badge => {
+            if (!badge) return;
+            badge.textContent = total > 99 ? '99+' : String(total);
+            badge.classList.toggle('d-none', total === 0);
+        });
+    }
+
+    // 사용자 알림 채널: 최근 대화방, 안 읽은 메시지 수, 열려 있지 않은 방의 새 메시지
+    let latestRoom;  // undefined 이면 아직 모름
+    let notifyDelay = 1000;
+    const notifyBadge = document.getElementById('chat-notify-badge');
+
+    function connectNotifications() {
+        const wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+        const socket = new WebSocket(`${wsProtocol}//${window.location.host}/ws/notifications/`);
+
+        socket.onopen = function() {
+            notifyDelay = 1000;
+        };
+
+        socket.onmessage = function(e) {
+            const data = JSON.parse(e.data);
+
+            if (data.type === 'inbox_state') {
+                latestRoom = data.latest;
+                setUnreadTotal(data.unread_total);
+            } else if (data.type === 'chat_notification') {
+                latestRoom = {room_id: data.room_id, partner: data.sender};
+                const viewing = chatDropdown.classList.contains('show')
+                    && String(currentRoomId) === String(data.room_id)
+                    && inboxPanel.classList.contains('d-none');
+                if (!viewing) {
+                    // 안 읽은 수는 저장 후 서버가 보내는 unread_count 로 갱신한다
+                    highlightChatIcon();
+                    if (!inboxPanel.classList.contains('d-none')) {
+                        fetchInbox(null);
+                    }
+                }
+            } else if (data.type === 'unread_count') {
+                setUnreadTotal(data.total);
+            }
+        };
+
+        socket.onclose = function() {
+            // 끊기면 점점 긴 간격으로 재접속 (그동안 받은 상태는 다시 접속할 때 inbox_state 로 갱신)
+            setTimeout(connectNotifications, notifyDelay);
+            notifyDelay = Math.min(notifyDelay * 2, 30000);
+        };
+    }
+
+    function openLatestRoom() {
+        if (latestRoom === undefined) {
+            fetchLatestRoom();
+        } else if (latestRoom) {
+            connectToChatRoom(latestRoom.room_id, latestRoom.partner);
+        } else {
+            showEmptyChatMessage();
+        }
+    }
+
+    connectNotifications();
+
+    function createInboxItem(room) {
+        const item = document.createElement('li');
+        item.className = 'chat-inbox-item';
+
+        const summary = document.createElement('div');
+        const partner = document.createElement('div');
+        partner.className = 'partner';
+        partner.textContent = room.partner;
+        const preview = document.createElement('div');
+        preview.className = 'preview';
+        preview.textContent = room.last_message ? room.last_message.text : '';
+        summary.appendChild(partner);
+        summary.appendChild(preview);
+        item.appendChild(summary);
+
+        if (room.unread) {
+            const badge = document.createElement('span');
+            badge.className = 'badge badge-pill badge-primary';
+            badge.textContent = 'N';
+            item.appendChild(badge);
+        }
+
+        item.addEventListener('click', function() {
+            connectToChatRoom(room.room_id, room.partner);
+        });
+        return item;
+    }
+
+    inboxToggle.addEventListener('click', function(e) {
+        e.preventDefault();
+        if (inboxPanel.classList.contains('d-none')) {
+            showInbox();
+        } else {
+            hideInbox();
+        }
+    });
+
+    inboxMore.addEventListener('click', function() {
+        if (inboxCursor) {
+            fetchInbox(inboxCursor);
+        }
+    });
+
     // Connect to chat room
     function connectToChatRoom(roomId, partnerName) {
         // Update UI
+        hideInbox();
         chatPartner.textContent = partnerName;
-        chatMessages.innerHTML = '<div class="loading-message">Loading messages...</div>';
-        document.getElementById('chat-input-container').style.display = 'flex';
+        currentPartnerName = partnerName;
+        latestRoom = {room_id: roomId, partner: partnerName};
+        chatInputContainer.style.display = 'flex';
 
         // Store current room ID
         currentRoomId = roomId;
+        lastMarkedRead = null;
+        loadingHistory = false;
+
+        // 캐시된 메시지를 바로 보여주고, 서버에는 그 이후 메시지만 요청
+        const cached = loadRoomCache(roomId);
+        if (cached && cached.messages && cached.messages.length) {
+            displayChatHistory(cached.messages, cached.hasMore);
+        } else {
+            roomMessages = [];
+            oldestMessageId = null;
+            hasMoreHistory = false;
+            chatMessages.innerHTML = '<div class="loading-message">Loading messages...</div>';
+        }
 
         // Close existing socket if any
         if (chatSocket) {
             chatSocket.close();
         }
+        openSocket(roomId);
+    }
 
+    function openSocket(roomId) {
         // Connect to WebSocket
         const wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        const wsUrl = `${wsProtocol}//${window.location.host}/ws/chat/${roomId}/`;
+        const lastId = lastMessageId();
+        const query = lastId !== null ? `?last_id=${lastId}` : '';
+        const wsUrl = `${wsProtocol}//${window.location.host}/ws/chat/${roomId}/${query}`;
 
-        chatSocket = new WebSocket(wsUrl);
+        const socket = new WebSocket(wsUrl);
+        chatSocket = socket;
+        let received = 0;
 
-        chatSocket.onopen = function(e) {
+        socket.onopen = function(e) {
             console.log('WebSocket connection established');
+            reconnectDelay = 1000;
         };
 
-        chatSocket.onmessage = function(e) {
+        socket.onmessage = function(e) {
             const data = JSON.parse(e.data);
+            received += 1;
+            if (received % ACK_EVERY === 0 && socket.readyState === WebSocket.OPEN) {
+                socket.send(JSON.stringify({'command': 'ack', 'received': received}));
+            }
 
             if (data.type === 'chat_history') {
-                // Display chat history
-                displayChatHistory(data.messages);
+                // Display chat history (full_reload 이면 캐시가 너무 오래되어 새로 받은 것)
+                displayChatHistory(data.messages, data.has_more);
+                saveRoomCache();
+                scheduleMarkRead();
+            } else if (data.type === 'chat_delta') {
+                // 재접속: 마지막으로 본 메시지 이후 것만 추가
+                data.messages.forEach(message => {
+                    addChatMessage(message);
+                });
+                scheduleMarkRead();
+            } else if (data.type === 'chat_history_page') {
+                // 위로 스크롤해서 불러온 이전 메시지
+                prependChatHistory(data.messages, data.has_more);
             } else if (data.type === 'chat_message') {
                 // Add new message
                 addChatMessage(data);
+            } else if (data.type === 'chat_persisted') {
+                markPersisted(data.ids);
+                scheduleMarkRead();
+            } else if (data.type === 'error') {
+                // 너무 빨리 보냈거나(rate limited) 너무 긴 메시지는 서버가 버린다
+                console.warn('Chat error:', data.error);
             }
         };
 
-        chatSocket.onclose = function(e) {
+        socket.onclose = function(e) {
             console.log('WebSocket connection closed');
+            if (socket !== chatSocket) return; // 직접 닫았거나 다른 방으로 바뀐 연결
+
+            // 예기치 않게 끊긴 경우: 드롭다운이 열려 있으면 점점 긴 간격으로 재접속
+            chatSocket = null;
+            if (!chatDropdown.classList.contains('show')) return;
+            setTimeout(function() {
+                if (chatSocket === null && currentRoomId === roomId && chatDropdown.classList.contains('show')) {
+                    openSocket(roomId);
+                }
+            }, reconnectDelay);
+            reconnectDelay = Math.min(reconnectDelay * 2, 30000);
         };
 
-        chatSocket.onerror = function(e) {
+        socket.onerror = function(e) {
             console.error('WebSocket error:', e);
-            showErrorMessage();
+            if (roomMessages.length === 0) {
+                showErrorMessage();
+            }
         };
     }
 
     // Display chat history
-    function displayChatHistory(messages) {
+    function displayChatHistory(messages, hasMore) {
         chatMessages.innerHTML = '';
+        roomMessages = messages.slice();
+        hasMoreHistory = Boolean(hasMore);
+        oldestMessageId = messages.length ? messages[0].id : null;
 
         if (messages.length === 0) {
             chatMessages.innerHTML = '<div class="loading-message">아직 대화 내용이 없습니다. 첫 메시지를 보내보세요!\n</div>';
             return;
         }
 
+        const fragment = document.createDocumentFragment();
         messages.forEach(message => {
-            addChatMessage(message);
+            fragment.appendChild(createMessageElement(message));
         });
+        chatMessages.appendChild(fragment);
 
         // Scroll to bottom
         chatMessages.scrollTop = chatMessages.scrollHeight;
     }
 
+    // 위쪽에 이전 메시지 추가 (보고 있던 위치 유지)
+    function prependChatHistory(messages, hasMore) {
+        loadingHistory = false;
+        hasMoreHistory = Boolean(hasMore);
+        if (messages.length === 0) return;
+        oldestMessageId = messages[0].id;
+        roomMessages = messages.concat(roomMessages);
+        saveRoomCache();
+
+        const previousHeight = chatMessages.scrollHeight;
+        const fragment = document.createDocumentFragment();
+        messages.forEach(message => {
+            fragment.appendChild(createMessageElement(message));
+        });
+        chatMessages.insertBefore(fragment, chatMessages.firstChild);
+        chatMessages.scrollTop += chatMessages.scrollHeight - previousHeight;
+    }
+
+    function loadOlderMessages() {
+        if (!hasMoreHistory || loadingHistory || oldestMessageId === null) return;
+        if (!chatSocket || chatSocket.readyState !== WebSocket.OPEN) return;
+        loadingHistory = true;
+        chatSocket.send(JSON.stringify({
+            'command': 'load_history',
+            'before_id': oldestMessageId,
+            'limit': HISTORY_PAGE_SIZE
+        }));
+    }
+
+    // 맨 위 근처까지 스크롤하면 이전 페이지 요청
+    chatMessages.addEventListener('scroll', function() {
+        if (chatMessages.scrollTop < 40) {
+            loadOlderMessages();
+        }
+    });
+
     // Add chat message
     function addChatMessage(message) {
+        // 재접속 직후에는 delta 와 실시간 메시지가 겹칠 수 있다
+        const pending = findByClientId(message.client_id);
+        if (pending) {
+            // 저장 전에 받은 메시지를 delta 로 다시 받은 경우 id 만 채운다
+            if (message.id !== null && message.id !== undefined && pending.id === null) {
+                markPersisted({[message.client_id]: message.id});
+            }
+            return;
+        }
+        const lastId = lastMessageId();
+        if (message.id !== null && message.id !== undefined && lastId !== null && message.id <= lastId) return;
+        roomMessages.push({
+            id: message.id === undefined ? null : message.id,
+            client_id: message.client_id || null,
+            sender: message.sender,
+            text: message.text,
+            sent_at: message.sent_at
+        });
+        saveRoomCache();
+
+        chatMessages.appendChild(createMessageElement(message));
+
+        // Scroll to bottom
+        chatMessages.scrollTop = chatMessages.scrollHeight;
+    }
+
+    function createMessageElement(message) {
         const isSent = message.sender === currentUser;
         const messageClass = isSent ? 'sent' : 'received';
 
         const messageElement = document.createElement('div');
         messageElement.className = `chat-message ${messageClass}`;
+        if (message.id !== null && message.id !== undefined) {
+            messageElement.dataset.id = message.id;
+        }
+        if (message.client_id) {
+            messageElement.dataset.clientId = message.client_id;
+        }
 
         // Format time
         const messageTime = new Date(message.sent_at);
@@ -252,11 +640,7 @@ document.addEventListener('click', function(e) {
             <div class="text">${message.text}</div>
             <div class="time">${formattedTime}</div>
         `;
-
-        chatMessages.appendChild(messageElement);
-
-        // Scroll to bottom
-        chatMessages.scrollTop = chatMessages.scrollHeight;
+        return messageElement;
     }
 
     // Send message
@@ -265,7 +649,8 @@ document.addEventListener('click', function(e) {
 
         if (message && chatSocket && chatSocket.readyState === WebSocket.OPEN) {
             chatSocket.send(JSON.stringify({
-                'message': message
+                'message': message,
+                'client_id': newClientId()
             }));
 
             chatInput.value = '';
@@ -0,0 +1,56 @@
+// Search Suggest JavaScript
+document.addEventListener('DOMContentLoaded', function() {
+    const input = document.getElementById('search-kw');
+    const datalist = document.getElementById('search-suggestions');
+    if (!input || !datalist) return;
+
+    const suggestUrl = input.dataset.suggestUrl;
+    const urlsBySubject = new Map();  // 제안된 제목 → 상세 페이지 URL
+    const responseCache = new Map();  // 같은 접두어는 다시 요청하지 않음
+    let timer = null;
+    let lastQuery = '';
+
+    function render(results) {
+        datalist.innerHTML = '';
+        urlsBySubject.clear();
+        results.forEach(function(item) {
+            const option = document.createElement('option');
+            option.value = item.subject;
+            datalist.appendChild(option);
+            urlsBySubject.set(item.subject, item.url);
+        });
+    }
+
+    function fetchSuggestions(query) {
+        if (responseCache.has(query)) {
+            render(responseCache.get(query));
+            return;
+        }
+        fetch(suggestUrl + '?q=' + encodeURIComponent(query))
+            .then(response => response.json())
+            .then(data => {
+                responseCache.set(query, data.results);
+                // 응답이 늦게 도착한 이전 입력은 무시
+                if (query === lastQuery) render(data.results);
+            })
+            .catch(error => console.error('Error fetching suggestions:', error));
+    }
+
+    input.addEventListener('input', function(event) {
+        // 목록에서 제안을 고르면(직접 타이핑이 아닌 입력) 해당 질문으로 바로 이동
+        const picked = !event.inputType || event.inputType === 'insertReplacementText';
+        if (picked && urlsBySubject.has(input.value)) {
+            window.location.href = urlsBySubject.get(input.value);
+            return;
+        }
+
+        const query = input.value.trim();
+        lastQuery = query;
+        clearTimeout(timer);
+        if (!query) {
+            render([]);
+            return;
+        }
+        timer = setTimeout(() => fetchSuggestions(query), 150);
+    });
+});